@@ -15,15 +15,24 @@
 # this program; if not, write to the Free Software Foundation, Inc., 51
 # Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
+import bisect
+import concurrent.futures
+import functools
 import glob
+import hashlib
+import json
+import mmap
 import os
 import re
 import shlex
 import sys
+import tempfile
+import time
 
 from . import libclang
 from . import log
 from . import members
+from . import profiling
 from . import unique_id
 from . import walktree
 
@@ -153,6 +162,11 @@ class Status:
         self.current_header = {}        # `files[i]` dict for  the current file.
         self.current_file_name = ''     # Full file name (with absolute path).
         self.current_header_name = ''   # File name relative to project root.
+        self.tokens = None              # `TokenIndex` for the current file.
+        self.cursors = {}               # `CachedCursor` objects for the current file, see `CachedCursor`.
+        self.types = {}                 # Types processed for the current file, see `process_type()`.
+        self.visited_cursors = 0        # Number of cursors looked at in the current file,
+        self.kept_cursors = 0           #    and how many of those are in the current file.
 
         self.members = {}               # These dictionaries contain the same dictionaries as in 'data',
         self.headers = {}               #    but indexed by their ID so they're easy to find. It is the
@@ -160,6 +174,10 @@ class Status:
         self.pages = {}                 #
 
         self.member_ids = {}            # A dictionary to translate USR to our ID for a member.
+        self.stored_ids = set()         # IDs of members from a previous run that we haven't found a USR for
+                                        #    yet, see `seed_stored_data()`.
+        self.symbols = None             # A `SymbolTable` for `members`, built once all members are known.
+        self.header_index = None        # A `HeaderIndex` for `headers`, built once all headers are known.
 
         self.anchors = {}               # A dictionary translating header anchors (IDs) to their text.
 
@@ -309,10 +327,25 @@ def get_group_at_line(group_locations, line):
         current_group = item[1]
     return current_group
 
+command_match = re.compile(r'[\\@](\w+)')
+
+@functools.lru_cache(maxsize=65536)
+def find_commands(doc):
+    # Returns the set of names of all commands in `doc`. Each of the functions below that processes
+    # commands uses this to skip its regular expression if the command it looks for is not present,
+    # such that a documentation block is scanned only once, no matter how many commands we look for.
+    # Most documentation blocks have no commands at all, checking for that is much cheaper still.
+    # The same string is typically processed by several functions in turn, hence the cache.
+    if '\\' not in doc and '@' not in doc:
+        return frozenset()
+    return frozenset(command_match.findall(doc))
+
 ingroup_cmd_match = re.compile(r'^ *[\\@]ingroup +(.+?) *$', re.MULTILINE)
 
 def find_ingroup_cmd(doc):
     # Finds `\ingroup <name>`, removes it from the documentation block, and returns `<name>`
+    if 'ingroup' not in find_commands(doc):
+        return '', doc
     m = ingroup_cmd_match.search(doc)
     if m:
         group = m.group(1)
@@ -323,6 +356,7 @@ def find_ingroup_cmd(doc):
 section_cmd_match = re.compile(r'^ *[\\@]((?:sub){,2})section +((?:\w|-)+) +(.*?) *$', re.MULTILINE)
 anchor_cmd_match = re.compile(r'\n* *[\\@]anchor +((?:\w|-)+) *(?:$|\n)')
 newline_cmd_match = re.compile(r'[\\@]n(?: +\n?|\n)')
+section_commands = {'section', 'subsection', 'subsubsection'}
 
 def find_anchor_cmds(doc, status: Status):
     # Finds section headings and explicit anchors, and adds them to a list.
@@ -356,9 +390,13 @@ def find_anchor_cmds(doc, status: Status):
         anchors.append(name)
         return '\n{{: #{} }}\n\n'.format(name)
 
-    doc = newline_cmd_match.sub('  \n', doc)
-    doc = section_cmd_match.sub(section_cmd_replace, doc)
-    doc = anchor_cmd_match.sub(anchor_cmd_replace, doc)
+    commands = find_commands(doc)
+    if 'n' in commands:
+        doc = newline_cmd_match.sub('  \n', doc)
+    if not commands.isdisjoint(section_commands):
+        doc = section_cmd_match.sub(section_cmd_replace, doc)
+    if 'anchor' in commands:
+        doc = anchor_cmd_match.sub(anchor_cmd_replace, doc)
     return doc, sections, anchors
 
 def is_token_char(char):
@@ -387,7 +425,35 @@ def is_operator(name):
 split_function_arg_parts = re.compile(r'(?:\w|:)+|\*|&+|\[]')  # Split qualifiers
 split_function_args = re.compile(r'^((?:\w|:)+)\((.*)\)$')     # Split function from arguments
 
-def parse_function_arguments(arg_list, start_id, members):
+class SymbolTable:
+    # An index into the member tree, so that `find_member()` doesn't need to search through the list of
+    # members of each scope: `children[id][name]` is the list of direct children of member `id` with name
+    # `name`, in the order they appear in `members[id]['members']`. It must be built after all members
+    # have been added to the tree.
+    # It also caches the results of `find_member()`, keyed by the name and the scope the search starts at.
+    # Lookups with function parameters are only cached once `cache_function_lookups` is set, after
+    # `post_process_types()` has fixed the argument types they are compared to.
+    def __init__(self, members):
+        self.cache = {}
+        self.cache_function_lookups = False
+        self.lookups = 0
+        self.hits = 0
+        self.children = {}
+        for id, member in members.items():
+            if 'members' in member:
+                index = {}
+                for child in member['members']:
+                    index.setdefault(child['name'], []).append(child)
+                self.children[id] = index
+
+    def lookup(self, scope, name):
+        # Returns the direct children of `scope` (a member) with name `name`
+        index = self.children.get(scope['id'])
+        if index is None:
+            return []
+        return index.get(name, [])
+
+def parse_function_arguments(arg_list, start_id, members, symbols=None):
     if arg_list == ['']:  # This happens if the function is specified as `funcname()`.
         return []
     arguments = []
@@ -395,7 +461,7 @@ def parse_function_arguments(arg_list, start_id, members):
         parts = split_function_arg_parts.findall(arg)
         if len(parts) > 1 and parts[0] == 'const':
             parts[0], parts[1] = parts[1], parts[0]  # Move the 'const' to after the type
-        id = find_member(parts[0], start_id, members)
+        id = find_member(parts[0], start_id, members, symbols)
         if id:
             parts[0] = walktree.get_fully_qualified_name(id, members)
         arguments.append({
@@ -407,7 +473,7 @@ def parse_function_arguments(arg_list, start_id, members):
 def same_argument(arg1, arg2):
     return arg1['typename'] == arg2['typename'] and arg1['qualifiers'] == arg2['qualifiers']
 
-def find_member_match_names(member, names, function_params):
+def find_member_match_names(member, names, function_params, symbols):
     if len(names) == 1:
         # We've matched the whole name
         if function_params is None:
@@ -423,22 +489,26 @@ def find_member_match_names(member, names, function_params):
             # TODO: We need to distinguish const member functions from the non-const version.
             #       This requires improving the matching for the type...
     elif 'members' in member:
-        return find_member_inner(member['members'], names[1:], function_params)
+        return find_member_inner(member, names[1:], function_params, symbols)
     return ''
 
-def find_member_inner(member_list, names, function_params):
-    for member in member_list:
-        if member['name'] == names[0]:
-            id = find_member_match_names(member, names, function_params)
-            if id:
-                return id
+def find_member_inner(scope, names, function_params, symbols):
+    if symbols:
+        candidates = symbols.lookup(scope, names[0])
+    else:
+        candidates = [member for member in scope['members'] if member['name'] == names[0]]
+    for member in candidates:
+        id = find_member_match_names(member, names, function_params, symbols)
+        if id:
+            return id
     return ''
 
-def find_member(name, start_id, members):
+def find_member(name, start_id, members, symbols=None):
     """
     :param name: Name of the member to be found (string).
     :param start_id: ID of the member in whose context `name` is given (string).
     :param members: The member dictionary, as returned by `create_member_dict`.
+    :param symbols: Optional `SymbolTable` for `members`, makes the search faster, and remembers results.
     :return: ID of the member `name`, or an empty string if no match exists.
 
     Finds a member with name `name`, as a direct child of `start_id`, or as a direct child of the parent
@@ -447,11 +517,28 @@ def find_member(name, start_id, members):
     Returns the `id` of the first match found. If `name` has parenthesis, these are assumed to contain
     function arguments, and will be used to disambiguate in the case of overloaded functions.
     """
-    # TODO: This doesn't work correctly for members injected into a different namespace, for example
-    #       members of inline namespaces, anonymous namespaces, or through a `using` statement.
     name = name.strip()
     if not name:
         return ''
+    if not symbols or start_id not in members:
+        return find_member_uncached(name, start_id, members, symbols)
+    # The search starts at the first member that can have children, which is what we cache on
+    scope = start_id if 'members' in members[start_id] else members[start_id]['parent']
+    if '(' in name and not symbols.cache_function_lookups:
+        # The argument types we need to compare to are not final yet
+        return find_member_uncached(name, scope, members, symbols)
+    symbols.lookups += 1
+    key = (name, scope)
+    if key in symbols.cache:
+        symbols.hits += 1
+        return symbols.cache[key]
+    id = find_member_uncached(name, scope, members, symbols)
+    symbols.cache[key] = id  # Also if `id` is empty, there's no point in searching again
+    return id
+
+def find_member_uncached(name, start_id, members, symbols):
+    # TODO: This doesn't work correctly for members injected into a different namespace, for example
+    #       members of inline namespaces, anonymous namespaces, or through a `using` statement.
     function_params = None
     templated = False
     if name.startswith('typename '):
@@ -502,14 +589,14 @@ def find_member(name, start_id, members):
                 part = ' ' + part
             name = ('operator' + part).strip()
         if args:
-            function_params = parse_function_arguments(args.split(','), start_id, members)
+            function_params = parse_function_arguments(args.split(','), start_id, members, symbols)
     elif '(' in name:
         match = split_function_args.fullmatch(name)
         if not match:
             log.error('Cannot parse "%s" as member name', name)
             return ''
         name = match[1]
-        function_params = parse_function_arguments(match[2].split(','), start_id, members)
+        function_params = parse_function_arguments(match[2].split(','), start_id, members, symbols)
     elif name in type_kind_to_name_map.values():
         # Ignore standard types
         return ''
@@ -522,10 +609,10 @@ def find_member(name, start_id, members):
     while True:
         if 'name' in base and base['name'] == names[0]:
             # prefer 'Name' over 'Name::Name'
-            id = find_member_match_names(base, names, function_params)
+            id = find_member_match_names(base, names, function_params, symbols)
             if id:
                 return id
-        id = find_member_inner(base['members'], names, function_params)
+        id = find_member_inner(base, names, function_params, symbols)
         if id:
             return id
         if 'parent' not in base:
@@ -533,9 +620,45 @@ def find_member(name, start_id, members):
         base = members[base['parent']]
 
 
-def find_file(name, headers):
+class HeaderIndex:
+    # An index into the header files, so that `find_file()` doesn't need to compare the name to each of
+    # the headers: a trie over the path elements of the header names, starting at the file name. Each node
+    # stores the ID of the first header whose name ends at that node (`exact`), and the ID of the header
+    # with fewest path elements whose name continues beyond it (`best`). It must be built after all headers
+    # have been added.
+    def __init__(self, headers):
+        self.root = self.new_node()
+        for header in headers.values():
+            elements = header['name'].split(os.sep)
+            node = self.root
+            for ii in range(len(elements) - 1, -1, -1):
+                node = node['children'].setdefault(elements[ii], self.new_node())
+                if ii > 0:
+                    if not node['best'] or len(elements) < node['best_length']:
+                        node['best'] = header['id']
+                        node['best_length'] = len(elements)
+                elif not node['exact']:
+                    node['exact'] = header['id']
+
+    @staticmethod
+    def new_node():
+        return {'children': {}, 'exact': '', 'best': '', 'best_length': 0}
+
+    def lookup(self, name):
+        # Returns the ID of the header that `find_file()` would find
+        node = self.root
+        for element in reversed(name.split(os.sep)):
+            node = node['children'].get(element)
+            if node is None:
+                return ''
+        return node['exact'] or node['best']
+
+def find_file(name, headers, index=None):
     # Find header file we're referring to. We look for all matches with an arbitrary set of path elements
     # prepended. The one with fewest such prepended path elements is the one we pick.
+    # If `index` is given, it's the `HeaderIndex` for `headers`, which makes the search faster.
+    if index:
+        return index.lookup(name)
     best_match = ''
     match_length = 1e9  # some number larger than any possible number of path elements, basically Infty.
     for header in headers.values():
@@ -551,48 +674,55 @@ def find_file(name, headers):
 
 # --- Post-process documentation to add links ---
 
-def set_type_id_or_empty_string_recursive(typeval, start_id, template_params, members):
+def set_type_id_or_empty_string_recursive(typeval, start_id, template_params, members, symbols=None):
     if typeval['typename'] in template_params:
         typeval['id'] = ''
         return
     if 'function_prototype' in typeval and typeval['function_prototype']:
-        set_type_id_or_empty_string_recursive(typeval['retval'], start_id, template_params, members)
+        set_type_id_or_empty_string_recursive(typeval['retval'], start_id, template_params, members, symbols)
         for arg in typeval['arguments']:
-            set_type_id_or_empty_string_recursive(arg, start_id, template_params, members)
+            set_type_id_or_empty_string_recursive(arg, start_id, template_params, members, symbols)
         typeval['id'] = ''
         return
-    typeval['id'] = find_member(typeval['typename'], start_id, members)
+    typeval['id'] = find_member(typeval['typename'], start_id, members, symbols)
     if typeval['id']:
         typeval['typename'] = walktree.get_fully_qualified_name(typeval['id'], members)  # Clang apparently sometimes doesn't give a fully qualified name?!
 
-def collect_template_params(member, template_params, members):
-    # Recurse through `member` and its ancestors, noting any template parameter names they have
-    if 'templated' in member and member['templated']:
-        for t in member['template_parameters']:
-            if t['type'] == 'type':
-                template_params.add(t['name'])
+def collect_template_params(member, members, cache):
+    # Recurse through `member` and its ancestors, returning the set of template parameter names they have.
+    # `cache` is a dictionary with the sets already computed for other members, indexed by member ID.
+    if member['id'] in cache:
+        return cache[member['id']]
     if 'parent' in member and member['parent']:
-        collect_template_params(members[member['parent']], template_params, members)
+        template_params = collect_template_params(members[member['parent']], members, cache)
+    else:
+        template_params = frozenset()
+    if 'templated' in member and member['templated']:
+        names = {t['name'] for t in member['template_parameters'] if t['type'] == 'type'}
+        if names:
+            template_params = template_params | names
+    cache[member['id']] = template_params
+    return template_params
 
-def post_process_types(members):
+def post_process_types(members, symbols=None):
     # Add 'id' member to 'type' dicts
     log.info("Linking types to members")
+    template_params_cache = {}
     for member in members.values():
-        template_params = set()
-        collect_template_params(member, template_params, members)
+        template_params = collect_template_params(member, members, template_params_cache)
         if 'type' in member and isinstance(member['type'], dict):
-            set_type_id_or_empty_string_recursive(member['type'], member['id'], template_params, members)
+            set_type_id_or_empty_string_recursive(member['type'], member['id'], template_params, members, symbols)
         if 'return_type' in member and member['return_type']:
-            set_type_id_or_empty_string_recursive(member['return_type'], member['id'], template_params, members)
+            set_type_id_or_empty_string_recursive(member['return_type'], member['id'], template_params, members, symbols)
         if 'arguments' in member:
             for arg in member['arguments']:
-                set_type_id_or_empty_string_recursive(arg, member['id'], template_params, members)
+                set_type_id_or_empty_string_recursive(arg, member['id'], template_params, members, symbols)
         if 'template_parameters' in member:
             for arg in member['template_parameters']:
                 if isinstance(arg['default'], dict):
-                    set_type_id_or_empty_string_recursive(arg['default'], member['id'], template_params, members)
+                    set_type_id_or_empty_string_recursive(arg['default'], member['id'], template_params, members, symbols)
                 elif isinstance(arg['type'], dict):
-                    set_type_id_or_empty_string_recursive(arg['type'], member['id'], template_params, members)
+                    set_type_id_or_empty_string_recursive(arg['type'], member['id'], template_params, members, symbols)
 
 def cleanup_qualifiers(member):
     # Replace 'qualifiers' member in 'type' dicts with a string
@@ -610,14 +740,14 @@ def cleanup_qualifiers(member):
             elif isinstance(arg['type'], dict):
                 arg['type']['qualifiers'] = ''.join(arg['type']['qualifiers'])
 
-def post_process_inheritance(members):
+def post_process_inheritance(members, symbols=None):
     # Add links to derived classes in the base classes
     log.info("Adding links to derived classes in the base classes")
     for member in members.values():
         if 'bases' in member:
             for base in member['bases']:
                 name = base['typename']
-                id = find_member(name, member['id'], members)
+                id = find_member(name, member['id'], members, symbols)
                 if id:
                     base['id'] = id
                     base_member = members[id]
@@ -630,17 +760,22 @@ ref_cmd_match = re.compile(r'[\\@]ref +((?:\w|::|%|-)+(?: *\(.*?\))?)(?: +"(.*?)
 ref_cmd_quotes_match = re.compile(r'[\\@]ref +"((?:[^"]|"")+)"(?: +"(.*?)")?')
 see_cmd_match = re.compile(r'^ *[\\@](?:see|sa) +(.+?) *(?:\Z|\n\n)', re.MULTILINE|re.DOTALL)
 see_arg_match = re.compile(r'([^,(]+(?:\(.*?\))?)')  # Split \see command arguments
+link_commands = {'ref', 'see', 'sa'}
 
 def post_process_links(elements, status: Status):
     # Process documentation for `\ref` and `\see` commands
     log.info("Processing the \\ref and \\see commands")
     for elem in elements.values():
+        brief_commands = find_commands(elem['brief']) if 'brief' in elem else frozenset()
+        doc_commands = find_commands(elem['doc']) if 'doc' in elem else frozenset()
+        if 'ref' not in brief_commands and doc_commands.isdisjoint(link_commands):
+            continue
 
         def find_if_member(name, text):
             parent = elem['id']
             if parent not in status.members:
                 parent = ''
-            id = find_member(name, parent, status.members)
+            id = find_member(name, parent, status.members, status.symbols)
             if id and not text:
                 text = walktree.get_fully_qualified_name(id, status.members)
                 if code_formatting:
@@ -680,7 +815,7 @@ def post_process_links(elements, status: Status):
 
         def find_and_format_quotes_name(name, text):
             # For matches of header name, member name, or any ID, when given in quotes
-            id = find_file(name, status.headers)
+            id = find_file(name, status.headers, status.header_index)
             if id:
                 if not text:
                     text = status.headers[id]['name']
@@ -712,23 +847,25 @@ def post_process_links(elements, status: Status):
             output += '\n\n'
             return output
 
-        if 'brief' in elem:  # this one not present in pages
+        if 'ref' in brief_commands:  # 'brief' is not present in pages
             elem['brief'] = ref_cmd_match.sub(ref_cmd_replace, elem['brief'])
             elem['brief'] = ref_cmd_quotes_match.sub(ref_cmd_quotes_replace, elem['brief'])
-        if 'doc' in elem:  # this one is missing if elem is status.members['']
+        if 'ref' in doc_commands:  # 'doc' is missing if elem is status.members['']
             elem['doc'] = ref_cmd_match.sub(ref_cmd_replace, elem['doc'])
             elem['doc'] = ref_cmd_quotes_match.sub(ref_cmd_quotes_replace, elem['doc'])
+        if 'see' in doc_commands or 'sa' in doc_commands:
             elem['doc'] = see_cmd_match.sub(see_cmd_replace, elem['doc'])
 
 relates_cmd_match = re.compile(r'^ *[\\@]relate[sd] +(.+?) *$', re.MULTILINE)
+relates_commands = {'relates', 'related'}
 
-def post_process_relates(members):
+def post_process_relates(members, symbols=None):
     # Process documentation for `\relates` commands (and `\related` synonym)
     log.info("Processing the \\relates command")
     for member in members.values():
 
         def relates_cmd_replace(match):
-            id = find_member(match[1], member['id'], members)
+            id = find_member(match[1], member['id'], members, symbols)
             if id and members[id]['member_type'] in ['class', 'struct', 'union']:
                 if 'related' in members[id]:
                     members[id]['related'].append(member['id'])
@@ -744,7 +881,9 @@ def post_process_relates(members):
             if member['member_type'] in ['function', 'variable', 'macro', 'alias', 'enum']:
                 parent = member['parent']
                 # We only look for the command in documentation to namespace members (not class, struct, union or enum members)
-                if not parent or members[parent]['member_type'] == 'namespace':
+                if (not parent or members[parent]['member_type'] == 'namespace') and \
+                        not (find_commands(member['brief']).isdisjoint(relates_commands) and
+                             find_commands(member['doc']).isdisjoint(relates_commands)):
                     member['brief'] = relates_cmd_match.sub(relates_cmd_replace, member['brief'], count=1)
                     if not member['relates']:
                         member['doc'] = relates_cmd_match.sub(relates_cmd_replace, member['doc'], count=1)
@@ -783,7 +922,8 @@ def post_process_subpages(pages):
             pages[id]['parent'] = page['id']
             return '[{}](#{})'.format(text, id)
 
-        page['doc'] = subpage_cmd_match.sub(subpage_cmd_replace, page['doc'])
+        if 'subpage' in find_commands(page['doc']):
+            page['doc'] = subpage_cmd_match.sub(subpage_cmd_replace, page['doc'])
         pass
 
 
@@ -882,7 +1022,7 @@ def process_file_command(cmd: DocumentationCommand, status: Status):
     if not cmd.args:
         log.error("\\file needs a file name when not in a header file\n   in file %s", cmd.file)
         return
-    id = find_file(cmd.args, status.headers)
+    id = find_file(cmd.args, status.headers, status.header_index)
     if not id:
         log.error("The file '%s' has not been parsed, documentation ignored.\n   in file %s", cmd.args, cmd.file)
         return
@@ -1054,6 +1194,120 @@ def process_grouping_command(cmd, args, doc, loc, status: Status):
     return False
 
 
+# --- Parsing header files --- token index ---
+
+macro_location_bit = 1 << 31  # Set in the encoding of a location in a macro expansion
+
+# Matches comments, and everything that can contain something that looks like a comment but isn't: string
+# and character literals, raw string literals (the `(` opens the raw string, the `)delimiter"` that closes
+# it is searched for separately), and numbers (which can contain a `'` as digit separator). Like the Clang
+# lexer, an unterminated string or character literal ends at the end of the line (e.g. the apostrophe in
+# text within `#if 0`). Header names in `#include <...>` are not special to the lexer libclang uses to
+# tokenize a file, a `//` in there starts a comment for libclang too.
+comment_or_literal_match = re.compile(rb"""
+    (?P<line_comment>//(?:[^\r\n\\]|\\[ \t]*\r?\n|\\)*)
+  | (?P<block_comment>/\*.*?(?:\*/|\Z))
+  | (?<![\w.])(?:u8|[uUL])?R"(?P<raw_delimiter>[^ ()\\\t\v\f\r\n]{0,16})\(
+  | "(?:[^"\\\r\n]|\\.)*"?
+  | '(?:[^'\\\r\n]|\\.)*'?
+  | (?<![\w.])\.?[0-9](?:[\w.]|'(?=\w)|(?<=[eEpP])[+-])*
+""", re.VERBOSE | re.DOTALL)
+
+whitespace_match = re.compile(rb'(?:\s|\\\r?\n)*')  # Whitespace, including line continuations
+
+mmap_file_size = 1 << 20  # Files at least this large are mapped into memory rather than read
+
+def find_comments(contents):
+    # Returns a list with the start and end offset of each comment in `contents` (bytes or mmap), the same
+    # comments that libclang would find when tokenizing the file, but without going through all tokens.
+    comments = []
+    pos = 0
+    while True:
+        match = comment_or_literal_match.search(contents, pos)
+        if not match:
+            return comments
+        pos = match.end()
+        if match.lastgroup == 'line_comment' or match.lastgroup == 'block_comment':
+            comments.append((match.start(), pos))
+        elif match.lastgroup == 'raw_delimiter':
+            end = contents.find(b')' + match['raw_delimiter'] + b'"', pos)
+            if end < 0:
+                return comments
+            pos = end + len(match['raw_delimiter']) + 2
+
+class TokenIndex:
+    # Holds all the tokens in one file of a translation unit, such that we don't need to ask libclang to
+    # tokenize the extent of each cursor we look at. `offsets[i]` and `spellings[i]` are the offset in the
+    # file where token `i` starts, and its spelling.
+    # Each call through ctypes is expensive, so we get the whole token array with a single call, and read
+    # the location and length of each token directly from the token structures. The spellings come
+    # from the file contents. The location is encoded as the offset within the file plus the offset where
+    # the file starts, which we find from the first token.
+    # `comments` is the list of (start, end, spelling, adjacent) for each comment in the file, which we find
+    # by scanning the file contents ourselves. `adjacent` is True if there are no tokens between the
+    # previous comment and this one.
+    def __init__(self, tu, filename):
+        with open(filename, 'rb') as f:
+            if os.fstat(f.fileno()).st_size >= mmap_file_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as contents:
+                    self.index_file(tu, filename, contents)
+            else:
+                self.index_file(tu, filename, f.read())
+
+    def index_file(self, tu, filename, contents):
+        self.filename = filename
+        self.size = len(contents)
+        self.line_starts = [0] + [m.end() for m in re.finditer(b'\n', contents)]
+        self.offsets = []
+        self.spellings = []
+        self.comments = []
+        previous_end = None
+        for start, end in find_comments(contents):
+            adjacent = previous_end is not None and whitespace_match.fullmatch(contents, previous_end, start) is not None
+            self.comments.append((start, end, contents[start:end].decode('utf-8'), adjacent))
+            previous_end = end
+        self.base = None
+        tokens = list(tu.get_tokens(extent=tu.get_extent(filename, (0, self.size))))
+        if not tokens:
+            return
+        self.base = tokens[0].int_data[1] - tokens[0].location.offset
+        for t in tokens:
+            offset = t.int_data[1] - self.base
+            self.offsets.append(offset)
+            self.spellings.append(contents[offset:offset + t.int_data[2]].decode('utf-8'))
+        if self.offsets[-1] != tokens[-1].location.offset or self.spellings[-1] != tokens[-1].spelling:
+            # This libclang doesn't encode things the way we expect, go the slow way
+            log.debug("Token locations cannot be decoded, using libclang to obtain them")
+            self.base = None
+            self.offsets = [t.location.offset for t in tokens]
+            self.spellings = [t.spelling for t in tokens]
+
+    def get_spellings(self, item):
+        # Returns the same as `[t.spelling for t in item.get_tokens()]`
+        if self.base is not None:
+            extent = item.extent
+            begin = extent.begin_int_data - self.base
+            end = extent.end_int_data - self.base
+            if 0 <= begin <= end <= self.size:
+                return self.spellings[bisect.bisect_left(self.offsets, begin):bisect.bisect_left(self.offsets, end)]
+        # The cursor is in a macro expansion, or in a different file
+        return [t.spelling for t in item.get_tokens()]
+
+    def is_in_file(self, location):
+        # Returns the same as `str(location.file) == filename`, but without calling into libclang
+        # if `location` is in a file (i.e. not in a macro expansion).
+        if self.base is not None:
+            if 0 <= location.int_data - self.base <= self.size:
+                return True
+            if not location.int_data & macro_location_bit:
+                return False
+        return str(location.file) == self.filename
+
+    def get_line_and_column(self, offset):
+        line = bisect.bisect_right(self.line_starts, offset)
+        return line, offset - self.line_starts[line - 1] + 1
+
+
 # --- Parsing header files --- extracting and processing comments ---
 
 def process_comment_command(lines, loc, status: Status):
@@ -1095,49 +1349,42 @@ def process_comment_command(lines, loc, status: Status):
     status.unprocessed_commands.append(DocumentationCommand(cmd, args, doc, status.current_group[-1],
                                                             status.current_header_name, status.current_header['id']))
 
-def process_comments(tu, status: Status):
+def process_comments(tokens: TokenIndex, status: Status):
     # Gets the comments out of the file, figures out what entity they belong to,
     # and builds an appropriate data structure in status.data
-    filename = status.current_file_name
-    it = tu.get_tokens(extent=tu.get_extent(filename, (0, int(os.stat(filename).st_size))))
-    #for token in it:
-    #    print(token.kind, token.spelling)
-    token = next(it, None)
-    while token:
-        # Find the next comment
-        while token.kind != cindex.TokenKind.COMMENT:
-            token = next(it, None)
-            if not token:
-                return
-
-        comment = token.spelling.lstrip()
+    comments = tokens.comments
+    n_comments = len(comments)
+    ii = 0
+    while ii < n_comments:
+        comment = comments[ii][2]
         if is_single_line_comment(comment):
             # Concatenate individual single-line comments together, but only if they are strictly
-            # adjacent, and all are documentation comments
+            # adjacent (no code in between), and all are documentation comments
             if is_documentation_comment(comment, '/'):
-                loc = token.extent.start.line
+                loc, _ = tokens.get_line_and_column(comments[ii][0])
                 lines = [clean_comment(comment)]
-                pos = token.extent.end.line
-                token = next(it, None)
-                while token and token.kind == cindex.TokenKind.COMMENT:
-                    comment = token.spelling.lstrip()
+                pos, _ = tokens.get_line_and_column(comments[ii][1])
+                ii += 1
+                while ii < n_comments and comments[ii][3]:
+                    comment = comments[ii][2]
+                    start, _ = tokens.get_line_and_column(comments[ii][0])
                     if not is_single_line_comment(comment) or \
                        not is_documentation_comment(comment, '/') or \
-                       pos + 1 < token.extent.start.line:
+                       pos + 1 < start:
                         break
                     lines.append(clean_comment(comment))
-                    pos = token.extent.end.line
-                    token = next(it, None)
+                    pos, _ = tokens.get_line_and_column(comments[ii][1])
+                    ii += 1
                 process_comment_command(lines, loc, status)
-                continue  # token currently is the next token, it hasn't been processed yet, we don't want to skip it
+                continue  # comment `ii` hasn't been processed yet, we don't want to skip it
         else:
             # Multi-line comments are not concatenated with anything
             if is_documentation_comment(comment, '*'):
-                prelen = token.extent.start.column - 1
-                lines = clean_multiline_comment(comment, prelen)
-                process_comment_command(lines, token.extent.start.line, status)
+                loc, column = tokens.get_line_and_column(comments[ii][0])
+                lines = clean_multiline_comment(comment, column - 1)
+                process_comment_command(lines, loc, status)
 
-        token = next(it, None)
+        ii += 1
 
     while status.current_group[-1]:
         log.warning("Missing \\endgroup for group %s\n   in file %s",
@@ -1203,6 +1450,59 @@ def extract_markdown(filename, status: Status):
 
 # --- Parsing header files --- extracting declarations ---
 
+def cursor_key(cursor):
+    # Two cursors for the same declaration have the same kind and the same first data pointer (this is
+    # what `clang_equalCursors()` compares for declarations), so we can match them without calling into
+    # libclang. Other cursors could be matched wrongly, but these are never looked up.
+    return cursor._kind_id, cursor.data[0]
+
+not_computed = object()
+
+class CachedCursor:
+    # A thin wrapper around a `cindex.Cursor`, that calls into libclang at most once for the properties we
+    # query repeatedly. cindex caches most properties on the cursor object, but not the USR, and
+    # `semantic_parent` is a new cursor object each time we look at a new child, whose properties are
+    # again not known. Here the semantic parent is looked up in `cursors`, which holds the `CachedCursor`
+    # objects created so far for the current translation unit; nearly always the parent was visited
+    # earlier. This way, the chain of semantic parents, and their USRs, is computed only once.
+    # All other attributes are those of the wrapped cursor.
+    __slots__ = ('cursor', 'cursors', '_usr', '_semantic_parent')
+
+    def __init__(self, cursor, cursors):
+        self.cursor = cursor
+        self.cursors = cursors
+        self._usr = None
+        self._semantic_parent = not_computed
+        cursors.setdefault(cursor_key(cursor), self)
+
+    def __getattr__(self, name):
+        return getattr(self.cursor, name)
+
+    def get_usr(self):
+        if self._usr is None:
+            self._usr = self.cursor.get_usr()
+        return self._usr
+
+    @property
+    def semantic_parent(self):
+        if self._semantic_parent is not_computed:
+            parent = self.cursor.semantic_parent
+            if parent is not None:
+                parent = self.cursors.get(cursor_key(parent)) or CachedCursor(parent, self.cursors)
+            self._semantic_parent = parent
+        return self._semantic_parent
+
+    def get_children(self):
+        # The same as `cindex.Cursor.get_children()`, but without comparing each child to the null cursor,
+        # which costs two calls into libclang per child (libclang never gives us a null cursor here).
+        def visitor(child, parent, children):
+            child._tu = self.cursor._tu  # Keeps the translation unit alive
+            children.append(child)
+            return 1  # CXChildVisit_Continue
+        children = []
+        cindex.conf.lib.clang_visitChildren(self.cursor, cindex.callbacks['cursor_visit'](visitor), children)
+        return iter(children)
+
 def full_typename(decl):
     typeval = decl.displayname
     parent = decl.semantic_parent
@@ -1217,18 +1517,19 @@ def full_typename(decl):
 
 fixup_angled_brackets_match = re.compile(r"> >")
 
-def process_type_recursive(typeval, cursor, output):
+def process_type_recursive(typeval, cursor, output, cache, spelling=None):
+    # `spelling` is `typeval.spelling`, if the caller already has it
     kind = typeval.kind
     done = False
     # Reference/pointer qualifiers
     if kind in type_kind_to_type_map:
-        process_type_recursive(typeval.get_pointee(), cursor, output)
+        process_type_recursive(typeval.get_pointee(), cursor, output, cache)
         if not('function_prototype' in output and output['function_prototype']):
             output['qualifiers'].append(type_kind_to_type_map[kind])
         done = True
     # Is it an array?
     if kind in type_kind_array_types:
-        process_type_recursive(typeval.get_array_element_type(), None, output)
+        process_type_recursive(typeval.get_array_element_type(), None, output, cache)
         output['qualifiers'].append('[]')
         done = True
     # Const qualifier
@@ -1242,100 +1543,125 @@ def process_type_recursive(typeval, cursor, output):
     elif kind == cindex.TypeKind.FUNCTIONPROTO:
         # Parse function prototype
         output['function_prototype'] = True
-        output['retval'] = process_type(typeval.get_result(), None)
-        output['arguments'] = [process_type(arg) for arg in typeval.argument_types()]
+        output['retval'] = process_type(typeval.get_result(), None, cache)
+        output['arguments'] = [process_type(arg, None, cache) for arg in typeval.argument_types()]
         # output['typename'] = typeval.spelling
         output['typename'] = output['retval']['typename'] + '(*)(' + \
                              ', '.join([arg['typename'] for arg in output['arguments']]) + ')'
-    elif hasattr(typeval, 'spelling'):
-        typename = typeval.spelling
-        if typename.startswith('const '):
-            typename = typename[len('const '):]
-        typename = fixup_angled_brackets_match.sub('>>', typename)
-        output['typename'] = typename
-    elif cursor:
-        output['typename'] = cursor.displayname
     else:
-        output['typename'] = ''
+        if spelling is None:
+            spelling = getattr(typeval, 'spelling', None)  # Each access is a call into libclang
+        if spelling is not None:
+            typename = spelling
+            if typename.startswith('const '):
+                typename = typename[len('const '):]
+            typename = fixup_angled_brackets_match.sub('>>', typename)
+            output['typename'] = typename
+        elif cursor:
+            output['typename'] = cursor.displayname
+        else:
+            output['typename'] = ''
     # TODO: For template types, we might want to split up the type and the template arguments (recursively!)
     #       so that we can later link the type to its docs.
 
-def process_type(typeval, cursor=None):
-    output = {'typename': '', 'qualifiers': []}
-    process_type_recursive(typeval, cursor, output)
+def copy_type(typeval):
+    # Copies the output of `process_type()`, such that the copy can be modified in place
+    output = typeval.copy()
+    output['qualifiers'] = list(typeval['qualifiers'])
+    if 'retval' in typeval:
+        output['retval'] = copy_type(typeval['retval'])
+        output['arguments'] = [copy_type(arg) for arg in typeval['arguments']]
     return output
 
-def find_default_value(item):
-    tokens = [x.spelling for x in item.get_tokens()]
-    for ii in range(len(tokens) - 1):
-        if tokens[ii] == '=':
-            return ''.join(tokens[ii + 1:])
+def process_type(typeval, cursor=None, cache=None):
+    # `cache` is a dictionary with the types already processed for this translation unit. The same few
+    # types are used over and over again, and processing them takes many calls into libclang. The output
+    # is built from the type's spelling (the cursor is used only for types without one), so two types
+    # with the same kind and spelling give the same output. The caller gets a copy, which it can modify.
+    if cache is None or typeval.kind in type_kind_to_name_map:
+        # Built-in types are cheap, it's not worth getting their spelling to look them up
+        output = {'typename': '', 'qualifiers': []}
+        process_type_recursive(typeval, cursor, output, cache)
+        return output
+    key = (typeval.kind, typeval.spelling)
+    output = cache.get(key)
+    if output is None:
+        output = {'typename': '', 'qualifiers': []}
+        process_type_recursive(typeval, cursor, output, cache, key[1])
+        cache[key] = output
+    return copy_type(output)
+
+def find_default_value(item, tokens: TokenIndex):
+    spellings = tokens.get_spellings(item)
+    for ii in range(len(spellings) - 1):
+        if spellings[ii] == '=':
+            return ''.join(spellings[ii + 1:])
     return None
 
-def is_constexpr(item):
+def is_constexpr(item, tokens: TokenIndex):
     name = item.spelling
-    for t in item.get_tokens():
-        if t.spelling == 'constexpr':
+    for t in tokens.get_spellings(item):
+        if t == 'constexpr':
             return True
-        if t.spelling == name:
+        if t == name:
             return False
     return False
 
-def is_inline(item):
+def is_inline(item, tokens: TokenIndex):
     name = item.spelling
-    for t in item.get_tokens():
-        if t.spelling == 'inline':
+    for t in tokens.get_spellings(item):
+        if t == 'inline':
             return True
-        if t.spelling == name:
+        if t == name:
             return False
     return False
 
-def is_explicit(item):
+def is_explicit(item, tokens: TokenIndex):
     name = item.spelling
-    for t in item.get_tokens():
-        if t.spelling == 'explicit':
+    for t in tokens.get_spellings(item):
+        if t == 'explicit':
             return True
-        if t.spelling == name:
+        if t == name:
             return False
     return False
 
-def item_is_template(item):
+def item_is_template(item, tokens: TokenIndex):
     # For class/struct template specializations, item.get_num_template_arguments() returns -1, which
     # it shouldn't. Let's look at the first token to see if it's "template".
     if item.get_num_template_arguments() >= 0:
         return True
-    for t in item.get_tokens():
-        return t.spelling == 'template'
+    for t in tokens.get_spellings(item):
+        return t == 'template'
     return False
 
-def get_defaulted_or_deleted(item):
+def get_defaulted_or_deleted(item, tokens: TokenIndex):
     # `item` is a declaration for a constructor, destructor or assignment operator.
     # We look for the first '(' character, then for the matching ')' character. If the next
     # character is '=', it will be followed by either 'default' or 'delete' (or '0').
     # TODO: Is this logic always correct?
     # TODO: In C++20, comparison operators can be default as well.
-    i = item.get_tokens()
+    i = iter(tokens.get_spellings(item))
     try:
         t = next(i)
-        while t.spelling != '(':
+        while t != '(':
             t = next(i)
         count = 1
         t = next(i)
         while True:
-            if t.spelling == '(':
+            if t == '(':
                 count += 1
-            elif t.spelling == ')':
+            elif t == ')':
                 count -= 1
             t = next(i)
             if count == 0:
                 break
-        if t.spelling == '=':
-            return next(i).spelling
+        if t == '=':
+            return next(i)
     except StopIteration:
         pass
     return ''
 
-def process_template_type_parameter(item):
+def process_template_type_parameter(item, types=None):
     name = item.spelling
     if not name:
         # This happens for SFINAE template parameters
@@ -1346,7 +1672,7 @@ def process_template_type_parameter(item):
     default = None
     for child in item.get_children():
         if child.kind == cindex.CursorKind.TYPE_REF:
-            default = process_type(child.type, child)
+            default = process_type(child.type, child, types)
             break
     return {
         'name': name,
@@ -1354,7 +1680,7 @@ def process_template_type_parameter(item):
         'default': default
     }
 
-def process_template_nontype_parameter(item):
+def process_template_nontype_parameter(item, tokens: TokenIndex, types=None):
     name = item.spelling
     if not name:
         # This happens for SFINAE template parameters
@@ -1364,34 +1690,34 @@ def process_template_nontype_parameter(item):
         # TODO: To get a proper representation of this template parameter we'd need to
         #       process the tokens manually.
     else:
-        typeval = process_type(item.type, item)
-    default = find_default_value(item)
+        typeval = process_type(item.type, item, types)
+    default = find_default_value(item, tokens)
     return {
         'name': name,
         'type': typeval,
         'default': default
     }
 
-def process_function_declaration(item, member):
-    member['constexpr'] = is_constexpr(item)
+def process_function_declaration(item, member, tokens: TokenIndex, types=None):
+    member['constexpr'] = is_constexpr(item, tokens)
     member['noexcept'] = item.exception_specification_kind in [cindex.ExceptionSpecificationKind.BASIC_NOEXCEPT, cindex.ExceptionSpecificationKind.COMPUTED_NOEXCEPT]
-    member['return_type'] = process_type(item.type.get_result())
+    member['return_type'] = process_type(item.type.get_result(), None, types)
     arguments = []
     template_parameters = []
     for child in item.get_children():
         if child.kind == cindex.CursorKind.PARM_DECL:
-            param = process_type(child.type)
+            param = process_type(child.type, None, types)
             param['name'] = child.spelling
-            param['default'] = find_default_value(child)
+            param['default'] = find_default_value(child, tokens)
             arguments.append(param)
         elif child.kind == cindex.CursorKind.CXX_FINAL_ATTR:
             member['final'] = True
         elif child.kind == cindex.CursorKind.CXX_OVERRIDE_ATTR:
             member['override'] = True
         elif child.kind == cindex.CursorKind.TEMPLATE_NON_TYPE_PARAMETER:
-            template_parameters.append(process_template_nontype_parameter(child))
+            template_parameters.append(process_template_nontype_parameter(child, tokens, types))
         elif child.kind == cindex.CursorKind.TEMPLATE_TYPE_PARAMETER:
-            template_parameters.append(process_template_type_parameter(child))
+            template_parameters.append(process_template_type_parameter(child, types))
     member['arguments'] = arguments
     if member['templated']:
         member['template_parameters'] = template_parameters
@@ -1424,17 +1750,22 @@ def merge_member(member, new_member):
     # Because a class can have a forward declaration in a different file, and that file could
     # have been processed earlier, if the existing structure has no 'brief', we replace everything.
     # This assumes that it is the actual declaration that is documented, not the forward declaration.
+    # Child members are compared by ID; `new_member` usually has no children yet, as these are added
+    # after the merge, so we only collect the IDs of the existing children if there is anything to merge.
     replace = new_member['brief'] and not member['brief']
     for key in new_member:
         if key == 'members':
-            for m in new_member['members']:
-                if m not in member['members']:
-                    member['members'].append(m)
+            if new_member['members']:
+                ids = {m['id'] for m in member['members']}
+                for m in new_member['members']:
+                    if m['id'] not in ids:
+                        member['members'].append(m)
+                        ids.add(m['id'])
             continue
         if replace or (key not in member or not member[key]):
             member[key] = new_member[key]
 
-def add_undocumented_member(item: cindex.Cursor, status: Status):
+def add_undocumented_member(item: CachedCursor, status: Status):
     # Adds members to status.data (and status.members) without much information, to be filled in
     # at a later time, for the purpose of documenting its members now. This is called when documenting
     # the child of a member that has been declared in an #included header file, and that header file
@@ -1458,6 +1789,9 @@ def add_undocumented_member(item: cindex.Cursor, status: Status):
         id = unique_id.member(member, status)  # TODO: This goes wrong with templated types, we haven't figured out the template params, and the ID will be wrong here
         member['id'] = id
         status.member_ids[item.get_usr()] = id
+        if id in status.stored_ids:
+            status.stored_ids.discard(id)
+            return id
         if id in status.members:
             log.error("USR for member %s was unknown, but ID %s was already there! This means that " +
                       "there is a name clash, unique_id.member is not good enough.\n   in file %s",
@@ -1473,24 +1807,30 @@ def add_undocumented_member(item: cindex.Cursor, status: Status):
         log.error("This is unexpected!")
         return ''
 
-def extract_declarations(citer, parent, status: Status, level = 0):
-    # Recursive AST exploration, adds data to `status`.
+def extract_declarations(citer, parent, status: Status):
+    # AST exploration, adds data to `status`.
+    # Rather than recursing into the children of a cursor, we push an iterator over them, together with
+    # their parent, onto a stack. The cursors are visited in the same order, but deeply nested
+    # declarations don't hit Python's recursion limit.
     if not citer:
         return
-    while True:
+    stack = [(citer, parent)]
+    while stack:
+        citer, parent = stack[-1]
         try:
-            item = next(citer)
+            item = CachedCursor(next(citer), status.cursors)
         except StopIteration:
-            return
-
-        # Check the source of item
-        if not item.location.file:
-            extract_declarations(item.get_children(), '', status, level)
+            stack.pop()
             continue
 
-        # Ignore files other than the ones we are scanning for
-        if str(item.location.file) != status.current_file_name:
+        # Check the source of item
+        status.visited_cursors += 1
+        if not status.tokens.is_in_file(item.location):
+            if not item.location.file:
+                stack.append((item.get_children(), ''))
+            # Ignore files other than the ones we are scanning for
             continue
+        status.kept_cursors += 1
 
         # This section can be uncommented to display the full AST, useful for learning about it.
         # semantic_parent = item.semantic_parent
@@ -1498,16 +1838,17 @@ def extract_declarations(citer, parent, status: Status, level = 0):
         #     semantic_parent = semantic_parent.displayname
         # else:
         #     semantic_parent = 'None'
+        # level = len(stack) - 1
         # print('  ' * level, "- member: kind = %s, displayname = %s, spelling = %s, parent = %s, semantic_parent = %s" % (
         #       item.kind, item.displayname, item.spelling, parent, semantic_parent))
         # print('  ' * level, "          tokens =", [x.spelling for x in item.get_tokens()])
         # print('  ' * level, "          comment =", item.raw_comment)
-        # extract_declarations(item.get_children(), item.displayname, status, level + 1)
+        # stack.append((item.get_children(), item.displayname))
         # continue
 
         # Ignore unexposed things
         if item.kind == cindex.CursorKind.UNEXPOSED_DECL:
-            extract_declarations(item.get_children(), parent, status)
+            stack.append((item.get_children(), parent))
             continue
 
         if item.kind == cindex.CursorKind.CXX_FINAL_ATTR:
@@ -1578,7 +1919,7 @@ def extract_declarations(citer, parent, status: Status, level = 0):
                 if not semantic_parent:
                     log.error("Base class specifier has no semantic parent!?")
                     continue
-                typeval = process_type(item.type, item)['typename']
+                typeval = process_type(item.type, item, status.types)['typename']
                 access = access_specifier_map[item.access_specifier]
                 status.members[semantic_parent]['bases'].append({
                     'typename': typeval,
@@ -1591,22 +1932,24 @@ def extract_declarations(citer, parent, status: Status, level = 0):
                 if not semantic_parent:
                     log.error("Template parameter %s doesn't have a parent.\n   in file %s",
                               name, status.current_header_name)
-                    return
+                    stack.pop()  # Skip the remaining siblings
+                    continue
                 if 'template_parameters' not in status.members[semantic_parent]:
                     log.error("Template parameter %s has a parent that is not a template.\n   in file %s",
                               name, status.current_header_name)
-                    return
+                    stack.pop()  # Skip the remaining siblings
+                    continue
                 if member_type == 'templatetypeparameter':
-                    param = process_template_type_parameter(item)
+                    param = process_template_type_parameter(item, status.types)
                 else:
-                    param = process_template_nontype_parameter(item)
+                    param = process_template_nontype_parameter(item, status.tokens, status.types)
                 status.members[semantic_parent]['template_parameters'].append(param)
                 continue
 
             # Process actual using element of templated using directive differently
             # We've already created the alias member, we are just missing the type
             if member_type == 'using' and parent and status.members[parent]['member_type'] == 'alias':
-                typeval = process_type(item.underlying_typedef_type, item)
+                typeval = process_type(item.underlying_typedef_type, item, status.types)
                 typeval['qualifiers'] = ''.join(typeval['qualifiers'])
                 status.members[parent]['type'] = typeval
                 continue
@@ -1624,26 +1967,26 @@ def extract_declarations(citer, parent, status: Status, level = 0):
                 is_template = True
                 member_type = 'class'
                 # Could be 'struct' or 'union' also
-                tokens = list(item.get_tokens())
+                # ('<', '>', 'struct' and 'union' can only be punctuation or keyword tokens)
+                tokens = status.tokens.get_spellings(item)
                 n = 0
                 for i in range(len(tokens)):
-                    if tokens[i].kind == cindex.TokenKind.PUNCTUATION and tokens[i].spelling == '<':
+                    if tokens[i] == '<':
                         n += 1
-                    if tokens[i].kind == cindex.TokenKind.PUNCTUATION and tokens[i].spelling == '>':
+                    if tokens[i] == '>':
                         n -= 1
                         if n == 0:
                             i += 1
                             if i < len(tokens):
-                                if tokens[i].kind == cindex.TokenKind.KEYWORD:
-                                    if tokens[i].spelling == 'struct':
-                                        member_type = 'struct'
-                                    elif tokens[i].spelling == 'union':
-                                        member_type = 'union'
+                                if tokens[i] == 'struct':
+                                    member_type = 'struct'
+                                elif tokens[i] == 'union':
+                                    member_type = 'union'
                             break
             elif member_type == 'usingtemplate':
                 is_template = True
                 member_type = 'using'
-            elif item_is_template(item):
+            elif item_is_template(item, status.tokens):
                 log.debug('Skipping template specialization: %s %s', member_type, item.displayname)
                 continue
 
@@ -1674,15 +2017,15 @@ def extract_declarations(citer, parent, status: Status, level = 0):
             # Fix conversion operator names
             # Clang gives the name to the base type, not to the name of an alias as it might appear in the source code
             if name.startswith('operator '):
-                i = item.get_tokens()
+                i = iter(status.tokens.get_spellings(item))
                 try:
                     t = next(i)
-                    while t.spelling != 'operator':
+                    while t != 'operator':
                         t = next(i)
                     t = next(i)
                     typeval = ''
-                    while t.spelling != '(':
-                        p = t.spelling
+                    while t != '(':
+                        p = t
                         if ends_with_token_char(typeval) and starts_with_token_char(p):
                             p = ' ' + p
                         typeval += p
@@ -1691,7 +2034,7 @@ def extract_declarations(citer, parent, status: Status, level = 0):
                 except StopIteration:
                     log.error("Couldn't find conversion operator type for %s\n   in file %s",
                               name, status.current_header_name)
-                    log.debug("token spelling: %s", ", ".join([x.spelling for x in item.get_tokens()]))
+                    log.debug("token spelling: %s", ", ".join(status.tokens.get_spellings(item)))
                     pass
 
             # Find the group this member belongs to
@@ -1748,7 +2091,7 @@ def extract_declarations(citer, parent, status: Status, level = 0):
                     # is_default_constructor
                     # is_move_constructor
                 if member_type in ['conversionfunction', 'constructor']:
-                    member['explicit'] = is_explicit(item)
+                    member['explicit'] = is_explicit(item, status.tokens)
                 member['operator'] = is_operator(member['name'])
                 if member['operator']:
                     if member['name'] == 'operator=':
@@ -1756,7 +2099,7 @@ def extract_declarations(citer, parent, status: Status, level = 0):
                     else:
                         member_type = 'operator'
                 if member_type in ['assignmentoperator', 'constructor', 'destructor']:
-                    v = get_defaulted_or_deleted(item)
+                    v = get_defaulted_or_deleted(item, status.tokens)
                     member['defaulted'] = v == 'default'
                     member['deleted'] = v == 'delete'
                     if member['defaulted'] != item.is_default_method():
@@ -1765,7 +2108,7 @@ def extract_declarations(citer, parent, status: Status, level = 0):
                                   status.members[semantic_parent]['name'], member['name'],
                                   '' if member['defaulted'] else 'not ', status.current_header_name)
                 member['method_type'] = member_type
-                process_function_declaration(item, member)
+                process_function_declaration(item, member, status.tokens, status.types)
                 if member_type in ['conversionfunction', 'constructor', 'destructor']:
                     member['return_type'] = {}
                 member_type = 'function'  # write out as function
@@ -1776,19 +2119,19 @@ def extract_declarations(citer, parent, status: Status, level = 0):
                 member['scoped'] = item.is_scoped_enum()
                 if not parent_is_namespace:
                     member['access'] = access_specifier_map[item.access_specifier]
-                typeval = process_type(item.enum_type)['typename']
+                typeval = process_type(item.enum_type, None, status.types)['typename']
                 member['type'] = typeval
                 member['members'] = []
                 process_children = True
             elif member_type == 'field':
-                member['type'] = process_type(item.type, item)
+                member['type'] = process_type(item.type, item, status.types)
                 member['static'] = item.storage_class == cindex.StorageClass.STATIC
                 member['mutable'] = item.is_mutable_field()
                 member['access'] = access_specifier_map[item.access_specifier]
-                member['constexpr'] = is_constexpr(item)
+                member['constexpr'] = is_constexpr(item, status.tokens)
                 if item.is_bitfield():
                     member['width'] = item.get_bitfield_width()
-                value = find_default_value(item)
+                value = find_default_value(item, status.tokens)
                 if value:
                     member['value'] = value
                 member_type = 'variable'
@@ -1797,9 +2140,9 @@ def extract_declarations(citer, parent, status: Status, level = 0):
                 if is_template:
                     member['template_parameters'] = []
                 member['operator'] = is_operator(member['name'])
-                process_function_declaration(item, member)
+                process_function_declaration(item, member, status.tokens, status.types)
             elif member_type == 'namespace':
-                member['inline'] = is_inline(item)
+                member['inline'] = is_inline(item, status.tokens)
                 member['members'] = []
                 process_children = True
             elif member_type in ['typedef', 'using']:
@@ -1810,7 +2153,7 @@ def extract_declarations(citer, parent, status: Status, level = 0):
                     member['template_parameters'] = []
                 if not parent_is_namespace:
                     member['access'] = access_specifier_map[item.access_specifier]
-                member['type'] = process_type(item.underlying_typedef_type, item)
+                member['type'] = process_type(item.underlying_typedef_type, item, status.types)
                 process_children = is_template
             elif member_type == 'union':
                 # TODO: How about anonymous unions?
@@ -1826,10 +2169,10 @@ def extract_declarations(citer, parent, status: Status, level = 0):
                 member['related'] = []
                 process_children = True
             elif member_type == 'variable':
-                member['type'] = process_type(item.type, item)
+                member['type'] = process_type(item.type, item, status.types)
                 member['static'] = item.storage_class == cindex.StorageClass.STATIC
-                member['constexpr'] = is_constexpr(item)
-                value = find_default_value(item)
+                member['constexpr'] = is_constexpr(item, status.tokens)
+                value = find_default_value(item, status.tokens)
                 if value:
                     member['value'] = value
             member['member_type'] = member_type
@@ -1847,7 +2190,11 @@ def extract_declarations(citer, parent, status: Status, level = 0):
                 member['id'] = id
                 status.member_ids[usr] = id
                 cleanup_qualifiers(member)
-                if id in status.members:
+                if id in status.stored_ids:
+                    log.debug("Member %s (%s) was stored by a previous run, merging.", id, usr)
+                    status.stored_ids.discard(id)
+                    merge_member(status.members[id], member)
+                elif id in status.members:
                     if is_same_member(member, status.members[id]):
                         log.info("Member %s already exists (members differ by SFINAE only), merging.", id)
                         log.debug("Member %s (%s) already exists (members differ by SFINAE only), merging.", id, usr)
@@ -1868,11 +2215,11 @@ def extract_declarations(citer, parent, status: Status, level = 0):
 
             # Process child members
             if process_children:
-                extract_declarations(item.get_children(), id, status)
+                stack.append((item.get_children(), id))
 
         else:
             log.debug("ignore: kind = %s, spelling = %s, parent = %s", item.kind, item.spelling, parent)
-            extract_declarations(item.get_children(), parent, status)
+            stack.append((item.get_children(), parent))
 
 
 # --- Parsing header files --- extracting include statements ---
@@ -1882,31 +2229,514 @@ def is_under_directory(file, path):
         return os.path.relpath(file, path), True
     return file, False
 
-def extract_includes(tu, status: Status, header_files, include_dirs):
-    # Gets the list of files directly included by this one (not the ones included
-    # by files included here).
+def get_direct_includes(tu):
+    # Gets the list of files directly included by the translation unit's main file (not the ones included
+    # by files included there).
+    # A translation unit loaded from an AST file lists the inclusions in a different order,
+    # so we sort them by their location in the file.
+    it = [f for f in tu.get_includes() if f.depth == 1]
+    it.sort(key=lambda f: (f.location.line, f.location.column))
+    return [f.include.name for f in it]
+
+def extract_includes(includes, status: Status, header_files, include_dirs):
+    # Adds the list of files directly included by this one to the current header.
     # include_dirs[0] is always the project's root dir
     this_file_includes = status.current_header['includes']
-    it = tu.get_includes()
-    for f in it:
-        if f.depth == 1:
-            include = os.path.realpath(f.include.name)
-            include_name, is_under_project = is_under_directory(include, include_dirs[0])
-            if is_under_project:
-                if include in header_files:
-                    this_file_includes.append('"[{}](#{})"'.format(include_name, unique_id.header(include_name)))
-                else:
-                    this_file_includes.append('"{}"'.format(include_name))
+    for f in includes:
+        include = os.path.realpath(f)
+        include_name, is_under_project = is_under_directory(include, include_dirs[0])
+        if is_under_project:
+            if include in header_files:
+                this_file_includes.append('"[{}](#{})"'.format(include_name, unique_id.header(include_name)))
+            else:
+                this_file_includes.append('"{}"'.format(include_name))
+        else:
+            full_include = include
+            for dir in include_dirs[1:]:
+                part, res = is_under_directory(full_include, dir)
+                if res and len(part) < len(include):
+                    include = part
+            if os.path.isabs(include):
+                log.warning("Included file %s not in any of the directories on the path\n   in file %s",
+                            include, status.current_header_name)
+            this_file_includes.append('<{}>'.format(include))
+
+
+# --- Parsing header files --- running libclang ---
+
+parse_options = cindex.TranslationUnit.PARSE_SKIP_FUNCTION_BODIES + cindex.TranslationUnit.PARSE_INCOMPLETE
+
+def report_diagnostics(diagnostics):
+    # `diagnostics` is a list of (severity, message) tuples.
+    # Returns True if there was a fatal error, in which case the translation unit should not be processed.
+    for severity, message in diagnostics:
+        sys.stderr.write(message)
+        sys.stderr.write("\n")
+        if severity == cindex.Diagnostic.Fatal or severity == cindex.Diagnostic.Error:
+            log.error(message)
+        else:
+            log.warning(message)
+    return fatal_diagnostics(diagnostics)
+
+def fatal_diagnostics(diagnostics):
+    # Returns True if `diagnostics` contains an error
+    return any(severity in (cindex.Diagnostic.Fatal, cindex.Diagnostic.Error) for severity, _ in diagnostics)
+
+def parse_header(index, filename, compiler_flags, options=parse_options, profile=None):
+    # Parses the file, reports diagnostics, and returns the translation unit (or None on failure) and
+    # the diagnostics. The time spent is recorded in `profile`, if given.
+    profile = profile or profiling.no_profile
+    tu = None
+    try:
+        with profile.phase('parse', filename):
+            tu = index.parse(filename, compiler_flags, options=options)
+    except cindex.TranslationUnitLoadError as e:
+        log.error(str(e))
+        log.error("Could not parse file %s, skipping", filename)
+        return None, []
+    if not tu:
+        log.error("Could not parse file %s, skipping", filename)
+        return None, []
+    with profile.phase('diagnostics', filename):
+        diagnostics = [(d.severity, d.format()) for d in tu.diagnostics]
+        fatal = report_diagnostics(diagnostics)
+    if fatal:
+        log.error("Could not include documentation for file %s due to parser errors", filename)
+        return None, diagnostics
+    return tu, diagnostics
+
+worker_index = None
+
+def parse_header_to_ast_file(filename, compiler_flags, ast_file):
+    # Runs in a worker process. Parses the file and saves the translation unit to `ast_file`.
+    # Returns a dictionary with the diagnostics and, if parsing failed, the error message.
+    # Diagnostics are not stored in the AST file, so we need to pass them back to the main process.
+    global worker_index
+    if not worker_index:
+        worker_index = cindex.Index.create()
+    try:
+        tu = worker_index.parse(filename, compiler_flags, options=parse_options)
+    except cindex.TranslationUnitLoadError as e:
+        return {'error': str(e), 'diagnostics': []}
+    if not tu:
+        return {'error': '', 'diagnostics': []}
+    diagnostics = [(d.severity, d.format()) for d in tu.diagnostics]
+    if not fatal_diagnostics(diagnostics):
+        # If there are errors, the main process won't use the AST, so we don't need to save it
+        try:
+            tu.save(ast_file)
+        except cindex.TranslationUnitSaveError as e:
+            return {'error': str(e), 'diagnostics': []}
+    return {'error': None, 'diagnostics': diagnostics}
+
+def load_parsed_header(index, parsed_header, filename, keep_ast_file=False):
+    # Waits for the worker process parsing `filename`, reports diagnostics, and returns the translation
+    # unit (or None on failure) and the diagnostics. Unless `keep_ast_file` (i.e. it is a cache entry), the
+    # AST file is deleted once loaded: it takes several MB for each header file, and we'd otherwise keep
+    # all of them in the temporary directory until all header files are processed.
+    future, ast_file = parsed_header
+    result = future.result()
+    if result['error'] is not None:
+        if result['error']:
+            log.error(result['error'])
+        log.error("Could not parse file %s, skipping", filename)
+        return None, []
+    if report_diagnostics(result['diagnostics']):
+        log.error("Could not include documentation for file %s due to parser errors", filename)
+        return None, result['diagnostics']
+    tu = cindex.TranslationUnit.from_ast_file(ast_file, index)
+    if not keep_ast_file:
+        try:
+            os.remove(ast_file)
+        except OSError:
+            pass  # E.g. on Windows, where a file in use cannot be deleted; it goes with the temporary directory
+    return tu, result['diagnostics']
+
+def parse_umbrella(index, filename, header_files, compiler_flags):
+    # Parses a single translation unit, `filename`, that includes all header files. Reports diagnostics,
+    # and returns the translation unit, or None on failure.
+    contents = ''.join(['#include "{}"\n'.format(f) for f in dict.fromkeys(header_files)])
+    options = parse_options + cindex.TranslationUnit.PARSE_DETAILED_PROCESSING_RECORD
+    try:
+        tu = index.parse(filename, compiler_flags, unsaved_files=[(filename, contents)], options=options)
+    except cindex.TranslationUnitLoadError as e:
+        log.error(str(e))
+        log.error("Could not parse the header files as a single translation unit")
+        return None
+    if not tu:
+        log.error("Could not parse the header files as a single translation unit")
+        return None
+    if report_diagnostics([(d.severity, d.format()) for d in tu.diagnostics]):
+        log.error("Could not parse the header files as a single translation unit due to parser errors")
+        return None
+    return tu
+
+def build_precompiled_header(index, prefix_headers, compiler_flags, pch_file):
+    # Parses a file that includes all the prefix headers, and saves it to `pch_file`, such that it can be
+    # used as a precompiled header when parsing the header files. Returns False on failure.
+    filename = os.path.splitext(pch_file)[0] + '.h'
+    contents = ''.join(['#include <{}>\n'.format(h) for h in prefix_headers])
+    try:
+        tu = index.parse(filename, compiler_flags, unsaved_files=[(filename, contents)], options=parse_options)
+    except cindex.TranslationUnitLoadError as e:
+        log.error(str(e))
+        log.error("Could not parse the prefix headers, ignoring them")
+        return False
+    if not tu:
+        log.error("Could not parse the prefix headers, ignoring them")
+        return False
+    if report_diagnostics([(d.severity, d.format()) for d in tu.diagnostics]):
+        log.error("Could not parse the prefix headers due to parser errors, ignoring them")
+        return False
+    try:
+        tu.save(pch_file)
+    except cindex.TranslationUnitSaveError as e:
+        log.error(str(e))
+        log.error("Could not save the precompiled header, ignoring the prefix headers")
+        return False
+    return True
+
+def get_inclusion_directives(tu, filename):
+    # Gets the list of files directly included by `filename`, from the inclusion directives in the translation
+    # unit, which must be parsed with PARSE_DETAILED_PROCESSING_RECORD. We need this when using a precompiled
+    # header, `tu.get_includes()` does not list the files that were already included there.
+    includes = []
+    for item in tu.cursor.get_children():
+        if item.kind == cindex.CursorKind.INCLUSION_DIRECTIVE and str(item.location.file) == filename:
+            included_file = item.get_included_file()
+            if included_file:
+                includes.append(included_file.name)
+    return includes
+
+def split_umbrella(tu):
+    # Sorts the top-level cursors of the single translation unit by the file they are in, such that each
+    # header file can be processed on its own. Returns two dictionaries, with the declarations and the names
+    # of the directly included files for each file. Declarations without a file are stored under ''.
+    # We cannot use `tu.get_includes()` here, it only lists the first time a file is included.
+    declarations = {}
+    includes = {}
+    for item in tu.cursor.get_children():
+        if item.kind.is_preprocessing():
+            if item.kind == cindex.CursorKind.INCLUSION_DIRECTIVE:
+                included_file = item.get_included_file()
+                if included_file:
+                    includes.setdefault(str(item.location.file), []).append(included_file.name)
+            continue
+        file = str(item.location.file) if item.location.file else ''
+        declarations.setdefault(file, []).append(item)
+    return declarations, includes
+
+def start_parsing_headers(executor, header_files, compiler_flags, ast_dir, cache):
+    # Submits each of the header files to the process pool. Returns a dictionary with a
+    # (future, AST file name) tuple for each file. If we have a cache, the AST files are
+    # written directly into it.
+    parsed_headers = {}
+    for f in header_files:
+        if f not in parsed_headers:
+            if cache:
+                ast_file = cache.entry(f)[0]
             else:
-                full_include = include
-                for dir in include_dirs[1:]:
-                    part, res = is_under_directory(full_include, dir)
-                    if res and len(part) < len(include):
-                        include = part
-                if os.path.isabs(include):
-                    log.warning("Included file %s not in any of the directories on the path\n   in file %s",
-                                include, status.current_header_name)
-                this_file_includes.append('<{}>'.format(include))
+                ast_file = os.path.join(ast_dir, '{}.ast'.format(len(parsed_headers)))
+            parsed_headers[f] = (executor.submit(parse_header_to_ast_file, f, compiler_flags, ast_file), ast_file)
+    return parsed_headers
+
+def stop_parsing_headers(executor, parsed_headers):
+    # Cancels any pending work and waits for the workers to finish.
+    for future, _ in parsed_headers.values():
+        future.cancel()
+    executor.shutdown()
+
+
+# --- Parsing header files --- caching translation units ---
+
+class ParseCache:
+    # Stores the translation unit for each header file as an AST file in `cache_dir`, together with a
+    # manifest that records the content hash of the header and of each file it includes (directly or
+    # indirectly), as well as the diagnostics produced when parsing it. The AST file is used instead of
+    # parsing the header only if none of these files has changed since.
+    # Files are only hashed once per run, as most headers include the same files.
+    # `prune()` removes the entries for header files that are no longer parsed, otherwise the cache would
+    # keep growing as headers are renamed or deleted (each AST file takes several MB).
+
+    def __init__(self, cache_dir, compiler_flags):
+        self.cache_dir = cache_dir
+        self.compiler_flags = compiler_flags
+        self.hashes = {}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def file_hash(self, filename):
+        if filename not in self.hashes:
+            try:
+                with open(filename, 'rb') as f:
+                    self.hashes[filename] = hashlib.sha1(f.read()).hexdigest()
+            except OSError:
+                self.hashes[filename] = ''
+        return self.hashes[filename]
+
+    def entry(self, filename):
+        # Returns the names of the AST file and the manifest file for `filename`
+        key = hashlib.sha1('\0'.join([filename] + self.compiler_flags).encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return base + '.ast', base + '.json'
+
+    entry_file_match = re.compile(r'[0-9a-f]{40}\.(ast|json|json\.tmp)')
+
+    def prune(self, header_files):
+        # Removes the entries for all files not in `header_files`, or parsed with different compiler flags
+        keep = {os.path.basename(name) for f in header_files for name in self.entry(f)}
+        for name in os.listdir(self.cache_dir):
+            if name not in keep and self.entry_file_match.fullmatch(name):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError as e:
+                    log.warning("Could not remove %s from the cache: %s", name, str(e))
+
+    def lookup(self, filename):
+        # Returns the diagnostics recorded for `filename` if its AST file is up to date, None otherwise
+        ast_file, manifest_file = self.entry(filename)
+        try:
+            with open(manifest_file, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        try:
+            if manifest['file'] == filename and manifest['compiler flags'] == self.compiler_flags \
+                    and os.path.isfile(ast_file) \
+                    and all(self.file_hash(name) == hash for name, hash in manifest['files'].items()):
+                return manifest['diagnostics']
+        except (KeyError, TypeError, AttributeError):
+            pass  # Not a manifest we wrote, treat it as out of date
+        # The AST file will be overwritten, make sure the old manifest doesn't get paired with it
+        try:
+            os.remove(manifest_file)
+        except OSError:
+            pass  # Another process sharing the cache directory removed it already
+        return None
+
+    def load(self, index, filename, diagnostics):
+        # Loads the cached AST file for `filename`, reports diagnostics, and returns the translation unit,
+        # or None if the AST file could not be loaded (e.g. when it was written by a different version of
+        # libclang), in which case the file must be parsed anew.
+        try:
+            tu = cindex.TranslationUnit.from_ast_file(self.entry(filename)[0], index)
+        except cindex.TranslationUnitLoadError:
+            return None
+        report_diagnostics(diagnostics)
+        return tu
+
+    def store(self, filename, tu, diagnostics, saved):
+        # Stores the translation unit for `filename` in the cache. If `saved`, the AST file was already
+        # written to the cache by a worker process.
+        ast_file, manifest_file = self.entry(filename)
+        if not saved:
+            try:
+                tu.save(ast_file)
+            except cindex.TranslationUnitSaveError as e:
+                log.warning("Could not store file %s in the cache: %s", filename, str(e))
+                return
+        files = {filename: self.file_hash(filename)}
+        for f in tu.get_includes():
+            name = os.path.realpath(f.include.name)
+            files[name] = self.file_hash(name)
+        manifest = {
+            'file': filename,
+            'compiler flags': self.compiler_flags,
+            'files': files,
+            'diagnostics': diagnostics
+        }
+        with open(manifest_file + '.tmp', 'w') as f:
+            json.dump(manifest, f)
+        os.replace(manifest_file + '.tmp', manifest_file)
+
+
+# --- Parsing header files --- keeping translation units in memory ---
+
+# Not in cindex: builds the precompiled preamble while parsing, rather than on the first reparse
+parse_create_preamble_on_first_parse = 0x100
+
+def get_modification_times(filenames):
+    times = {}
+    for name in filenames:
+        try:
+            times[name] = os.stat(name).st_mtime_ns
+        except OSError:
+            times[name] = None
+    return times
+
+class WatchSession:
+    # Keeps the libclang index and the translation unit for each header file in memory across calls to
+    # `buildtree()`, for the watch mode of dox++parse. A header file is only parsed again if it, or any
+    # file it includes, has changed since. It is then reparsed, which reuses the precompiled preamble
+    # (the #include statements at the top of the file) if none of the files it includes changed.
+    # `wait_for_changes()` waits until any of the source files changes, or files are added or removed.
+
+    def __init__(self, interval=0.5):
+        self.interval = interval
+        self.index = cindex.Index.create()
+        self.translation_units = {}  # file name -> (tu, compiler_flags, modification times, diagnostics)
+        self.patterns = ('', '')     # the `header_files` and `markdown_files` strings given to `buildtree()`
+        self.sources = []            # the files these expanded to
+        self.times = {}              # the modification times of header and Markdown files
+
+    def set_sources(self, header_patterns, markdown_patterns, header_files, markdown_files):
+        self.patterns = (header_patterns, markdown_patterns)
+        self.sources = header_files + markdown_files
+        self.times = get_modification_times(self.sources)
+        for f in list(self.translation_units):
+            if f not in header_files:
+                del self.translation_units[f]
+
+    def parse(self, filename, compiler_flags):
+        # Returns the translation unit for `filename` (or None on failure), reporting diagnostics only if
+        # the file was (re)parsed
+        entry = self.translation_units.get(filename)
+        if entry and entry[1] == compiler_flags:
+            tu, _, times, diagnostics = entry
+            if get_modification_times(times) == times:
+                return None if fatal_diagnostics(diagnostics) else tu
+            times = get_modification_times([filename])
+            if cindex.conf.lib.clang_reparseTranslationUnit(tu, 0, 0, 0) == 0:
+                log.info('Reparsed %s', filename)
+                diagnostics = [(d.severity, d.format()) for d in tu.diagnostics]
+            else:
+                tu = None  # The translation unit can no longer be used
+        else:
+            tu = None
+            times = get_modification_times([filename])
+        if not tu:
+            try:
+                tu = self.index.parse(filename, compiler_flags, options=parse_options +
+                                      cindex.TranslationUnit.PARSE_PRECOMPILED_PREAMBLE +
+                                      parse_create_preamble_on_first_parse)
+            except cindex.TranslationUnitLoadError as e:
+                log.error(str(e))
+                log.error("Could not parse file %s, skipping", filename)
+                self.translation_units.pop(filename, None)
+                return None
+            diagnostics = [(d.severity, d.format()) for d in tu.diagnostics]
+        times.update(get_modification_times([os.path.realpath(f.include.name) for f in tu.get_includes()]))
+        self.translation_units[filename] = (tu, compiler_flags, times, diagnostics)
+        if report_diagnostics(diagnostics):
+            log.error("Could not include documentation for file %s due to parser errors", filename)
+            return None
+        return tu
+
+    def changed_files(self):
+        # Returns the list of source files that were changed, added or removed since the last `buildtree()`
+        header_files = [os.path.realpath(x) for x in expand_sources(shlex.split(self.patterns[0]))]
+        markdown_files = [os.path.realpath(x) for x in expand_sources(shlex.split(self.patterns[1]))]
+        changed = set(header_files + markdown_files).symmetric_difference(self.sources)
+        times = dict(self.times)
+        for _, _, tu_times, _ in self.translation_units.values():
+            times.update(tu_times)
+        changed.update(name for name, mtime in get_modification_times(times).items() if mtime != times[name])
+        return sorted(changed)
+
+    def wait_for_changes(self):
+        # Polls the source files every `interval` seconds, returns the list of changed files
+        while True:
+            time.sleep(self.interval)
+            changed = self.changed_files()
+            if changed:
+                return changed
+
+
+# --- Updating the data of a previous run ---
+
+def add_stored_anchors(element, status: Status):
+    # Registers the sections and anchors of a stored element, as `find_anchor_cmds()` would have
+    for section in element.get('sections', []):
+        status.anchors[section[0]] = section[1]
+    for anchor in element.get('anchors', []):
+        status.anchors[anchor] = ''
+
+def seed_stored_data(base_data, header_ids, status: Status):
+    # Fills `status` with the members and headers of `base_data` (the output of a previous `buildtree()` call)
+    # that were not declared in the header files `header_ids`, which are about to be processed again. The
+    # namespaces and classes declared in these header files that contain members we keep are kept too, but
+    # empty, as if added by `add_undocumented_member()`, so that processing the header files fills them in
+    # again. Extracting declarations merges members with these stored ones (see `status.stored_ids`).
+    # The references between members that post-processing adds (derived classes, related functions, IDs of
+    # base classes) are removed, as post-processing is done again for the whole tree. Returns the list of
+    # kept members that relate to a class, to be added to its 'related' list once all members are known.
+    stored = walktree.create_member_dict(base_data['members'])
+    del stored['']
+    keep = {id for id, member in stored.items() if member['header'] and member['header'] not in header_ids}
+    needed = set(keep)
+    for id in keep:
+        parent = stored[id]['parent']
+        while parent and parent not in needed:
+            needed.add(parent)
+            parent = stored[parent]['parent']
+    related_members = []
+    for id, member in stored.items():  # In pre-order, parents come before their children
+        if id not in needed:
+            continue
+        if id in keep:
+            if 'members' in member:
+                member['members'] = []
+            if 'derived' in member:
+                member['derived'] = []
+            if 'related' in member:
+                member['related'] = []
+            for base in member.get('bases', []):
+                base.pop('id', None)
+            if member['relates']:
+                related_members.append(member)
+            add_stored_anchors(member, status)
+        else:
+            member = members.new_member(id, member['name'], member['member_type'], member['parent'],
+                                        member['header'])
+            member['members'] = []
+        status.members[id] = member
+        status.stored_ids.add(id)
+        status.members[member['parent']]['members'].append(member)
+    for header in base_data['headers']:
+        if header['id'] not in header_ids:
+            status.headers[header['id']] = header
+            status.data['headers'].append(header)
+            add_stored_anchors(header, status)
+    return related_members
+
+def merge_stored_groups_and_pages(base_data, status: Status):
+    # Adds the groups and pages of `base_data` to `status`, once all files have been processed. Groups and
+    # pages that were (also) defined in these files are merged with the stored ones: fields that are still
+    # empty are filled in from the stored data, and sub-groups are combined. The page hierarchy is built
+    # by `post_process_subpages()` from the documentation of the pages defined anew, so we only fix up the
+    # links between these and the stored pages.
+    kept = set()
+    for key, elements in [('groups', status.groups), ('pages', status.pages)]:
+        stored_ids = set()
+        output = []
+        for stored in base_data[key]:
+            stored_ids.add(stored['id'])
+            element = elements.get(stored['id'])
+            if element is None:
+                elements[stored['id']] = stored
+                add_stored_anchors(stored, status)
+                if key == 'pages':
+                    kept.add(stored['id'])
+                output.append(stored)
+                continue
+            for field, value in stored.items():
+                if field == 'subgroups':
+                    element['subgroups'] += [id for id in value if id not in element['subgroups']]
+                elif field not in ['parent', 'subpages'] or key == 'groups':
+                    if not element.get(field):
+                        element[field] = value
+                        if field in ['sections', 'anchors']:
+                            add_stored_anchors({field: value}, status)
+            output.append(element)
+        output += [element for element in status.data[key] if element['id'] not in stored_ids]
+        status.data[key][:] = output
+    for id, page in status.pages.items():
+        if id not in kept:
+            continue
+        if page['parent'] and page['parent'] not in kept:
+            page['parent'] = ''  # Set again if the parent page still has the `\subpage` command
+        for subpage in page['subpages']:
+            if subpage in status.pages and subpage not in kept and not status.pages[subpage]['parent']:
+                status.pages[subpage]['parent'] = id
 
 
 # --- Main function for this file ---
@@ -1932,6 +2762,34 @@ def buildtree(root_dir, header_files, markdown_files, compiler_flags, include_di
         member names elsewhere is done by the backend, not this function. If a member name is not preceded by \ref,
         this tool will not recognize it as such. Instead, manually add `` around member names if not referenced.
     - 'tab_size': integer value for how many spaces each tab character advances.
+
+    Options can contain the keys:
+    - 'jobs': number of processes used to parse header files in parallel (default 1). The declarations
+        are still extracted serially and in the given order, so the output does not depend on this value.
+        A value of 0 uses one process per CPU core.
+    - 'umbrella': if True, all header files are parsed together as a single translation unit, such that
+        files included by many header files are parsed only once (default False). The 'jobs' and 'cache_dir'
+        options are ignored in this case.
+    - 'prefix_headers': headers (space separated, as they would appear in an #include <> statement) that are
+        parsed only once, into a precompiled header that is used when parsing each of the header files
+        (default ''). Ignored when combined with 'jobs' or 'cache_dir'.
+    - 'refresh_system_includes': if True, runs `clang++` to find the system include directories even if
+        they were cached by a previous run (default False).
+    - 'cache_dir': directory where parsed header files are cached (default '', no cache). A header file
+        is only parsed again if it, or any file it includes, has changed since it was cached.
+    - 'session': a `WatchSession` object that keeps the translation units in memory for the next call
+        (default None). A header file is only parsed again if it, or any file it includes, has changed since
+        the previous call. The 'jobs', 'umbrella', 'prefix_headers' and 'cache_dir' options are ignored.
+    - 'profile': a `Profile` object in which to record the time spent in each phase (default None).
+    - 'base_data': the data returned by a previous call (e.g. read back from the database), to update
+        with the given files (default None). Its members and headers are kept, except those declared in
+        the given header files, which are extracted anew. Its groups and pages are merged with those
+        defined in the given files. The result is post-processed as a whole, except that the references
+        in the kept documentation were already replaced by links, and are not looked up again.
+
+    :return: dictionary with data as described in `json_output.md`. Members are `members.Member` objects,
+           which behave like dictionaries but are not `dict` subclasses. To encode the data as JSON, pass
+           `default=members.json_default` to `json.dump()`, or use `jsonfile.write_data_to_json_file()`.
     """
 
     # Set global "constants" according to options
@@ -1940,15 +2798,22 @@ def buildtree(root_dir, header_files, markdown_files, compiler_flags, include_di
     tab_size = options['tab_size']
 
     # Process the input parameters
+    session = options.get('session')
+    profile = options.get('profile') or profiling.no_profile
+    header_patterns, markdown_patterns = header_files, markdown_files
     root_dir = os.path.realpath(root_dir)
     header_files = [os.path.realpath(x) for x in expand_sources(shlex.split(header_files))]
     markdown_files = [os.path.realpath(x) for x in expand_sources(shlex.split(markdown_files))]
+    if session:
+        session.set_sources(header_patterns, markdown_patterns, header_files, markdown_files)
     compiler_flags = compiler_flags.split()
     include_dirs = [os.path.realpath(x) for x in shlex.split(include_dirs, posix=False)]
 
     # Get system include directories and figure out compiler flags
-    system_include_dirs, sysroot = libclang.get_system_includes(compiler_flags)
-    compiler_flags += ['-isysroot' + sysroot]
+    system_include_dirs, sysroot = libclang.get_system_includes(compiler_flags,
+                                                                options.get('refresh_system_includes', False))
+    if sysroot:
+        compiler_flags += ['-isysroot' + sysroot]
     include_dirs = [root_dir] + system_include_dirs + include_dirs
     compiler_flags += ['-I{0}'.format(x) for x in include_dirs]
     compiler_flags.insert(0, '-xc++')
@@ -1967,77 +2832,169 @@ def buildtree(root_dir, header_files, markdown_files, compiler_flags, include_di
     # Add a member for the base namespace, this makes traversing the tree easier.
     status.members = walktree.create_member_dict(status.data['members'])
 
-    # Process all header files
-    index = cindex.Index.create()
-    processed = {}
-    for f in header_files:
-        # Skip file if already processed
-        if f in processed:
-            continue
-
-        # Get the name we'd use in an #include statement
-        status.current_header_name = os.path.relpath(f, start=root_dir)
-        log.info('Processing %s', status.current_header_name)
-        status.current_file_name = f
-
-        # Reset the rest of the data
-        status.current_group = ['']
-        status.group_locations = []
-        status.current_member_group = ''
-        status.member_group_locations = []
-
-        # Add info for current file
-        file_id = unique_id.header(status.current_header_name)
-        status.current_header = members.new_header(file_id, status.current_header_name)
-        status.data['headers'].append(status.current_header)
-        status.headers[file_id] = status.current_header
+    # Start from the data of a previous run, without what we're about to extract again
+    base_data = options.get('base_data')
+    if base_data:
+        header_ids = {unique_id.header(os.path.relpath(f, start=root_dir)) for f in header_files}
+        related_members = seed_stored_data(base_data, header_ids, status)
+
+    # Find which header files we have in the cache
+    umbrella = options.get('umbrella', False) and not session
+    cache_dir = options.get('cache_dir', '') if not umbrella and not session else ''
+    cache = ParseCache(cache_dir, compiler_flags) if cache_dir else None
+    cached_headers = {}
+    if cache:
+        for f in header_files:
+            if f not in cached_headers:
+                cached_headers[f] = cache.lookup(f)
+        log.info('Found %d out of %d header files in the cache',
+                 sum(d is not None for d in cached_headers.values()), len(cached_headers))
+    headers_to_parse = [f for f in header_files if cached_headers.get(f) is None]
+
+    # Figure out how we'll parse the header files
+    jobs = options.get('jobs', 1)
+    if jobs == 0:
+        jobs = os.cpu_count()
+    parallel = jobs > 1 and len(headers_to_parse) > 1 and not umbrella and not session
+    # libclang cannot load translation units that used a precompiled header from an AST file, which we need
+    # to do both for parallel parsing and for the cache
+    prefix_headers = shlex.split(options.get('prefix_headers', '')) if not session else []
+    if prefix_headers and (parallel or cache):
+        log.warning("Prefix headers cannot be used together with parallel parsing or a cache directory, ignoring them")
+        prefix_headers = []
+    work_dir = None
+    if parallel or prefix_headers:
+        work_dir = tempfile.TemporaryDirectory(prefix='dox++')
 
-        # Parse the file
-        tu = None
-        try:
-            tu = index.parse(f, compiler_flags, options=cindex.TranslationUnit.PARSE_SKIP_FUNCTION_BODIES +
-                                                        cindex.TranslationUnit.PARSE_INCOMPLETE)
-        except cindex.TranslationUnitLoadError as e:
-            log.error(str(e))
-            log.error("Could not parse file %s, skipping", f)
-            continue
-        if not tu:
-            log.error("Could not parse file %s, skipping", f)
-            continue
-        if len(tu.diagnostics) != 0:
-            fatal = False
-            for d in tu.diagnostics:
-                sys.stderr.write(d.format())
-                sys.stderr.write("\n")
-                if d.severity == cindex.Diagnostic.Fatal or d.severity == cindex.Diagnostic.Error:
-                    fatal = True
-                    log.error(d.format())
-                else:
-                    log.warning(d.format())
-            if fatal:
-                log.error("Could not include documentation for file %s due to parser errors", f)
+    # Process all header files
+    if parallel:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+        parsed_headers = start_parsing_headers(executor, headers_to_parse, compiler_flags, work_dir.name, cache)
+    else:
+        executor = None
+        parsed_headers = {}
+    try:
+        index = session.index if session else cindex.Index.create()
+        use_pch = False
+        header_parse_options = parse_options
+        if prefix_headers:
+            pch_file = os.path.join(work_dir.name, 'prefix.pch')
+            with profile.phase('build_precompiled_header'):
+                use_pch = build_precompiled_header(index, prefix_headers, compiler_flags, pch_file)
+            if use_pch:
+                compiler_flags = compiler_flags + ['-include-pch', pch_file]
+                header_parse_options += cindex.TranslationUnit.PARSE_DETAILED_PROCESSING_RECORD
+        umbrella_tu = None
+        if umbrella:
+            with profile.phase('parse_umbrella'):
+                umbrella_tu = parse_umbrella(index, os.path.join(root_dir, 'dox++umbrella.h'), header_files,
+                                             compiler_flags)
+            if umbrella_tu:
+                umbrella_declarations, umbrella_includes = split_umbrella(umbrella_tu)
+        processed = {}
+        for f in header_files:
+            # Skip file if already processed
+            if f in processed:
                 continue
 
-        # Extract list of headers included by this file
-        extract_includes(tu, status, header_files, include_dirs)
-
-        # Extract and process documentation comments with commands
-        process_comments(tu, status)
-
-        # Extract declarations and build member tree
-        extract_declarations(tu.cursor.get_children(), '', status)
-
-        # Mark this file as complete
-        processed[f] = True
+            # Get the name we'd use in an #include statement
+            status.current_header_name = os.path.relpath(f, start=root_dir)
+            log.info('Processing %s', status.current_header_name)
+            status.current_file_name = f
+
+            # Reset the rest of the data
+            status.current_group = ['']
+            status.group_locations = []
+            status.current_member_group = ''
+            status.member_group_locations = []
+            status.visited_cursors = 0
+            status.kept_cursors = 0
+            status.cursors = {}
+            status.types = {}
+
+            # Add info for current file
+            file_id = unique_id.header(status.current_header_name)
+            status.current_header = members.new_header(file_id, status.current_header_name)
+            status.data['headers'].append(status.current_header)
+            status.headers[file_id] = status.current_header
+
+            # Parse the file, take it from the single translation unit or the watch session, or load it from
+            # the cache
+            tu = None
+            if umbrella:
+                if not umbrella_tu:
+                    continue
+                tu = umbrella_tu
+            elif session:
+                with profile.phase('parse', f):
+                    tu = session.parse(f, compiler_flags)
+                if not tu:
+                    continue
+            elif cached_headers.get(f) is not None:
+                with profile.phase('load cached', f):
+                    tu = cache.load(index, f, cached_headers[f])
+            if not tu:
+                if f in parsed_headers:
+                    with profile.phase('load parsed', f):
+                        tu, diagnostics = load_parsed_header(index, parsed_headers[f], f, keep_ast_file=bool(cache))
+                else:
+                    tu, diagnostics = parse_header(index, f, compiler_flags, header_parse_options, profile)
+                if not tu:
+                    continue
+                if cache:
+                    with profile.phase('store cached', f):
+                        cache.store(f, tu, diagnostics, f in parsed_headers)
+
+            # Extract list of headers included by this file
+            with profile.phase('extract_includes', f):
+                if umbrella:
+                    extract_includes(umbrella_includes.get(f, []), status, header_files, include_dirs)
+                elif use_pch:
+                    extract_includes(get_inclusion_directives(tu, f), status, header_files, include_dirs)
+                else:
+                    extract_includes(get_direct_includes(tu), status, header_files, include_dirs)
+
+            # Extract and process documentation comments with commands
+            with profile.phase('process_comments', f) as record:
+                status.tokens = TokenIndex(tu, f)
+                process_comments(status.tokens, status)
+                record['comments'] = len(status.tokens.comments)
+
+            # Extract declarations and build member tree
+            with profile.phase('extract_declarations', f) as record:
+                n_members = len(status.members)
+                if umbrella:
+                    cursors = iter(umbrella_declarations.get('', []) + umbrella_declarations.get(f, []))
+                else:
+                    cursors = CachedCursor(tu.cursor, status.cursors).get_children()
+                extract_declarations(cursors, '', status)
+                record['cursors_visited'] = status.visited_cursors
+                record['members_added'] = len(status.members) - n_members
+            log.info('Kept %d out of %d cursors visited', status.kept_cursors, status.visited_cursors)
+
+            # Mark this file as complete
+            processed[f] = True
+    finally:
+        if executor:
+            stop_parsing_headers(executor, parsed_headers)
+        if work_dir:
+            work_dir.cleanup()
+    if cache:
+        cache.prune(header_files)
+
+    # Index the header names, so we can look up file references quickly
+    status.header_index = HeaderIndex(status.headers)
 
     # Process all stored member documentation that was not associated to a declaration in the sources
-    for cmd in status.unprocessed_commands:
-        process_documentation_command(cmd, status)
-    status.unprocessed_commands = []
+    with profile.phase('process_documentation_commands'):
+        for cmd in status.unprocessed_commands:
+            process_documentation_command(cmd, status)
+        status.unprocessed_commands = []
 
     # Process all additional files
     status.current_header = {}
     status.current_file_name = ''
+    status.tokens = None
     processed = {}
     for f in markdown_files:
         # Skip file if already processed
@@ -2055,34 +3012,62 @@ def buildtree(root_dir, header_files, markdown_files, compiler_flags, include_di
         status.member_group_locations = []
 
         # Extract markdown blocks from file
-        extract_markdown(f, status)
+        with profile.phase('extract_markdown', f):
+            extract_markdown(f, status)
 
         # Mark file as complete
         processed[f] = True
 
+    # Add the groups and pages of the previous run, and the stored members that relate to a class. Headers
+    # are kept in the order of the previous run, new ones go at the end
+    if base_data:
+        order = {header['id']: index for index, header in enumerate(base_data['headers'])}
+        status.data['headers'].sort(key=lambda header: order.get(header['id'], len(order)))
+        merge_stored_groups_and_pages(base_data, status)
+        for member in related_members:
+            related = status.members.get(member['relates'])
+            if related and 'related' in related:
+                related['related'].append(member['id'])
+            else:
+                member['relates'] = ''
+
     # TODO: Verify that we don't have duplicate IDs. Within members and headers we're sure that they're
     #       unique, but groups, pages, (sub-)sections and anchors could all have IDs that clash among
     #       each other or with member or header IDs.
 
+    # Index the member tree, so we can look up names quickly
+    with profile.phase('symbol_table'):
+        status.symbols = SymbolTable(status.members)
+
     # Go through all members with a 'type' element, and add an 'id' member representing the type
-    post_process_types(status.members)
+    with profile.phase('post_process_types'):
+        post_process_types(status.members, status.symbols)
+    status.symbols.cache_function_lookups = True
 
     # Go through all classes with base classes, and add references from base to derived, as well
     # as links back and forth between overridden functions
-    post_process_inheritance(status.members)
+    with profile.phase('post_process_inheritance'):
+        post_process_inheritance(status.members, status.symbols)
 
     # Go through all members and resolve the `\relates` commands
-    post_process_relates(status.members)
+    with profile.phase('post_process_relates'):
+        post_process_relates(status.members, status.symbols)
 
     # Go through all members, headers, groups and pages, identify `\ref` and `\see` commands,
     # identify linked members, and replace with links
-    post_process_links(status.members, status)
-    post_process_links(status.headers, status)
-    post_process_links(status.groups, status)
-    post_process_links(status.pages, status)
+    with profile.phase('post_process_links'):
+        post_process_links(status.members, status)
+        post_process_links(status.headers, status)
+        post_process_links(status.groups, status)
+        post_process_links(status.pages, status)
 
     # Go through all pages, identify `\subpage` commands, identify linked members, establish hierarchy,
     # and replace with links
-    post_process_subpages(status.pages)
+    with profile.phase('post_process_subpages'):
+        post_process_subpages(status.pages)
+
+    if status.symbols.lookups:
+        log.info("Found %d out of %d names in the lookup cache (%.0f%%)", status.symbols.hits,
+                 status.symbols.lookups, 100 * status.symbols.hits / status.symbols.lookups)
 
     return status.data
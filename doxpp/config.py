@@ -21,6 +21,9 @@ default_config_values = {
     'clang': {
         'compiler flags': '',
         'include directories': '',
+        'cache directory': '',
+        'single translation unit': 'no',
+        'prefix headers': '',
     },
     'log': {
         'level': 'warning',           # 'error', 'warning', 'info' or 'debug'
@@ -34,7 +37,9 @@ default_config_values = {
     'json': {
         'filename': 'dox++out.json',
         'use typewriter font': 'no',
-        'formatting': 'compact'       # 'compact' or 'readable'
+        'formatting': 'compact',      # 'compact' or 'readable'
+        'string table': 'no',
+        'database': ''
     },
     'project': {
         'name': 'Project Name',
@@ -36,6 +36,7 @@
 #   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #   DEALINGS IN THE SOFTWARE.
 
+import collections.abc
 import os
 import re
 import urllib.parse
@@ -44,16 +45,19 @@ import mimetypes
 import shutil
 import enum
 import glob
+import time
 from types import SimpleNamespace as Empty
 
 import markdown
 import jinja2
 
+from . import database
 from . import log
 from . import walktree
 from . import members
+from . import profiling
 
-from .search import CssClass, ResultFlag, ResultMap, Trie, serialize_search_data, base85encode_search_data, search_filename, searchdata_filename, searchdata_filename_b85, searchdata_format_version
+from .search import CssClass, search_data_header_struct, ResultFlag, ResultMap, Trie, TrieBuilder, serialize_search_data, base85encode_search_data, search_filename, searchdata_filename, searchdata_filename_b85, searchdata_format_version
 
 from .markdown.admonition import AdmonitionExtension
 from .markdown.fix_links import FixLinksExtension
@@ -161,7 +165,13 @@ def strip_html_tags(title):
     return html_tag_re.sub('', title)
 
 def generate_fully_qualified_names(members, status: Status):
-    for member in members:
+    # Parents must be visited before their children, we walk the tree in pre-order with an explicit stack
+    stack = [iter(members)]
+    while stack:
+        member = next(stack[-1], None)
+        if member is None:
+            stack.pop()
+            continue
         name = member['name']
         parent = member['parent']
         if parent:
@@ -172,7 +182,7 @@ def generate_fully_qualified_names(members, status: Status):
                 name = '&lt;unknown&gt;::<wbr />' + name
         member['fully_qualified_name'] = name
         if 'members' in member:
-            generate_fully_qualified_names(member['members'], status)
+            stack.append(iter(member['members']))
 
 
 def register_anchors_to_page(compound, page_id, status: Status):
@@ -498,7 +508,7 @@ def process_base_derived_related_lists(status: Status):
             related_list = member['related']
             member['related'] = []
             for related in related_list:
-                if isinstance(related, dict):
+                if isinstance(related, collections.abc.Mapping):
                     member['related'].append(related)
 
 def assign_page(status: Status):
@@ -678,7 +688,7 @@ def process_sections(compound, md):
     while sections:
         compound['sections'].append(process_sections_recursive(sections, 1, md))
 
-def parse_markdown(status: Status, math_cache_file):
+def parse_markdown(status: Status, math_cache_file, profile=None):
     math_svg_extension = mdx_math_svg.MathSvgExtension(inline_class='m-math', display_class='m-math', fontsize=1)
     extensions = [
         # Extensions packaged with `markdown`:
@@ -717,33 +727,58 @@ def parse_markdown(status: Status, math_cache_file):
 
     math_svg_extension.latex2svg.load_cache(math_cache_file)
 
+    # Time spent converting each type of element: {type: [count, seconds, output size]}
+    profile = profile or profiling.no_profile
+    timings = {}
+    def record_timing(element, type, start):
+        timing = timings.setdefault(type, [0, 0.0, 0])
+        timing[0] += 1
+        timing[1] += time.perf_counter() - start
+        timing[2] += len(element.get('brief') or '') + len(element['doc'] or '')
+
     for header in status.headers.values():
+        start = time.perf_counter()
         if header['brief']:
             header['brief'] = remove_p_tag(md.reset().convert(header['brief']))
         if header['doc']:
             header['doc'] = md.reset().convert(header['doc'])
         process_sections(header, md)
+        if profile.enabled:
+            record_timing(header, 'file', start)
     for group in status.groups.values():
+        start = time.perf_counter()
         if group['brief']:
             group['brief'] = remove_p_tag(md.reset().convert(group['brief']))
         if group['doc']:
             group['doc'] = md.reset().convert(group['doc'])
         group['name'] = remove_p_tag(md.reset().convert(group['name']))
         process_sections(group, md)
+        if profile.enabled:
+            record_timing(group, 'module', start)
     for member in status.members.values():
         if member['id'] not in status.id_map:
             continue
+        start = time.perf_counter()
         if member['brief']:
             member['brief'] = remove_p_tag(md.reset().convert(member['brief']))
         if member['doc']:
             member['doc'] = md.reset().convert(member['doc'])
         process_sections(member, md)
+        if profile.enabled:
+            record_timing(member, member['member_type'], start)
     for page in status.pages.values():
+        start = time.perf_counter()
         if page['doc']:
             page['doc'] = md.reset().convert(page['doc'])
         if page['title']:
             page['title'] = remove_p_tag(md.reset().convert(page['title']))
         process_sections(page, md)
+        if profile.enabled:
+            record_timing(page, 'page', start)
+
+    for type, (count, seconds, size) in sorted(timings.items()):
+        profile.add({'phase': 'convert_markdown', 'file': '', 'seconds': seconds,
+                     'element_type': type, 'count': count, 'bytes': size})
 
     math_svg_extension.latex2svg.save_cache(math_cache_file)
 
@@ -916,7 +951,7 @@ camel_case_point_re = re.compile(camel_case_point)
 camel_or_snake_case_point_re = re.compile('({})|({})'.format(snake_case_point, camel_case_point))
 word_point_re = re.compile('\\W\\w')
 
-def add_entry_to_search_data(result, joiner: str, trie: Trie, map: ResultMap,
+def add_entry_to_search_data(result, joiner: str, trie: TrieBuilder, map: ResultMap,
                              add_snake_case_suffixes, add_camel_case_suffixes):
     has_params = hasattr(result, 'params') and result.params is not None
 
@@ -991,9 +1026,18 @@ def fixup_titles_for_search(list_of_titles):
         out.append(fixup_title_for_search(title))
     return out
 
-def build_search_data(status: Status, add_snake_case_suffixes, add_camel_case_suffixes):
+def count_trie_nodes(trie: Trie):
+    count = 0
+    stack = [trie]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(child for _, child in node.children.values())
+    return count
+
+def build_search_data(status: Status, add_snake_case_suffixes, add_camel_case_suffixes, stats=None):
     symbol_count = 0
-    trie = Trie()
+    builder = TrieBuilder()
     map = ResultMap()
     for member in status.members.values():
         if not 'page_id' in member or not member['page_id']:  # Not documented, skip
@@ -1029,7 +1073,7 @@ def build_search_data(status: Status, add_snake_case_suffixes, add_camel_case_su
             result.suffix_length += len(' const')
 
         # Add the symbol with all its different prefixes and suffixes and so on
-        symbol_count += add_entry_to_search_data(result, '::', trie, map,
+        symbol_count += add_entry_to_search_data(result, '::', builder, map,
                                                  add_snake_case_suffixes, add_camel_case_suffixes)
 
     for file in status.headers.values():
@@ -1047,7 +1091,7 @@ def build_search_data(status: Status, add_snake_case_suffixes, add_camel_case_su
         result.suffix_length = 0
 
         # Add the symbol with all its different prefixes and suffixes and so on
-        symbol_count += add_entry_to_search_data(result, '/', trie, map,
+        symbol_count += add_entry_to_search_data(result, '/', builder, map,
                                                  add_snake_case_suffixes, add_camel_case_suffixes)
 
     for group in status.groups.values():
@@ -1064,7 +1108,7 @@ def build_search_data(status: Status, add_snake_case_suffixes, add_camel_case_su
         result.suffix_length = 0
 
         # Add the symbol with all its different prefixes and suffixes and so on
-        symbol_count += add_entry_to_search_data(result, ' » ', trie, map,
+        symbol_count += add_entry_to_search_data(result, ' » ', builder, map,
                                                  add_snake_case_suffixes, add_camel_case_suffixes)
 
     for page in status.pages.values():
@@ -1079,7 +1123,7 @@ def build_search_data(status: Status, add_snake_case_suffixes, add_camel_case_su
         result.suffix_length = 0
 
         # Add the symbol with all its different prefixes and suffixes and so on
-        symbol_count += add_entry_to_search_data(result, ' » ', trie, map,
+        symbol_count += add_entry_to_search_data(result, ' » ', builder, map,
                                                  add_snake_case_suffixes, add_camel_case_suffixes)
 
         # Now handle its sections
@@ -1090,7 +1134,7 @@ def build_search_data(status: Status, add_snake_case_suffixes, add_camel_case_su
                 result.name = fixup_title_for_search(section[1])
                 result.url = url_base + '#' + section[0]
                 result.name_with_args = result.name
-                symbol_count += add_entry_to_search_data(result, ' » ', trie, map,
+                symbol_count += add_entry_to_search_data(result, ' » ', builder, map,
                                                          add_snake_case_suffixes, add_camel_case_suffixes)
                 if section[2]:
                     symbol_count += add_section_to_search(section[2], result, url_base, prefix + [result.name])
@@ -1101,8 +1145,51 @@ def build_search_data(status: Status, add_snake_case_suffixes, add_camel_case_su
 
     # For each node in the trie sort the results so the found items have sane order by default
     log.info("Indexed %d symbols for search data", symbol_count)
+    trie = builder.build()
     trie.sort(map)
-    return serialize_search_data(trie, map, search_type_map, symbol_count)
+    data = serialize_search_data(trie, map, search_type_map, symbol_count)
+
+    # Statistics for --profile
+    if stats is not None:
+        _, _, _, map_offset, type_map_offset = search_data_header_struct.unpack_from(data)
+        stats['count'] = symbol_count
+        stats['entries'] = len(map.entries)
+        stats['trie_nodes'] = count_trie_nodes(trie)
+        stats['trie_bytes'] = map_offset - search_data_header_struct.size
+        stats['map_bytes'] = type_map_offset - map_offset
+        stats['bytes'] = len(data)
+    return data
+
+
+def render_page(compound, file, env, output_dir, status: Status, template_params):
+    # Renders the page for `compound` to `file`, returns the size of the file
+    type = compound['member_type']
+    if type == 'file':
+        compound['breadcrumb'] = [(p, '', p) for p in compound['name'].split('/')]  # TODO: Make sure this works on Windows
+        fixup_namespace_compound_members(compound, status)
+    elif type == 'module':
+        add_breadcrumb(compound, 'name', status.groups)
+        fixup_namespace_compound_members(compound, status)
+    elif type == 'page':
+        add_breadcrumb(compound, 'title', status.pages)
+    else:
+        add_breadcrumb(compound, 'name', status.members)
+        if type == 'namespace':
+            fixup_namespace_compound_members(compound, status)
+        else:
+            fixup_class_compound_members(compound, status)
+    template = env.get_template(type + '.html')
+    log.debug("Rendering %s to file %s using template %s",
+              compound['fully_qualified_name'] if 'fully_qualified_name' in compound else
+              compound['title'] if 'title' in compound else compound['name'],
+              file, template.filename)
+    rendered = template.render(compound=compound,
+                               FILENAME=file,
+                               SEARCHDATA_FORMAT_VERSION=searchdata_format_version,
+                               **template_params)
+    with open(os.path.join(output_dir, file), 'w') as f:
+        f.write(rendered)
+    return os.path.getsize(os.path.join(output_dir, file))
 
 
 def createhtml(input_file, output_dir, options, template_params):
@@ -1128,10 +1215,20 @@ def createhtml(input_file, output_dir, options, template_params):
     - 'add_snake_case_suffixes': split up names according to snake case for searching
     - 'add_camel_case_suffixes': split up names according to camel case for searching
     - 'math_cache_file': file name for the cache for the mdx_math_svg markdown extension.
+    - 'database': file name for the SQLite database to read instead of `input_file`.
+    - 'profile': a `profiling.Profile` object in which to record the time spent in each phase and on each
+                 page (default None).
     """
 
+    profile = options.get('profile') or profiling.no_profile
+    template_params = dict(template_params)  # We add to these, the caller might pass them again
+
     # Load data
-    status = Status(walktree.load_data_from_json_file(input_file), options)
+    with profile.phase('load_input'):
+        if options.get('database'):
+            status = Status(database.read_data_from_database(options['database']), options)
+        else:
+            status = Status(walktree.load_data_from_json_file(input_file), options)
 
     # We need to have an index.html page
     if 'index' not in status.pages:
@@ -1146,31 +1243,36 @@ def createhtml(input_file, output_dir, options, template_params):
     # Find out which pages to create, what is listed in each, and in which page
     # the detailed documentation for each member has to go
     log.info("Assigning members to pages")
-    assign_page(status)
+    with profile.phase('assign_page'):
+        assign_page(status)
     #print('\n\nhtml_pages', status.html_pages)
     #print('\n\nid_map', status.id_map)
 
     # Parse all Markdown
     log.info("Parsing Markdown")
-    parse_markdown(status, options['math_cache_file'])
+    with profile.phase('parse_markdown'):
+        parse_markdown(status, options['math_cache_file'], profile)
 
     # Add group info to classes and namespaces
     log.info("Postprocessing information")
     for group in status.groups.values():
         module = (group['name'], group['id'] + '.html')
-        for members in [group['namespaces'], group['classes']]:
-            for member in members:
+        for member_list in [group['namespaces'], group['classes']]:
+            for member in member_list:
                 member['module'] = module
 
     # Fix base and derived class lists, and related member lists
-    process_base_derived_related_lists(status)
+    with profile.phase('process_base_derived_related_lists'):
+        process_base_derived_related_lists(status)
 
     # Convert type name strings into HTML links if appropriate
-    parse_types(status, options['doc_link_class'])
+    with profile.phase('parse_types'):
+        parse_types(status, options['doc_link_class'])
 
     # Create tree structure for index pages
     log.info("Compiling indices")
-    index = create_indices(status)
+    with profile.phase('create_indices'):
+        index = create_indices(status)
 
     # Navbar links
     if 'LINKS_NAVBAR1' in template_params:
@@ -1213,60 +1315,41 @@ def createhtml(input_file, output_dir, options, template_params):
         #    log.error("Generating 'compound' data structure for unknown id = %s", id)
         #    continue
         log.info("Generating page %s", file)
-        type = compound['member_type']
-        if type == 'file':
-            compound['breadcrumb'] = [(p, '', p) for p in compound['name'].split('/')]  # TODO: Make sure this works on Windows
-            fixup_namespace_compound_members(compound, status)
-        elif type == 'module':
-            add_breadcrumb(compound, 'name', status.groups)
-            fixup_namespace_compound_members(compound, status)
-        elif type == 'page':
-            add_breadcrumb(compound, 'title', status.pages)
-        else:
-            add_breadcrumb(compound, 'name', status.members)
-            if type == 'namespace':
-                fixup_namespace_compound_members(compound, status)
-            else:
-                fixup_class_compound_members(compound, status)
-        template = env.get_template(type + '.html')
-        log.debug("Rendering %s to file %s using template %s",
-                  compound['fully_qualified_name'] if 'fully_qualified_name' in compound else
-                  compound['title'] if 'title' in compound else compound['name'],
-                  file, template.filename)
-        rendered = template.render(compound=compound,
-                                   FILENAME=file,
-                                   SEARCHDATA_FORMAT_VERSION=searchdata_format_version,
-                                   **template_params)
-        with open(os.path.join(output_dir, file), 'w') as f:
-            f.write(rendered)
+        with profile.phase('render_page', file) as record:
+            record['bytes'] = render_page(compound, file, env, output_dir, status, template_params)
 
     # Generate indexes for pages, groups (==modules), namespaces, classes/structs/unions (==classes), and headers (==files)
     for file in ['pages.html', 'modules.html', 'namespaces.html', 'classes.html', 'files.html']:
         log.info("Generating page %s", file)
-        template = env.get_template(file)
-        log.debug("Rendering file %s using template %s", file, template)
-        rendered = template.render(index=index,
-                                   FILENAME=file,
-                                   SEARCHDATA_FORMAT_VERSION=searchdata_format_version,
-                                   **template_params)
-        with open(os.path.join(output_dir, file), 'w') as f:
-            f.write(rendered)
+        with profile.phase('render_index', file) as record:
+            template = env.get_template(file)
+            log.debug("Rendering file %s using template %s", file, template)
+            rendered = template.render(index=index,
+                                       FILENAME=file,
+                                       SEARCHDATA_FORMAT_VERSION=searchdata_format_version,
+                                       **template_params)
+            with open(os.path.join(output_dir, file), 'w') as f:
+                f.write(rendered)
+            record['bytes'] = os.path.getsize(os.path.join(output_dir, file))
 
     # Generate search data
     if not template_params['SEARCH_DISABLED']:
         log.info("Compiling search data")
-        data = build_search_data(status,
-                                 add_snake_case_suffixes=options['add_snake_case_suffixes'],
-                                 add_camel_case_suffixes=options['add_camel_case_suffixes'])
-
-        if template_params['SEARCH_DOWNLOAD_BINARY']:
-            log.info("Writing search data to %s", searchdata_filename)
-            with open(os.path.join(output_dir, searchdata_filename), 'wb') as f:
-                f.write(data)
-        else:
-            log.info("Writing search data to %s", searchdata_filename_b85)
-            with open(os.path.join(output_dir, searchdata_filename_b85), 'wb') as f:
-                f.write(base85encode_search_data(data))
+        with profile.phase('build_search_data') as record:
+            data = build_search_data(status,
+                                     add_snake_case_suffixes=options['add_snake_case_suffixes'],
+                                     add_camel_case_suffixes=options['add_camel_case_suffixes'],
+                                     stats=record if profile.enabled else None)
+
+        with profile.phase('write_search_data'):
+            if template_params['SEARCH_DOWNLOAD_BINARY']:
+                log.info("Writing search data to %s", searchdata_filename)
+                with open(os.path.join(output_dir, searchdata_filename), 'wb') as f:
+                    f.write(data)
+            else:
+                log.info("Writing search data to %s", searchdata_filename_b85)
+                with open(os.path.join(output_dir, searchdata_filename_b85), 'wb') as f:
+                    f.write(base85encode_search_data(data))
 
         # OpenSearch metadata, if we have the base URL
         if template_params['SEARCH_BASE_URL']:
@@ -1277,39 +1360,40 @@ def createhtml(input_file, output_dir, options, template_params):
             with open(output, 'w') as f:
                 f.write(rendered)
 
-    # Copy over all referenced files
-    for i in template_params['STYLESHEETS'] + options['extra_files'] + ([template_params['PROJECT_LOGO']] if template_params['PROJECT_LOGO'] else []) + ([template_params['FAVICON'][0]] if template_params['FAVICON'][0] else []):
-        if urllib.parse.urlparse(i).netloc:
-            continue
-        # File is either found relative to the current directory or relative to script directory
-        p = i
-        if not os.path.exists(p):
-            p = os.path.join(doxpp_path, p)
-        if not os.path.exists(p):
-            log.error("File %s not found", i)
-        log.info("Copying %s to output", p)
-        shutil.copy(p, os.path.join(output_dir, os.path.basename(p)))
-    # The images we need to search for in the input directories
-    source_dirs = set()
-    for s in options['source_files']:
-        if ('*' in s) or ('?' in s):
-            for s in glob.glob(s):
+    with profile.phase('copy_files'):
+        # Copy over all referenced files
+        for i in template_params['STYLESHEETS'] + options['extra_files'] + ([template_params['PROJECT_LOGO']] if template_params['PROJECT_LOGO'] else []) + ([template_params['FAVICON'][0]] if template_params['FAVICON'][0] else []):
+            if urllib.parse.urlparse(i).netloc:
+                continue
+            # File is either found relative to the current directory or relative to script directory
+            p = i
+            if not os.path.exists(p):
+                p = os.path.join(doxpp_path, p)
+            if not os.path.exists(p):
+                log.error("File %s not found", i)
+            log.info("Copying %s to output", p)
+            shutil.copy(p, os.path.join(output_dir, os.path.basename(p)))
+        # The images we need to search for in the input directories
+        source_dirs = set()
+        for s in options['source_files']:
+            if ('*' in s) or ('?' in s):
+                for s in glob.glob(s):
+                    source_dirs.add(os.path.dirname(s))
+            else:
                 source_dirs.add(os.path.dirname(s))
-        else:
-            source_dirs.add(os.path.dirname(s))
-    for i in status.images:
-        found = False
-        for s in source_dirs:
-            p = os.path.join(s,i)
-            if os.path.exists(p):
-                log.info("Copying %s to output", p)
-                shutil.copy(p, os.path.join(output_dir, os.path.basename(i)))
-                found = True
-                break
-        if not found:
-            log.error("File %s not found", i)
-    # The search.js is special, we encode the version information into its filename
-    if not template_params['SEARCH_DISABLED']:
-        p = os.path.join(doxpp_path, 'html_templates/search.js')
-        log.info("Copying %s to output as %s", p, search_filename)
-        shutil.copy(p, os.path.join(output_dir, search_filename))
+        for i in status.images:
+            found = False
+            for s in source_dirs:
+                p = os.path.join(s,i)
+                if os.path.exists(p):
+                    log.info("Copying %s to output", p)
+                    shutil.copy(p, os.path.join(output_dir, os.path.basename(i)))
+                    found = True
+                    break
+            if not found:
+                log.error("File %s not found", i)
+        # The search.js is special, we encode the version information into its filename
+        if not template_params['SEARCH_DISABLED']:
+            p = os.path.join(doxpp_path, 'html_templates/search.js')
+            log.info("Copying %s to output as %s", p, search_filename)
+            shutil.copy(p, os.path.join(output_dir, search_filename))
@@ -0,0 +1,185 @@
+# dox++
+# Copyright 2020, Cris Luengo
+#
+# This file is part of dox++.  dox++ is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+# Storing the dox++parse data in an SQLite database, as an alternative to the JSON file.
+#
+# Each of members, headers, groups and pages is a table with one row per element, indexed by ID. The
+# "brief" and "doc" fields are stored in their own columns, so that they can be loaded only when needed;
+# all other fields are stored as JSON in the "data" column (with null in place of "brief", "doc" and
+# "members", to preserve the order of the fields). Members also store their parent and header, and their
+# position in a pre-order traversal of the member tree, so that the tree can be rebuilt in order.
+#
+# To update the database with a few header files, dox++parse reads it back and passes it to `buildtree()`
+# as the 'base_data' option, then writes the rows that differ from the stored ones.
+
+import json
+import sqlite3
+
+from . import members
+
+
+schema = """
+CREATE TABLE IF NOT EXISTS members (
+    id TEXT PRIMARY KEY,
+    parent TEXT NOT NULL,
+    header TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    brief TEXT,
+    doc TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS members_parent ON members (parent);
+CREATE INDEX IF NOT EXISTS members_header ON members (header);
+CREATE INDEX IF NOT EXISTS members_position ON members (position);
+"""
+for table in ['headers', 'groups', 'pages']:
+    schema += """
+CREATE TABLE IF NOT EXISTS {0} (
+    id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    brief TEXT,
+    doc TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS {0}_position ON {0} (position);
+""".format(table)
+
+
+# --- Writing ---
+
+def split_element(element):
+    # Returns the "brief" and "doc" fields of `element`, and the JSON for the remaining fields
+    data = element.copy()
+    brief = data.get('brief')
+    doc = data.get('doc')
+    for key in ['brief', 'doc', 'members']:
+        if key in data:
+            data[key] = None
+    return brief, doc, json.dumps(data, separators=(',', ':'), default=members.json_default)
+
+def collect_members(members, rows):
+    # Appends a row for each member in `members` and their children to `rows`, in pre-order
+    stack = [iter(members)]
+    while stack:
+        member = next(stack[-1], None)
+        if member is None:
+            stack.pop()
+            continue
+        brief, doc, data = split_element(member)
+        rows.append((member['id'], member['parent'], member.get('header', ''), len(rows), brief, doc, data))
+        if 'members' in member:
+            stack.append(iter(member['members']))
+
+def write_rows(connection, table, columns, rows, update):
+    # Writes `rows` to `table`, replacing its contents. With `update`, only the rows that differ from the
+    # stored ones are written: the rows that differ only in their position get their position updated, and
+    # stored rows that are not in `rows` are deleted. The first column is the ID, `columns` names them all.
+    # The JSON in the "data" column is compared by value, the order of the fields can differ.
+    if update:
+        position = columns.index('position')
+        data = columns.index('data')
+        stored = {row[0]: row for row in connection.execute('SELECT {} FROM {}'.format(', '.join(columns), table))}
+        connection.executemany('DELETE FROM {} WHERE id = ?'.format(table),
+                               [(id,) for id in stored.keys() - {row[0] for row in rows}])
+        moved = []
+        changed = []
+        for row in rows:
+            old_row = stored.get(row[0])
+            if not old_row or any(old_row[ii] != row[ii] for ii in range(len(row)) if ii not in [position, data]) \
+                    or (old_row[data] != row[data] and json.loads(old_row[data]) != json.loads(row[data])):
+                changed.append(row)
+            elif old_row[position] != row[position]:
+                moved.append((row[position], row[0]))
+        connection.executemany('UPDATE {} SET position = ? WHERE id = ?'.format(table), moved)
+        rows = changed
+    else:
+        connection.execute('DELETE FROM ' + table)
+    connection.executemany('INSERT OR REPLACE INTO {} ({}) VALUES ({})'.format(
+        table, ', '.join(columns), ', '.join('?' * len(columns))), rows)
+
+def write_data_to_database(data, filename, update=False):
+    """
+    Writes data to an SQLite database, to be read by `read_data_from_database`. Any previous contents of
+    the database are replaced.
+    :param data: dictionary with data as described in `json_output.md`
+    :param filename: name of the database file
+    :param update: set to True if `data` is the database contents updated with some header files (see the
+                   'base_data' option of `buildtree()`). Only the rows that changed are written then, which
+                   is faster when few members changed. The result is the same.
+    """
+    member_rows = []
+    collect_members(data['members'], member_rows)
+    connection = sqlite3.connect(filename)
+    try:
+        with connection:
+            connection.executescript(schema)
+            write_rows(connection, 'members', ['id', 'parent', 'header', 'position', 'brief', 'doc', 'data'],
+                       member_rows, update)
+            for table in ['headers', 'groups', 'pages']:
+                rows = [(element['id'], ii) + split_element(element) for ii, element in enumerate(data[table])]
+                write_rows(connection, table, ['id', 'position', 'brief', 'doc', 'data'], rows, update)
+    finally:
+        connection.close()
+
+
+# --- Reading ---
+
+def join_element(brief, doc, data, load_doc):
+    # The reverse of `split_element()`
+    element = json.loads(data)
+    if 'brief' in element:
+        element['brief'] = brief
+    if 'doc' in element:
+        element['doc'] = doc if load_doc else bool(doc)
+    if 'members' in element:
+        element['members'] = []
+    return members.json_object_hook(element)
+
+def read_data_from_database(filename, doc=True):
+    """
+    Reads data from an SQLite database written by `write_data_to_database`.
+    :param filename: name of the database file
+    :param doc: set to False to not load the documentation text. The "doc" fields will be True or False,
+                indicating whether there is documentation or not.
+    :return: dictionary with data as described in `json_output.md`
+    """
+    connection = sqlite3.connect(filename)
+    try:
+        data = {'members': []}
+        members = {'': {'members': data['members']}}
+        for id, parent, brief, doc_text, element in connection.execute(
+                'SELECT id, parent, brief, doc, data FROM members ORDER BY position'):
+            member = join_element(brief, doc_text, element, doc)
+            members[parent]['members'].append(member)  # Parents come before their children
+            members[id] = member
+        for table in ['headers', 'groups', 'pages']:
+            data[table] = [join_element(brief, doc_text, element, doc) for brief, doc_text, element in
+                           connection.execute('SELECT brief, doc, data FROM {} ORDER BY position'.format(table))]
+        return data
+    finally:
+        connection.close()
+
+def read_member_briefs(filename):
+    """
+    Reads the brief description of all members from an SQLite database written by `write_data_to_database`.
+    :param filename: name of the database file
+    :return: list of (ID, brief) tuples, in the order that the members appear in the member tree
+    """
+    connection = sqlite3.connect(filename)
+    try:
+        return connection.execute('SELECT id, brief FROM members ORDER BY position').fetchall()
+    finally:
+        connection.close()
@@ -0,0 +1,269 @@
+# dox++
+# Copyright 2020, Cris Luengo
+#
+# This file is part of dox++.  dox++ is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+# Reading and writing the JSON file that dox++parse produces and dox++html consumes.
+#
+# Both directions work incrementally, so that we never hold the full JSON text in memory: the writer
+# encodes one member at a time (without its child members, which are written in turn), and the reader
+# decodes from a buffer that is filled from the file as needed, one element at a time if it fits in the
+# buffer, or otherwise piece by piece. The writer produces exactly the same text as `json.dumps()`.
+#
+# The optional string table replaces the strings in the fields listed in `string_table_keys` with an index
+# into a list of unique strings, stored as the first field of the file ("string_table"). These fields are
+# very repetitive (each type has a "typename", "qualifiers" and "id", and each member refers to its
+# parent and header), so this makes the file much smaller. Also, the reader returns the same string object
+# for each occurrence, reducing the memory needed to hold the data.
+
+import collections.abc
+import json
+import os
+import re
+
+from . import members
+
+
+string_table_keys = {'typename', 'qualifiers', 'id', 'parent', 'header'}
+
+
+# --- Writing ---
+
+def collect_strings(value, strings):
+    # Adds the strings in `value` that go into the string table to `strings`, a dictionary that maps a
+    # string to its index
+    if isinstance(value, collections.abc.Mapping):
+        for key, v in value.items():
+            if key in string_table_keys and isinstance(v, str):
+                strings.setdefault(v, len(strings))
+            else:
+                collect_strings(v, strings)
+    elif isinstance(value, list):
+        for v in value:
+            collect_strings(v, strings)
+
+def replace_strings(value, strings):
+    # Returns a copy of `value` with the strings that go into the string table replaced by their index.
+    # Containers that don't need changing are not copied.
+    if isinstance(value, collections.abc.Mapping):
+        out = {}
+        for key, v in value.items():
+            if key in string_table_keys and isinstance(v, str):
+                out[key] = strings[v]
+            else:
+                out[key] = replace_strings(v, strings)
+        return out
+    if isinstance(value, list) and value and isinstance(value[0], (collections.abc.Mapping, list)):
+        return [replace_strings(v, strings) for v in value]
+    return value
+
+class JSONWriter:
+    # Writes the dox++parse data to `file`, yielding the same text as `json.dumps(data, indent=indent)`.
+    # The top-level dictionary, its lists, each member with child members, and each "members" list are
+    # written piece by piece, everything else is encoded in one go.
+    def __init__(self, file, indent=None, strings=None):
+        self.file = file
+        self.indent = indent
+        self.strings = strings
+        if indent is None:
+            self.encoder = json.JSONEncoder(separators=(',', ':'), default=members.json_default)
+            self.key_separator = ':'
+        else:
+            self.encoder = json.JSONEncoder(indent=indent, default=members.json_default)
+            self.key_separator = ': '
+
+    def newline(self, level):
+        if self.indent is None:
+            return ''
+        return '\n' + ' ' * (self.indent * level)
+
+    def write_value(self, value, level):
+        if self.strings is not None:
+            value = replace_strings(value, self.strings)
+        text = self.encoder.encode(value)
+        if self.indent is not None and level:
+            text = text.replace('\n', self.newline(level))  # JSON strings can't contain a newline character
+        self.file.write(text)
+
+    def write_dict(self, value, level, top_level=False):
+        if not value:
+            self.file.write('{}')
+            return
+        separator = '{'
+        for key, v in value.items():
+            self.file.write(separator + self.newline(level + 1) + self.encoder.encode(key) + self.key_separator)
+            separator = ','
+            if isinstance(v, list) and v and (top_level or key == 'members'):
+                self.write_list(v, level + 1)
+            elif self.strings is not None and key in string_table_keys and isinstance(v, str):
+                self.file.write(str(self.strings[v]))
+            else:
+                self.write_value(v, level + 1)
+        self.file.write(self.newline(level) + '}')
+
+    def write_list(self, value, level):
+        separator = '['
+        for v in value:
+            self.file.write(separator + self.newline(level + 1))
+            separator = ','
+            if isinstance(v, collections.abc.Mapping) and v.get('members'):
+                self.write_dict(v, level + 1)
+            else:
+                self.write_value(v, level + 1)
+        self.file.write(self.newline(level) + ']')
+
+def write_data_to_json_file(data, filename, readable=False, string_table=False):
+    """
+    Writes data to a JSON file, to be read by `load_data_from_json_file`.
+    :param data: dictionary with data as described in `json_output.md`
+    :param filename: name of JSON file to write data to
+    :param readable: set to True to pretty-format the file
+    :param string_table: set to True to store repeated strings only once
+    """
+    strings = None
+    if string_table:
+        strings = {}
+        collect_strings(data, strings)
+        data = {'string_table': list(strings), **data}
+    # Readers (e.g. dox++html in watch mode) must never see a partially written file
+    with open(filename + '.tmp', 'w') as output_file:
+        writer = JSONWriter(output_file, indent=2 if readable else None, strings=strings)
+        writer.write_dict(data, 0, top_level=True)
+    os.replace(filename + '.tmp', filename)
+
+
+# --- Reading ---
+
+whitespace_match = re.compile(r'[ \t\n\r]*')
+
+class JSONReader:
+    # Reads the data written by `JSONWriter` from `file`. The top-level dictionary, its lists, and each
+    # "members" list are parsed piece by piece. The elements of these lists are decoded in one go if they
+    # are complete in the buffer, and otherwise parsed piece by piece too. Everything else is decoded in
+    # one go. `chunk_size` is the number of characters read from the file at once. Members are returned
+    # as `members.Member` objects.
+    def __init__(self, file, chunk_size=1 << 20):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder(object_hook=members.json_object_hook)
+        self.strings = None
+
+    def fill(self, size):
+        # Reads at least `size` more characters into the buffer, dropping what we've already parsed
+        chunk = self.file.read(max(size, self.chunk_size))
+        if not chunk:
+            self.eof = True
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+
+    def skip_whitespace(self):
+        while True:
+            self.pos = whitespace_match.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or self.eof:
+                return
+            self.fill(self.chunk_size)
+
+    def peek(self):
+        self.skip_whitespace()
+        return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, characters):
+        c = self.peek()
+        if not c or c not in characters:
+            raise json.JSONDecodeError('Expecting one of ' + repr(characters), self.buffer, self.pos)
+        self.pos += 1
+        return c
+
+    def read_value(self):
+        # Decodes one value, reading more of the file until it's complete. A value that ends at the end
+        # of the buffer could be a truncated number, so we make sure there's something after it.
+        self.skip_whitespace()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.fill(size)
+            size *= 2
+
+    def lookup_strings(self, obj):
+        # `object_hook` for the decoder once we have a string table
+        for key in string_table_keys:
+            if isinstance(obj.get(key), int):
+                obj[key] = self.strings[obj[key]]
+        return members.json_object_hook(obj)
+
+    def read_dict(self, top_level=False):
+        self.expect('{')
+        out = {}
+        if self.peek() == '}':
+            self.pos += 1
+            return out
+        while True:
+            key = self.read_value()
+            self.expect(':')
+            if self.peek() == '[' and (top_level or key == 'members'):
+                value = self.read_list()
+            else:
+                value = self.read_value()
+                if self.strings is not None and key in string_table_keys and isinstance(value, int):
+                    value = self.strings[value]
+            if top_level and key == 'string_table':
+                self.strings = value
+                self.decoder = json.JSONDecoder(object_hook=self.lookup_strings)
+            else:
+                out[key] = value
+            if self.expect(',}') == '}':
+                return out if top_level else members.json_object_hook(out)
+
+    def read_list(self):
+        self.expect('[')
+        out = []
+        if self.peek() == ']':
+            self.pos += 1
+            return out
+        while True:
+            if self.peek() == '{':
+                # If the element is complete in the buffer, decoding it in one go is much faster
+                try:
+                    value, self.pos = self.decoder.raw_decode(self.buffer, self.pos)
+                    out.append(value)
+                except json.JSONDecodeError:
+                    out.append(self.read_dict())
+            else:
+                out.append(self.read_value())
+            if self.expect(',]') == ']':
+                return out
+
+def read_data_from_json_file(filename):
+    """
+    Reads data from a JSON file written by `write_data_to_json_file`, or by any other JSON writer.
+    :param filename: name of JSON file to read data from
+    :return: dictionary with data as described in `json_output.md`
+    """
+    with open(filename, 'r') as input_file:
+        reader = JSONReader(input_file)
+        data = reader.read_dict(top_level=True)
+        reader.skip_whitespace()
+        if reader.pos < len(reader.buffer):
+            raise json.JSONDecodeError('Extra data', reader.buffer, reader.pos)
+        return data
@@ -15,8 +15,10 @@
 # this program; if not, write to the Free Software Foundation, Inc., 51
 # Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
+import json
 import os
 import platform
+import shutil
 import subprocess
 import re
 
@@ -24,7 +26,7 @@ from . import log
 from clang import cindex
 
 
-def get_system_includes(f):
+def probe_system_includes(f):
     devnull = open(os.devnull)
 
     try:
@@ -73,6 +75,55 @@ def get_system_includes(f):
 
     return paths, sysroot
 
+# The output of `probe_system_includes()` is cached on disk, running `clang++` is slow compared to
+# parsing a small project. An empty result is not cached, it means that running `clang++` failed.
+
+system_includes_cache = {}
+
+def get_system_includes_cache_file():
+    cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_dir, 'dox++', 'system_includes.json')
+
+def get_libclang_version():
+    # The Python bindings don't expose `clang_getClangVersion()`, if calling it fails we use the name
+    # of the library file instead.
+    try:
+        func = cindex.conf.lib.clang_getClangVersion
+        func.restype = cindex._CXString
+        return cindex._CXString.from_result(func(), None, None)
+    except Exception:
+        return cindex.conf.get_filename()
+
+def get_system_includes(f, refresh=False):
+    # Returns the same as `probe_system_includes(f)`, but only runs `clang++` if we haven't done so before
+    # for the same `clang++` executable, libclang version and flags, or if `refresh` is True.
+    clang = shutil.which('clang++')
+    if not clang:
+        return probe_system_includes(f)  # Reports the error
+    key = json.dumps([os.path.realpath(clang), os.stat(clang).st_mtime, get_libclang_version(), f])
+    if not system_includes_cache:
+        try:
+            with open(get_system_includes_cache_file(), 'r') as cache_file:
+                system_includes_cache.update(json.load(cache_file))
+        except (OSError, ValueError):
+            pass
+    if not refresh and key in system_includes_cache:
+        paths, sysroot = system_includes_cache[key]
+        return paths, sysroot
+    paths, sysroot = probe_system_includes(f)
+    if not paths:
+        return paths, sysroot  # `clang++` failed, try again next time
+    system_includes_cache[key] = (paths, sysroot)
+    cache_file_name = get_system_includes_cache_file()
+    try:
+        os.makedirs(os.path.dirname(cache_file_name), exist_ok=True)
+        with open(cache_file_name + '.tmp', 'w') as cache_file:
+            json.dump(system_includes_cache, cache_file)
+        os.replace(cache_file_name + '.tmp', cache_file_name)
+    except OSError as e:
+        log.debug("Could not write system include cache file %s: %s", cache_file_name, str(e))
+    return paths, sysroot
+
 def load_libclang():
     from ctypes.util import find_library
 
@@ -14,6 +14,132 @@
 # this program; if not, write to the Free Software Foundation, Inc., 51
 # Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
+import collections.abc
+
+
+# --- Compact member records ---
+#
+# A project can have hundreds of thousands of members, each with 20 to 40 fields. Storing each as a
+# dictionary costs a lot of memory, because each dictionary has its own hash table of keys. A `Member`
+# instead stores only a list of values, and a reference to a `MemberShape` that holds the keys. Members
+# whose keys were added in the same order share the same shape (as do the "hidden classes" of JavaScript
+# engines). A `Member` behaves like a dictionary, and also allows reading fields as attributes.
+
+class MemberShape:
+    # The keys of a `Member`, in insertion order, and a map from key to index into its list of values.
+    # `transitions` maps each key to the shape with that key appended, so shapes are created only once.
+    __slots__ = ('keys', 'index', 'transitions')
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.index = {key: ii for ii, key in enumerate(keys)}
+        self.transitions = {}
+
+    def add(self, key):
+        shape = self.transitions.get(key)
+        if shape is None:
+            shape = MemberShape(self.keys + (key,))
+            self.transitions[key] = shape
+        return shape
+
+empty_shape = MemberShape(())
+
+def get_shape(keys):
+    shape = empty_shape
+    for key in keys:
+        shape = shape.add(key)
+    return shape
+
+class Member(collections.abc.MutableMapping):
+    __slots__ = ('_shape', '_values')
+
+    def __init__(self, items=()):
+        # `items` is a mapping or an iterable of (key, value) pairs
+        if isinstance(items, dict):
+            self._shape = get_shape(items)
+            self._values = list(items.values())
+            return
+        self._shape = empty_shape
+        self._values = []
+        if isinstance(items, collections.abc.Mapping):
+            items = items.items()
+        for key, value in items:
+            self[key] = value
+
+    def __getitem__(self, key):
+        return self._values[self._shape.index[key]]
+
+    def __setitem__(self, key, value):
+        ii = self._shape.index.get(key)
+        if ii is None:
+            self._shape = self._shape.add(key)
+            self._values.append(value)
+        else:
+            self._values[ii] = value
+
+    def __delitem__(self, key):
+        ii = self._shape.index[key]
+        del self._values[ii]
+        self._shape = get_shape(self._shape.keys[:ii] + self._shape.keys[ii + 1:])
+
+    def __contains__(self, key):
+        return key in self._shape.index
+
+    def __iter__(self):
+        return iter(self._shape.keys)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __eq__(self, other):
+        if isinstance(other, Member) and self._shape is other._shape:
+            return self._values == other._values
+        if isinstance(other, collections.abc.Mapping):
+            return dict(self) == dict(other)  # Like for dictionaries, the order of the keys doesn't matter
+        return NotImplemented
+
+    __hash__ = None
+
+    def __getattr__(self, name):
+        # Called only for names that are not attributes, so methods take precedence over fields
+        if not name.startswith('_'):
+            try:
+                return self[name]
+            except KeyError:
+                pass
+        raise AttributeError("'Member' object has no attribute '{}'".format(name))
+
+    def __repr__(self):
+        return 'Member({!r})'.format(dict(self))
+
+    def __reduce__(self):
+        return Member, (dict(self),)
+
+    def get(self, key, default=None):
+        ii = self._shape.index.get(key)
+        return default if ii is None else self._values[ii]
+
+    def copy(self):
+        member = Member()
+        member._shape = self._shape
+        member._values = self._values.copy()
+        return member
+
+def json_default(value):
+    # The `default` function for the JSON encoder, which encodes a `Member` as a dictionary
+    if isinstance(value, Member):
+        return dict(value)
+    raise TypeError('Object of type {} is not JSON serializable'.format(type(value).__name__))
+
+def json_object_hook(obj):
+    # The `object_hook` function for the JSON decoder, which turns each member into a `Member`
+    if 'member_type' in obj:
+        return Member(obj)
+    return obj
+
+
+# --- Creating new elements ---
+
 def basic(id, name='', brief='', doc=''):
     return {
         'id': id,
@@ -49,7 +175,7 @@ def new_member(id, name='', member_type='', parent='', header=''):
         'group': '',            # ID of the group it is in, if any
         'deprecated': False     # Set to True if marked 'deprecated'
     })
-    return member
+    return Member(member)
 
 def new_page(id, title, doc=''):
     return {
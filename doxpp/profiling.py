@@ -0,0 +1,91 @@
+# dox++
+# Copyright 2020, Cris Luengo
+#
+# This file is part of dox++.  dox++ is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+# Recording the time and memory used by each phase of dox++parse and dox++html, for their --profile option.
+
+import contextlib
+import csv
+import json
+import sys
+import time
+import tracemalloc
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+def get_max_rss():
+    # Returns the maximum resident set size of this process so far, in bytes, or None if not known
+    if not resource:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024  # Linux reports kilobytes
+
+class Profile:
+    # Records the wall time and memory use of each phase of a program. Each record is a dictionary with the
+    # name of the phase, the file it applies to (empty for phases that apply to all files), the wall time in
+    # seconds, and the maximum resident set size of the process at the end of the phase (in bytes, this
+    # number never goes down). If `tracemalloc` is tracing, we also record the peak memory allocated by
+    # Python during the phase. Phases can add other fields to their record, such as counts and sizes.
+    columns = ['phase', 'file', 'seconds', 'max_rss', 'python_peak']
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.records = []
+
+    @contextlib.contextmanager
+    def phase(self, name, file=''):
+        record = {'phase': name, 'file': file}
+        tracing = self.enabled and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            if self.enabled:
+                record['seconds'] = time.perf_counter() - start
+                record['max_rss'] = get_max_rss()
+                if tracing:
+                    record['python_peak'] = tracemalloc.get_traced_memory()[1]
+                self.records.append(record)
+
+    def add(self, record):
+        # Adds a record measured elsewhere (e.g. times accumulated over many small steps)
+        if self.enabled:
+            self.records.append(record)
+
+    def slowest(self, name, count=10):
+        # Returns the `count` records for phase `name` that took the longest
+        records = [r for r in self.records if r['phase'] == name]
+        return sorted(records, key=lambda r: r['seconds'], reverse=True)[:count]
+
+    def write(self, filename):
+        # Writes the records as CSV if `filename` ends in '.csv', as JSON otherwise. The CSV columns are
+        # the fixed ones, followed by the other fields in the order they first appear.
+        with open(filename, 'w', newline='') as f:
+            if filename.endswith('.csv'):
+                columns = list(self.columns)
+                for record in self.records:
+                    columns += [key for key in record if key not in columns]
+                writer = csv.DictWriter(f, fieldnames=columns, restval='')
+                writer.writeheader()
+                writer.writerows(self.records)
+            else:
+                json.dump(self.records, f, indent=2)
+
+no_profile = Profile(enabled=False)
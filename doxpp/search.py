@@ -25,8 +25,10 @@
 # Can't be in __init__.py because I can't say `from . import Trie` in
 # doxygen.py. But `from _search import bla` works. Ugh.
 
+import array
 import base64
 import enum
+import gc
 import struct
 from types import SimpleNamespace as Empty
 from typing import List, Tuple
@@ -204,6 +206,12 @@ class ResultMap:
                     # Expect we found something
                     assert max_prefix[1] != -1
 
+                    # The prefix length is stored in a byte, very long URLs
+                    # are stored verbatim
+                    if max_prefix[1] > 255:
+                        merged += [e]
+                        continue
+
                     # Save the entry with reference to the prefix
                     entry = Empty()
                     assert e.name.startswith(self.entries[longest_prefix.results[0]].name)
@@ -292,26 +300,32 @@ class Trie:
         self.results = []
         self.children = {}
 
+    # These methods walk the trie with a loop or an explicit stack rather than recursion, as the trie is
+    # as deep as the longest search key, which can exceed Python's recursion limit.
+
     def _insert(self, path: bytes, result, lookahead_barriers):
-        if not path:
-            self.results += [result]
-            return
-
-        char = path[0]
-        if not char in self.children:
-            self.children[char] = (False, Trie())
-        if lookahead_barriers and lookahead_barriers[0] == 0:
-            lookahead_barriers = lookahead_barriers[1:]
-            self.children[char] = (True, self.children[char][1])
-        self.children[char][1]._insert(path[1:], result, [b - 1 for b in lookahead_barriers])
+        node = self
+        barriers = iter(lookahead_barriers)
+        barrier = next(barriers, None)
+        for depth, char in enumerate(path):
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = (False, Trie())
+            if depth == barrier:
+                barrier = next(barriers, None)
+                child = node.children[char] = (True, child[1])
+            node = child[1]
+        node.results += [result]
 
     def insert(self, path: str, result, lookahead_barriers=[]):
         self._insert(path.encode('utf-8'), result, lookahead_barriers)
 
     def _sort(self, key):
-        self.results.sort(key=key)
-        for _, child in self.children.items():
-            child[1]._sort(key)
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node.results.sort(key=key)
+            stack += [child[1] for child in node.children.values()]
 
     def sort(self, result_map: ResultMap):
         # What the shit, why can't I just take two elements and say which one
@@ -339,12 +353,25 @@ class Trie:
 
     # Returns offset of the serialized thing in `output`
     def _serialize(self, hashtable, output: bytearray, merge_subtrees) -> int:
-        # Serialize all children first
-        child_offsets = []
-        for char, child in self.children.items():
-            offset = child[1]._serialize(hashtable, output, merge_subtrees=merge_subtrees)
-            child_offsets += [(char, child[0], offset)]
-
+        # Serialize all children first, in order, then the node itself. Each element of the stack is a
+        # node, an iterator over its children, the offsets of the children serialized so far, and the
+        # character and lookahead barrier of the edge leading to the node.
+        stack = [(self, iter(self.children.items()), [], None, None)]
+        while True:
+            node, children, child_offsets, char, lookahead_barrier = stack[-1]
+            edge = next(children, None)
+            if edge is not None:
+                child_char, (child_barrier, child) = edge
+                stack.append((child, iter(child.children.items()), [], child_char, child_barrier))
+                continue
+            offset = node._serialize_node(child_offsets, hashtable, output, merge_subtrees)
+            stack.pop()
+            if not stack:
+                return offset
+            stack[-1][2].append((char, lookahead_barrier, offset))
+
+    # Serializes this node, given the offsets of its children, returns its offset in `output`
+    def _serialize_node(self, child_offsets, hashtable, output: bytearray, merge_subtrees) -> int:
         # Serialize this node. Sometimes we'd have an insane amount of results
         # (such as Python's __init__), but very little children to go with
         # that. Then we can make the result count storage larger (11 bits,
@@ -391,6 +418,97 @@ class Trie:
         self.root_offset_struct.pack_into(output, 0, self._serialize(hashtable, output, merge_subtrees=merge_subtrees))
         return output
 
+def _common_prefix_length(a: bytes, b: bytes) -> int:
+    # Binary search, comparing slices is much faster than comparing one byte at a time
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[:middle] == b[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+class TrieBuilder:
+    # Collects the keys for a `Trie`, then builds it in one go. The result is the
+    # same as calling `Trie.insert()` for each key in the same order, so the
+    # serialized trie is identical, but the work done in Python is per key and per
+    # node rather than per character of each key.
+    #
+    # Once sorted, keys with a common prefix are next to each other, so each key
+    # is compared only to the previous one, and the nodes for the part after the
+    # common prefix are created. Equal keys stay in insertion order, which is the
+    # order of their results. For each node, indexed in order of creation, the
+    # parent, the character of the edge from the parent, and the first key (in
+    # insertion order) that goes through it, are stored in arrays. The children
+    # of each node are added in order of their first key, which is the order
+    # `Trie.insert()` would have added them in.
+
+    def __init__(self):
+        self.keys = []
+
+    def insert(self, path: str, result, lookahead_barriers=[]):
+        self.keys.append((path.encode('utf-8'), len(self.keys), result, lookahead_barriers))
+
+    def build(self) -> Trie:
+        parents = array.array('i', [-1])
+        chars = bytearray(1)
+        first_keys = array.array('i', [len(self.keys)])
+        barriers = set()  # Nodes with a lookahead barrier on the edge from their parent
+        ends = array.array('i')  # The node each key ends at, in sorted order
+        path = [0]  # Nodes along the previous key
+        previous = b''
+        self.keys.sort()  # The index makes the tuples unique, so results are never compared
+        for key, index, result, lookahead_barriers in self.keys:
+            if key.startswith(previous):
+                common = len(previous)
+            else:
+                common = _common_prefix_length(previous, key)
+                del path[common + 1:]
+            count = len(key) - common
+            if count:
+                # A chain of new nodes, each the parent of the next
+                start = len(chars)
+                parents.append(path[-1])
+                parents.extend(range(start, start + count - 1))
+                path += range(start, start + count)
+                chars += key[common:]
+                first_keys.extend([index] * count)
+            ends.append(path[-1])
+            # A node's first key is the first of those that go through it. They only
+            # get smaller towards the root, so we can stop at the first that is.
+            depth = common
+            while depth >= 0 and first_keys[path[depth]] > index:
+                first_keys[path[depth]] = index
+                depth -= 1
+
+            # A barrier applies to the edge leading to the node at one deeper than
+            # its position. `Trie.insert()` stops looking at barriers once one is
+            # out of order or past the end of the key.
+            depth = -1
+            for barrier in lookahead_barriers:
+                if barrier <= depth or barrier >= len(key):
+                    break
+                barriers.add(path[barrier + 1])
+                depth = barrier
+            previous = key
+
+        # The trie can't have reference cycles, but creating this many objects
+        # triggers the cyclic garbage collector over and over again
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            nodes = [Trie() for _ in range(len(chars))]
+            for node, key in zip(ends, self.keys):
+                nodes[node].results.append(key[2])
+            # Siblings have different first keys
+            for node in sorted(range(1, len(nodes)), key=first_keys.__getitem__):
+                nodes[parents[node]].children[chars[node]] = (node in barriers, nodes[node])
+        finally:
+            if gc_enabled:
+                gc.enable()
+        return nodes[0]
+
 #     type 1     |     type 2     |     |         |        | type 1 |
 # class |  name  | class |  name  | ... | padding |  end   |  name  | ...
 #   ID  | offset |   ID  | offset |     |         | offset |  data  |
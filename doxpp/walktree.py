@@ -15,8 +15,8 @@
 # Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
 import os
-import json
 
+from . import jsonfile
 from . import log
 
 
@@ -103,12 +103,6 @@ def build_file_hierarchy(headers, directories_first=True):
 
 # --- create_member_dict ---
 
-def create_member_dict_recursive(members, output):
-    for member in members:
-        output[member['id']] = member
-        if 'members' in member:
-            create_member_dict_recursive(member['members'], output)
-
 def create_member_dict(members):
     """
     Creates a dictionary that maps member IDs to the member data.
@@ -120,7 +114,17 @@ def create_member_dict(members):
         'id': '',
         'members': members
     }
-    create_member_dict_recursive(members, output)
+    # Walk the tree in pre-order with an explicit stack, rather than recursion, so that deeply nested
+    # members don't hit Python's recursion limit
+    stack = [iter(members)]
+    while stack:
+        member = next(stack[-1], None)
+        if member is None:
+            stack.pop()
+            continue
+        output[member['id']] = member
+        if 'members' in member:
+            stack.append(iter(member['members']))
     return output
 
 def create_element_dict(elements):
@@ -144,5 +148,4 @@ def load_data_from_json_file(filename):
     :param filename: name of JSON file to read data from
     :return: dictionary with data as described in `json_output.md`
     """
-    with open(filename, 'r') as input_file:
-        return json.loads(input_file.read())
+    return jsonfile.read_data_from_json_file(filename)
@@ -0,0 +1,268 @@
+#! /usr/bin/env python3
+
+# Measures how dox++ scales with the size of the project. Generates a synthetic project at several sizes,
+# and for each one times `buildtree()`, `createhtml()` and `build_search_data()`, reporting throughput and
+# memory use. Each size is measured in a separate process, so that the maximum resident set size applies
+# to that size only. Needs only libclang, the generated headers don't include any system headers.
+#
+# It also reports the memory needed to hold each member when the JSON file is loaded, using plain
+# dictionaries and using `members.Member` objects.
+#
+# Run with `--help` to see the parameters of the synthetic project. `--sizes` multiplies the number of
+# namespaces (and therefore the number of header files) and of pages. `--output` writes the results as JSON.
+# `--reopened` instead multiplies the number of header files that a single namespace is divided over,
+# keeping the number of classes per header file constant; this measures the cost of merging the namespace
+# as it is declared again in each file.
+
+import sys, os, inspect
+import argparse
+import concurrent.futures
+import json
+import multiprocessing
+import random
+import tempfile
+import time
+import tracemalloc
+
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+import doxpp
+import doxpp.buildtree
+import doxpp.config
+import doxpp.createhtml
+import doxpp.jsonfile
+import doxpp.members
+import doxpp.profiling
+import doxpp.walktree
+
+sys.path.insert(0, currentdir)
+from support import html_options
+
+
+default_parameters = {
+    'namespaces': 4,
+    'headers': 1,           # per namespace, its classes are divided over these
+    'classes': 10,          # per namespace
+    'overloads': 3,         # of each method and free function
+    'template_depth': 1,    # levels of nested class templates in each class
+    'doc_length': 4,        # sentences in each documentation comment
+    'ref_density': 0.25,    # probability of a sentence containing a `\ref`
+    'groups': 4,
+    'pages': 4,
+    'seed': 0
+}
+
+words = ['the', 'value', 'returns', 'object', 'computes', 'a', 'given', 'input', 'image', 'filter', 'size',
+         'of', 'is', 'used', 'to', 'with', 'each', 'element', 'result', 'parameter', 'option', 'default']
+
+
+# --- Generating the synthetic project ---
+
+class Generator:
+    # Writes the headers and Markdown files for one synthetic project. All names are known in advance,
+    # so that documentation can reference any of them.
+    def __init__(self, parameters):
+        self.p = parameters
+        self.random = random.Random(parameters['seed'])
+        self.namespaces = ['ns{}'.format(n) for n in range(parameters['namespaces'])]
+        self.classes = ['{}::Class{}'.format(ns, c) for ns in self.namespaces for c in range(parameters['classes'])]
+        self.groups = ['group{}'.format(g) for g in range(parameters['groups'])]
+        self.pages = ['page{}'.format(p) for p in range(parameters['pages'])]
+
+    def sentence(self):
+        text = ' '.join(self.random.choice(words) for _ in range(8)).capitalize()
+        if self.random.random() < self.p['ref_density']:
+            text += ', see \\ref ' + self.random.choice(self.classes + self.pages)
+        return text + '.'
+
+    def documentation(self, indent, brief):
+        # A brief description, and then the rest of the documentation in one paragraph
+        lines = ['/// ' + brief]
+        if self.p['doc_length'] > 1:
+            lines += ['///'] + ['/// ' + self.sentence() for _ in range(self.p['doc_length'] - 1)]
+        return [indent + line for line in lines]
+
+    def overloads(self, indent, name, result):
+        lines = []
+        for o in range(self.p['overloads']):
+            lines += self.documentation(indent, 'Overload {} of `{}`.'.format(o, name))
+            params = ', '.join('int arg{}'.format(a) for a in range(o))
+            lines.append('{}{} {}({});'.format(indent, result, name, params))
+        return lines
+
+    def class_body(self, indent, name, depth):
+        lines = ['{}   public:'.format(indent)]
+        lines += self.documentation(indent + '      ', 'Constructs a `{}`.'.format(name))
+        lines.append('{}      {}();'.format(indent, name))
+        lines += self.overloads(indent + '      ', 'compute', 'double')
+        lines += self.documentation(indent + '      ', 'The size.')
+        lines.append('{}      int size = 0;'.format(indent))
+        if depth > 0:
+            nested = 'Nested{}'.format(depth)
+            lines += self.documentation(indent + '      ', 'A nested class template.')
+            lines.append('{}      template <typename T{}>'.format(indent, depth))
+            lines.append('{}      class {} {{'.format(indent, nested))
+            lines += self.class_body(indent + '      ', nested, depth - 1)
+            lines.append('{}      }};'.format(indent))
+        return lines
+
+    def header(self, n, part):
+        # Part `part` of namespace `n`, the namespace is documented in the first part only
+        ns = self.namespaces[n]
+        lines = ['/// \\file', '/// The declarations in namespace `{}`.'.format(ns), '', '#pragma once', '']
+        if part == 0:
+            lines.append('/// A namespace.')
+        lines += ['namespace {} {{'.format(ns), '']
+        for c in range(part, self.p['classes'], self.p['headers']):
+            name = 'Class{}'.format(c)
+            lines += self.documentation('', 'Class number {}.'.format(c))
+            if self.groups:
+                lines.append('/// \\ingroup ' + self.groups[(n * self.p['classes'] + c) % len(self.groups)])
+            if self.p['template_depth'] > 0:
+                lines.append('template <typename T>')
+            lines.append('class {} {{'.format(name))
+            lines += self.class_body('', name, self.p['template_depth'] - 1)
+            lines += ['};', '']
+            lines += self.overloads('', 'process{}'.format(c), 'void')
+            lines.append('')
+        lines += ['}} // namespace {}'.format(ns), '']
+        return '\n'.join(lines)
+
+    def markdown(self):
+        lines = []
+        for g, group in enumerate(self.groups):
+            lines += ['\\group {} Group number {}'.format(group, g), '']
+            lines += [self.sentence() for _ in range(self.p['doc_length'])] + ['', '']
+        lines += ['\\mainpage The synthetic project', '']
+        lines += ['- \\subpage ' + page for page in self.pages] + ['', '']
+        for p, page in enumerate(self.pages):
+            lines += ['\\comment ----', '', '\\page {} Page number {}'.format(page, p), '']
+            for section in range(3):
+                lines += ['\\section {}_section{} Section {}'.format(page, section, section), '']
+                lines += [self.sentence() for _ in range(self.p['doc_length'])] + ['']
+            lines.append('')
+        return '\n'.join(lines)
+
+    def write(self, directory):
+        # Returns the lists of header files and Markdown files written
+        headers = []
+        for n in range(len(self.namespaces)):
+            for part in range(self.p['headers']):
+                name = self.namespaces[n] + ('_{}'.format(part) if self.p['headers'] > 1 else '')
+                headers.append(os.path.join(directory, name + '.h'))
+                with open(headers[-1], 'w') as f:
+                    f.write(self.header(n, part))
+        markdown_files = [os.path.join(directory, 'pages.md')]
+        with open(markdown_files[0], 'w') as f:
+            f.write(self.markdown())
+        return headers, markdown_files
+
+def generate_project(directory, **parameters):
+    """
+    Writes a synthetic project to `directory`. See `default_parameters` for the parameters.
+    :return: the lists of header files and Markdown files written
+    """
+    return Generator({**default_parameters, **parameters}).write(directory)
+
+
+# --- Timing ---
+
+def member_memory(json_file, object_hook):
+    # Returns the memory used by the data in `json_file` when loaded with `object_hook`, per member
+    with open(json_file) as f:
+        text = f.read()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        data = json.loads(text, object_hook=object_hook)
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return size / len(doxpp.walktree.create_member_dict(data['members']))
+
+def measure(parameters):
+    """
+    Generates a synthetic project with `parameters`, and runs dox++parse and dox++html on it.
+    :return: dictionary with the size of the project, the time taken by each step, and memory use
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        headers, markdown_files = generate_project(directory, **parameters)
+        result = {'parameters': parameters, 'headers': len(headers)}
+        result['source_bytes'] = sum(os.path.getsize(f) for f in headers + markdown_files)
+
+        options = {'code_formatting': 'no', 'tab_size': 4}
+        start = time.perf_counter()
+        data = doxpp.buildtree.buildtree(directory, ' '.join(headers), ' '.join(markdown_files),
+                                         '-std=c++11', '', options)
+        result['buildtree_seconds'] = time.perf_counter() - start
+        result['buildtree_max_rss'] = doxpp.profiling.get_max_rss()
+        result['members'] = len(doxpp.walktree.create_member_dict(data['members']))
+
+        json_file = os.path.join(directory, 'dox++out.json')
+        doxpp.jsonfile.write_data_to_json_file(data, json_file)
+        del data
+        result['dict_bytes_per_member'] = member_memory(json_file, None)
+        result['record_bytes_per_member'] = member_memory(json_file, doxpp.members.json_object_hook)
+
+        html_dir = os.path.join(directory, 'html')
+        os.makedirs(html_dir)
+        options, template_params = html_options(doxpp.config.read(''), directory)
+        options['profile'] = doxpp.profiling.Profile()
+        start = time.perf_counter()
+        doxpp.createhtml.createhtml(json_file, html_dir, options, template_params)
+        result['createhtml_seconds'] = time.perf_counter() - start
+        result['createhtml_max_rss'] = doxpp.profiling.get_max_rss()
+        result['pages'] = len([r for r in options['profile'].records if r['phase'] == 'render_page'])
+        search = [r for r in options['profile'].records if r['phase'] == 'build_search_data'][0]
+        result['search_seconds'] = search['seconds']
+        result['search_symbols'] = search['count']
+        result['search_bytes'] = search['bytes']
+    return result
+
+def run(parameters):
+    # Runs `measure()` in a new process
+    context = multiprocessing.get_context('spawn')
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(measure, parameters).result()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='dox++ scaling benchmark.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help='multipliers for the number of namespaces and pages')
+    parser.add_argument('--reopened', action='store_true',
+                        help='multiply the number of headers a namespace is divided over instead')
+    for key, value in default_parameters.items():
+        parser.add_argument('--' + key.replace('_', '-'), type=type(value), default=value)
+    parser.add_argument('--output', help='write the results to this JSON file')
+    args = parser.parse_args()
+
+    doxpp.log.setLevel('error')
+    mb = 1 / (1 << 20)
+    print('{:>5} {:>8} {:>8} | {:>9} {:>10} {:>8} | {:>9} {:>8} {:>8} | {:>9} {:>8} | {:>8} {:>8}'.format(
+        'size', 'headers', 'members', 'parse (s)', 'members/s', 'RSS (MB)',
+        'html (s)', 'pages/s', 'RSS (MB)', 'search (s)', 'symbols', 'dict B/m', 'Member B/m'))
+    results = []
+    for size in args.sizes:
+        parameters = {key: getattr(args, key) for key in default_parameters}
+        if args.reopened:
+            parameters['headers'] *= size
+            parameters['classes'] *= size
+        else:
+            parameters['namespaces'] *= size
+            parameters['pages'] *= size
+        result = run(parameters)
+        result['size'] = size
+        results.append(result)
+        print('{:>5} {:>8} {:>8} | {:>9.2f} {:>10.0f} {:>8.0f} | {:>9.2f} {:>8.1f} {:>8.0f} | {:>9.3f} {:>8} | {:>8.0f} {:>8.0f}'.format(
+            size, result['headers'], result['members'],
+            result['buildtree_seconds'], result['members'] / result['buildtree_seconds'],
+            (result['buildtree_max_rss'] or 0) * mb,
+            result['createhtml_seconds'], result['pages'] / result['createhtml_seconds'],
+            (result['createhtml_max_rss'] or 0) * mb,
+            result['search_seconds'], result['search_symbols'],
+            result['dict_bytes_per_member'], result['record_bytes_per_member']), flush=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
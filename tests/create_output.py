@@ -8,6 +8,7 @@ parentdir = os.path.dirname(currentdir)
 sys.path.insert(0, parentdir)
 import doxpp
 import doxpp.buildtree
+import doxpp.members
 
 
 options = {
@@ -29,4 +30,4 @@ for file in glob.glob(os.path.join(currentdir, 'input', '*')):
         continue
     data = doxpp.buildtree.buildtree(os.path.join(currentdir, 'input'), h_file, md_file, '-std=c++11', '', options)
     with open(json_file, 'w') as output_file:
-        output_file.write(json.dumps(data, indent=2))
+        output_file.write(json.dumps(data, indent=2, default=doxpp.members.json_default))
@@ -0,0 +1,52 @@
+#! /usr/bin/env python3
+
+# Counts the number of calls into libclang made while parsing each of the test input files.
+# Calls through ctypes are expensive, this helps find where we make too many of them.
+# Run with `-v` to see the most frequently called functions.
+
+import sys, os, inspect, glob
+import collections
+
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+import doxpp
+import doxpp.buildtree
+
+cindex = doxpp.buildtree.cindex
+
+
+counts = collections.Counter()
+
+def counting(name, func):
+    def wrapper(*args):
+        counts[name] += 1
+        return func(*args)
+    return wrapper
+
+lib = cindex.conf.lib
+for item in cindex.functionList:
+    func = getattr(lib, item[0], None)
+    if func is not None:
+        setattr(lib, item[0], counting(item[0], func))
+
+
+options = {
+    'code_formatting': 'no',
+    'tab_size': 4
+}
+
+# Run once to make sure the system include directories are cached
+doxpp.buildtree.buildtree(os.path.join(currentdir, 'input'), '', '', '-std=c++11', '', options)
+
+total = collections.Counter()
+for file in sorted(glob.glob(os.path.join(currentdir, 'input', '*.h'))):
+    counts.clear()
+    doxpp.buildtree.buildtree(os.path.join(currentdir, 'input'), file, '', '-std=c++11', '', options)
+    print('{:>30}: {:>8} calls'.format(os.path.basename(file), sum(counts.values())))
+    total.update(counts)
+print('{:>30}: {:>8} calls'.format('total', sum(total.values())))
+
+if '-v' in sys.argv:
+    for name, count in total.most_common(20):
+        print('{:>30}: {:>8}'.format(name, count))
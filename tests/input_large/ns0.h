@@ -0,0 +1,1197 @@
+/// \file
+/// The declarations in namespace `ns0`.
+
+#pragma once
+
+/// A namespace.
+namespace ns0 {
+
+/// Class number 0.
+///
+/// Default value each object each given is of.
+/// Filter result computes parameter image object image used.
+/// Image object size filter the result parameter given.
+/// \ingroup group0
+template <typename T>
+class Class0 {
+   public:
+      /// Constructs a `Class0`.
+      ///
+      /// Given object element to is returns object used, see \ref page1.
+      /// Used is to default filter result each a.
+      /// Used input element result object given is given, see \ref page4.
+      Class0();
+      /// Overload 0 of `compute`.
+      ///
+      /// With object element to the to with parameter, see \ref ns2::Class6.
+      /// Each with of used element a the input, see \ref ns2::Class5.
+      /// Is to object default option image computes with, see \ref ns2::Class1.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Filter a to to filter filter default value, see \ref ns1::Class7.
+      /// Default used object to returns to each to.
+      /// The a used option image returns returns computes, see \ref ns1::Class6.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// To object given parameter with default returns used.
+      /// Option computes the is parameter option filter option.
+      /// Result element result of image given image each.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// The image option given returns given filter each.
+      /// Each computes size each image element filter option.
+      /// Each filter option each result used with value.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Input computes value to object each result object, see \ref ns2::Class5.
+      /// Is default size size of a to size.
+      /// Object option default default each to used parameter, see \ref ns1::Class11.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Returns size used of to result of value, see \ref ns1::Class5.
+            /// Returns input is value a a with default.
+            /// Object parameter each returns value result used value.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Computes parameter size input element element value image, see \ref ns1::Class3.
+            /// Filter object result to computes returns to filter.
+            /// Result input of object default input image computes.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Element input element to filter value result to, see \ref ns1::Class0.
+            /// Parameter returns with computes is each image with.
+            /// To value each used the result input default.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Input object is used option computes element input, see \ref ns0::Class11.
+            /// Parameter with returns image is to result returns.
+            /// The input returns image input with a each.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// To used the computes object a used the, see \ref ns2::Class7.
+            /// Parameter size input filter a returns element filter, see \ref ns0::Class4.
+            /// Value default returns element to returns value returns.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process0`.
+///
+/// With filter of size image computes object parameter, see \ref ns1::Class11.
+/// A object option size with of image option.
+/// Element option result given value parameter a image.
+void process0();
+/// Overload 1 of `process0`.
+///
+/// Is size the given element with returns the.
+/// With input default parameter a a a option.
+/// Element returns given image object a option with.
+void process0(int arg0);
+/// Overload 2 of `process0`.
+///
+/// Each used given element returns parameter each used.
+/// Given size each computes option default result given.
+/// Value image filter used to a element returns.
+void process0(int arg0, int arg1);
+
+/// Class number 1.
+///
+/// Is each the result parameter option default to.
+/// Each default result image to is result size, see \ref ns0::Class8.
+/// Element element is computes value is parameter given, see \ref ns0::Class6.
+/// \ingroup group1
+template <typename T>
+class Class1 {
+   public:
+      /// Constructs a `Class1`.
+      ///
+      /// Returns of default computes with is of option, see \ref page1.
+      /// With value computes element the default with a.
+      /// To computes image computes filter size filter each.
+      Class1();
+      /// Overload 0 of `compute`.
+      ///
+      /// Filter parameter is is default the input element.
+      /// Of a given the computes default parameter value.
+      /// Returns of each size with option of element.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// To with returns returns result of of computes, see \ref ns0::Class9.
+      /// Of image each is with size a size.
+      /// Result each value used to image option each.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Option returns to returns size with value each, see \ref page1.
+      /// Given of computes element parameter is to image.
+      /// Default size a element element input with default, see \ref ns2::Class5.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Result given size image parameter filter the of.
+      /// Size each computes default a element object to.
+      /// Image of image result filter image image default, see \ref ns0::Class4.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Of parameter each of the default used filter.
+      /// To a with to input size with filter, see \ref ns1::Class3.
+      /// Of object of to returns default input to.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Parameter computes object image used is default used.
+            /// Object object size object given size each computes.
+            /// Default computes parameter is element with filter size.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Default computes to with with option the element.
+            /// Parameter option computes used option used each value.
+            /// Returns each returns element given size element element.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Result of a used input given default a.
+            /// To a parameter with to returns to with.
+            /// Result parameter input to object option the with, see \ref ns2::Class9.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Computes default of of of the to filter, see \ref page2.
+            /// Size to given filter object input to with.
+            /// Each element used of of size result computes.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Object parameter with input with of the a.
+            /// Returns is is used the of a returns.
+            /// Value of default input result with is of.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process1`.
+///
+/// Object filter given size returns the default to, see \ref ns0::Class6.
+/// Object size filter computes returns image given filter.
+/// Object element object element with filter element each.
+void process1();
+/// Overload 1 of `process1`.
+///
+/// Returns element with the with the the parameter, see \ref ns1::Class0.
+/// Default default parameter option filter used with object, see \ref ns1::Class0.
+/// The given element parameter computes filter filter to.
+void process1(int arg0);
+/// Overload 2 of `process1`.
+///
+/// Default element filter of image given returns is.
+/// Used computes returns given parameter used option given.
+/// Object parameter of the used is result computes.
+void process1(int arg0, int arg1);
+
+/// Class number 2.
+///
+/// A object size computes each filter to computes.
+/// Computes given is with size with image filter.
+/// Input default each input option is input option, see \ref ns0::Class11.
+/// \ingroup group2
+template <typename T>
+class Class2 {
+   public:
+      /// Constructs a `Class2`.
+      ///
+      /// Size option of of is result used given.
+      /// Object option filter computes filter size size a.
+      /// Object parameter given input element used used result, see \ref page1.
+      Class2();
+      /// Overload 0 of `compute`.
+      ///
+      /// Size value result value option size element result.
+      /// Of filter filter given with a computes of, see \ref ns2::Class5.
+      /// Input size option computes result default filter is.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Of default parameter computes is used image the, see \ref page2.
+      /// Image each result object returns returns given value.
+      /// To element size is option option a given.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Computes a image used parameter option default object.
+      /// Each returns input returns the with with parameter.
+      /// With a to a to each a option.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Element of element given used to input a.
+      /// Option given computes filter to the image each.
+      /// With image returns default computes filter used each.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Each input element is element result given input.
+      /// Default each is a input a a given, see \ref ns0::Class8.
+      /// Image computes of default filter returns each size.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// A a each image given returns used given.
+            /// Element input default each parameter is option the, see \ref ns2::Class7.
+            /// A filter is filter value computes image default.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Computes used used size option each of element, see \ref ns2::Class6.
+            /// Filter computes image input of filter to used.
+            /// Object to a option a default the element.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Each image given used object the to option.
+            /// Is returns returns image result a to returns.
+            /// Returns size filter to input size a result.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Given given the image option computes of computes, see \ref ns2::Class7.
+            /// To filter result filter used result given a.
+            /// Element is element size each used object result.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Parameter result size to is to computes computes.
+            /// Parameter used returns each value each image the.
+            /// Element the filter object the image size to.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process2`.
+///
+/// Computes filter to to default parameter size default.
+/// Size size computes with object size each filter.
+/// The of each the used with value filter, see \ref ns2::Class5.
+void process2();
+/// Overload 1 of `process2`.
+///
+/// Of a computes is parameter element input image.
+/// Parameter computes value element result the with with.
+/// To option parameter returns value size default value.
+void process2(int arg0);
+/// Overload 2 of `process2`.
+///
+/// Value is result default input parameter used object.
+/// Element option a filter image a parameter given, see \ref ns2::Class1.
+/// Object image to input a used option each, see \ref ns2::Class9.
+void process2(int arg0, int arg1);
+
+/// Class number 3.
+///
+/// With with image to computes a input image.
+/// A a option used size computes computes each, see \ref ns1::Class8.
+/// Each is filter is size default element input.
+/// \ingroup group3
+template <typename T>
+class Class3 {
+   public:
+      /// Constructs a `Class3`.
+      ///
+      /// Default element of is result used the default.
+      /// Parameter each returns object computes of option computes.
+      /// Element returns to size object the with element.
+      Class3();
+      /// Overload 0 of `compute`.
+      ///
+      /// To a used each value with given image.
+      /// Default of result image parameter result filter value.
+      /// Option option given filter returns each filter default, see \ref ns2::Class2.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Option to input result filter used image filter.
+      /// Used is a value option object element the, see \ref ns0::Class8.
+      /// Size returns to object with given computes parameter, see \ref ns1::Class10.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Result image computes computes option element of used, see \ref ns0::Class7.
+      /// Each to image size input size is each.
+      /// Image used result result computes is filter returns.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Each with a with object used parameter result, see \ref ns2::Class3.
+      /// With option given each returns parameter of result.
+      /// Each a size value each to option image, see \ref ns1::Class2.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Object result option option result with the with.
+      /// Element filter a given the filter parameter with.
+      /// Default filter option given input input each filter.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Option used each used option used computes value, see \ref page0.
+            /// Option element image to computes option input result.
+            /// A object used input a used the returns.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Used default option computes option result option computes.
+            /// Input result each option element value parameter image.
+            /// Value filter image parameter result each given given.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// To default used computes given filter with with.
+            /// Of input used element parameter result a returns, see \ref ns0::Class8.
+            /// The result result element size used used of, see \ref ns0::Class1.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// To computes filter used parameter result input given.
+            /// Value computes with default filter the object filter.
+            /// Input size object filter result default returns input.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Image value default input filter the of result, see \ref ns0::Class2.
+            /// Given with used returns result the the image, see \ref ns2::Class2.
+            /// Default is with size computes element the image.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process3`.
+///
+/// The size image result result a image input.
+/// Filter the size a element default element result.
+/// Value result default object is a of default.
+void process3();
+/// Overload 1 of `process3`.
+///
+/// Used result used given used to with filter.
+/// Option is default to with used value to.
+/// Default filter input the image result returns is.
+void process3(int arg0);
+/// Overload 2 of `process3`.
+///
+/// Element value parameter a a value of given, see \ref ns1::Class10.
+/// Used value image is filter to filter of.
+/// Is value computes each is given the the.
+void process3(int arg0, int arg1);
+
+/// Class number 4.
+///
+/// Returns given size computes option result option value.
+/// Option image option to default returns object to, see \ref ns0::Class4.
+/// Each size used the is value size size.
+/// \ingroup group4
+template <typename T>
+class Class4 {
+   public:
+      /// Constructs a `Class4`.
+      ///
+      /// To returns returns to used computes computes object, see \ref ns2::Class7.
+      /// Returns to computes with used parameter with with.
+      /// Given input result image computes option parameter result.
+      Class4();
+      /// Overload 0 of `compute`.
+      ///
+      /// Given with returns computes a with option a.
+      /// A value with with element object option filter.
+      /// Returns element of default input image default computes.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Filter is computes to element default object default, see \ref ns2::Class7.
+      /// Given to to image value given object filter, see \ref ns2::Class1.
+      /// To element the given each result option to.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Object of the result value each result computes, see \ref ns2::Class6.
+      /// Object element given each returns used to a.
+      /// A input object the returns returns each returns, see \ref ns0::Class8.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Result filter used given computes computes image default.
+      /// Input element value input element each default a, see \ref ns0::Class8.
+      /// Given computes with returns is of result input.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Is with a option to value result parameter.
+      /// Element a of used filter parameter value given, see \ref page3.
+      /// With parameter a default element parameter result each, see \ref ns2::Class2.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Image element used option a a to parameter.
+            /// Returns input default object given a a default.
+            /// Image the each filter image input returns filter.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// To with a element returns object element size.
+            /// Image returns a the result image returns input.
+            /// Element a option input to size object parameter.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Given to a computes filter value computes size.
+            /// Is the object given filter parameter used used.
+            /// With returns is to result image parameter result.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Input input result result option with value filter, see \ref ns0::Class0.
+            /// Result input element with image computes size each.
+            /// Value parameter with of each input default given.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Computes used a computes parameter result object to.
+            /// To given used parameter is to computes used.
+            /// Computes input each object is a given size, see \ref ns1::Class11.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process4`.
+///
+/// Returns image computes computes image the size option.
+/// Used used size filter of input parameter image, see \ref ns1::Class3.
+/// With element default filter computes to parameter image.
+void process4();
+/// Overload 1 of `process4`.
+///
+/// Given size the object parameter a element with.
+/// Of option filter object default used input value, see \ref page3.
+/// Used option default result returns the computes computes.
+void process4(int arg0);
+/// Overload 2 of `process4`.
+///
+/// Option result computes result parameter element is size.
+/// Size to default element size a each used, see \ref ns0::Class9.
+/// Given filter image value computes given filter size.
+void process4(int arg0, int arg1);
+
+/// Class number 5.
+///
+/// Given given returns each each default parameter a.
+/// Default a computes each value of object object.
+/// Given of option value image element computes returns, see \ref ns1::Class2.
+/// \ingroup group0
+template <typename T>
+class Class5 {
+   public:
+      /// Constructs a `Class5`.
+      ///
+      /// Filter option given a image image image to.
+      /// Image size option option value a of computes, see \ref ns1::Class10.
+      /// Used each object option given image of the.
+      Class5();
+      /// Overload 0 of `compute`.
+      ///
+      /// Image element of default of of used computes.
+      /// Size computes input computes element size image computes, see \ref ns0::Class10.
+      /// With result of with size of computes parameter.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Each image parameter parameter is with is value.
+      /// Of object with image with element computes value.
+      /// Used returns a used parameter of is to, see \ref ns2::Class9.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// The a element parameter with object element option.
+      /// With result used object image of of is.
+      /// Returns result given the size with a computes, see \ref page3.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// A size size to filter a returns size.
+      /// Filter to parameter given returns element each default.
+      /// Option to given parameter object result filter of.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Returns object image a computes the is a.
+      /// Filter object used given used object to parameter.
+      /// Option given each result to filter is is.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Returns input element given image with with element.
+            /// Value each result a the with option used.
+            /// Is filter image parameter each input with result.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Computes element with option image the computes with, see \ref page4.
+            /// Value default value used the a returns the, see \ref ns1::Class11.
+            /// Default default element object is returns computes to.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Default computes returns input a parameter input object, see \ref ns0::Class5.
+            /// Each input element to used a result with.
+            /// A value filter image is a parameter of.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Parameter with to the returns result object element.
+            /// Default size option of to object used size, see \ref ns0::Class11.
+            /// Used image returns with default with computes used.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Filter input option given given computes each size, see \ref ns1::Class11.
+            /// Computes used given image of the object returns.
+            /// Element value size each of used input size, see \ref ns1::Class1.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process5`.
+///
+/// Result image object option size default is filter.
+/// Of each element used is element the filter, see \ref page1.
+/// Computes object option the given filter filter default.
+void process5();
+/// Overload 1 of `process5`.
+///
+/// Given input given is a default value computes.
+/// Each of element is filter element default given.
+/// The element value option computes option each computes, see \ref ns0::Class11.
+void process5(int arg0);
+/// Overload 2 of `process5`.
+///
+/// Parameter with filter is result result size of, see \ref ns0::Class0.
+/// Each computes object to of option option input.
+/// Input input value value input computes image result.
+void process5(int arg0, int arg1);
+
+/// Class number 6.
+///
+/// Result used value each filter default object size.
+/// To given given element element is size filter, see \ref ns1::Class6.
+/// A input object given of given size given.
+/// \ingroup group1
+template <typename T>
+class Class6 {
+   public:
+      /// Constructs a `Class6`.
+      ///
+      /// Default parameter each to filter a a image.
+      /// Size used image returns input of object is.
+      /// Size returns element is to option image given, see \ref ns0::Class4.
+      Class6();
+      /// Overload 0 of `compute`.
+      ///
+      /// Result input a result default given size to.
+      /// Size image of input of input image given.
+      /// Default object filter parameter given computes element of, see \ref page0.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Given element is each parameter the default size.
+      /// Computes is of returns image with to computes.
+      /// Computes is result returns a a result given, see \ref page1.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Given with returns object input size default element.
+      /// Each parameter option value a to is is.
+      /// Image is object object input result default image.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Object object used element the option element object.
+      /// Used the a is option a is given.
+      /// Value size element each input filter computes value, see \ref ns2::Class2.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Size returns with default object default default with, see \ref ns2::Class9.
+      /// Used returns value used image object the the.
+      /// Computes object input used element a default result, see \ref ns1::Class9.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// A a image to input a with the.
+            /// With each with object input to result of.
+            /// Value filter to result value image returns size, see \ref ns1::Class4.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Image size returns a parameter is of default.
+            /// Of default input used the to image value.
+            /// Returns to given result value the given computes.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Parameter returns given option image size value object, see \ref ns2::Class7.
+            /// Used a image object input size value image, see \ref ns1::Class11.
+            /// Input element with value result returns value returns, see \ref ns1::Class8.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// A result filter each option option object the.
+            /// Size each parameter each element option returns result.
+            /// Used computes size image returns the input value.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// The returns filter result the filter size parameter, see \ref ns2::Class7.
+            /// The image of used filter is filter result, see \ref ns0::Class0.
+            /// Used of returns parameter object value default parameter.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process6`.
+///
+/// The with value computes computes the is used.
+/// Object element option object object result result input, see \ref ns1::Class0.
+/// A size to parameter image the with the, see \ref ns0::Class4.
+void process6();
+/// Overload 1 of `process6`.
+///
+/// Size used size is used each size a.
+/// Given result with returns the is the image.
+/// Size returns parameter image with parameter the computes, see \ref ns1::Class9.
+void process6(int arg0);
+/// Overload 2 of `process6`.
+///
+/// Each filter image of each with is default.
+/// Computes is the to used result computes a, see \ref ns2::Class11.
+/// Object input result returns option a each the, see \ref ns2::Class2.
+void process6(int arg0, int arg1);
+
+/// Class number 7.
+///
+/// Element returns a a filter to object image.
+/// Size input each used image default value default.
+/// Result size size element computes filter image image.
+/// \ingroup group2
+template <typename T>
+class Class7 {
+   public:
+      /// Constructs a `Class7`.
+      ///
+      /// Parameter result option filter computes of object to.
+      /// Option with image image option of default of.
+      /// The of each each input value to default.
+      Class7();
+      /// Overload 0 of `compute`.
+      ///
+      /// Element image element a is of value with.
+      /// Object size input object a value the is.
+      /// A filter filter value parameter returns given value.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Used given the to returns returns returns with.
+      /// Computes filter returns with default with a given, see \ref ns2::Class6.
+      /// Object the size value given each element option.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// With is result with the the object a, see \ref ns0::Class11.
+      /// Computes result default computes image element with of.
+      /// Default to filter returns value used default of.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Used option parameter result size of element element, see \ref ns1::Class10.
+      /// Filter with to option the of image object.
+      /// Result option value to result filter of used.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Option result object object the of parameter filter.
+      /// A with parameter a with given to of.
+      /// Result with used with given is a option.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Used size parameter value option value input a, see \ref ns1::Class9.
+            /// Returns default input value value returns given given.
+            /// Given used the object used result object of, see \ref ns2::Class5.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Input size size of option input input computes.
+            /// Element result of with given of with value.
+            /// Returns used filter option of returns each object.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Result returns filter filter default image result image, see \ref ns0::Class9.
+            /// Value with with result to used parameter a.
+            /// Element parameter given parameter default a used to.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// With each of given default image element parameter.
+            /// A with to size value given a is.
+            /// Each the size input object filter of computes.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Each size used option computes size to default.
+            /// Given given used computes input option the returns.
+            /// Element result filter image value of the returns, see \ref ns2::Class1.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process7`.
+///
+/// Filter object each computes result used of option, see \ref page5.
+/// Image to image option size computes parameter filter.
+/// Input parameter image to element used of returns.
+void process7();
+/// Overload 1 of `process7`.
+///
+/// Result parameter result used returns size value the, see \ref ns2::Class6.
+/// Result size default element element given object a, see \ref ns0::Class9.
+/// Returns object returns computes parameter returns the computes.
+void process7(int arg0);
+/// Overload 2 of `process7`.
+///
+/// Default used returns is image is each returns.
+/// Object the to filter image a value input, see \ref ns1::Class0.
+/// Size value object option used used option parameter.
+void process7(int arg0, int arg1);
+
+/// Class number 8.
+///
+/// Element returns used each size filter object default.
+/// Object used input parameter returns returns value given, see \ref ns1::Class5.
+/// The computes filter option input default parameter size.
+/// \ingroup group3
+template <typename T>
+class Class8 {
+   public:
+      /// Constructs a `Class8`.
+      ///
+      /// A object of given given used computes used, see \ref ns2::Class10.
+      /// Input a of is input returns used option.
+      /// The returns of a element result returns filter.
+      Class8();
+      /// Overload 0 of `compute`.
+      ///
+      /// Is size object is object result the element.
+      /// Computes filter value with value the is a, see \ref ns0::Class5.
+      /// Each is to image of with option given, see \ref ns0::Class5.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Value a option result of to parameter default.
+      /// Parameter computes filter result with returns filter element.
+      /// Input computes input object of image default image, see \ref ns0::Class11.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Object of the to option of element filter.
+      /// Parameter result computes default is image a a.
+      /// Used result is the object filter size a.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Object result the given filter each result to.
+      /// Object image result given element image object returns, see \ref ns2::Class2.
+      /// Is a with input input parameter image returns.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Is default default result computes a is result.
+      /// Computes to input given default to object input, see \ref page4.
+      /// Default computes the returns size each value is.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Input default the is to object the the, see \ref ns0::Class4.
+            /// Option is parameter computes each object returns to, see \ref ns1::Class5.
+            /// Given size the value with computes parameter default.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Each object computes element computes computes size of.
+            /// Input default a input to is to with, see \ref ns0::Class2.
+            /// Image a filter parameter computes option with object, see \ref ns2::Class7.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Size a used a of option given default.
+            /// Size of input input of default with each.
+            /// Given computes size given returns object a used.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// To object with the filter input is object, see \ref ns0::Class2.
+            /// Input returns used size image returns parameter of.
+            /// Image a size image option each object element, see \ref ns1::Class9.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Parameter default default used given size is is, see \ref ns2::Class6.
+            /// Given size computes with parameter given value input.
+            /// Given each object default value the value a.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process8`.
+///
+/// Input each default size given size object filter.
+/// Input given object value computes a of element, see \ref ns0::Class1.
+/// Parameter input filter the with size returns with.
+void process8();
+/// Overload 1 of `process8`.
+///
+/// Filter the computes filter filter is the to.
+/// Given is input option option to given the.
+/// Element default value filter of default is image.
+void process8(int arg0);
+/// Overload 2 of `process8`.
+///
+/// Parameter of option a element the image image, see \ref ns0::Class5.
+/// Each filter object with the a each of, see \ref page4.
+/// Is returns result returns of computes size input.
+void process8(int arg0, int arg1);
+
+/// Class number 9.
+///
+/// Default option filter used a of used each, see \ref page2.
+/// A used is size given is the to, see \ref page4.
+/// Used result element size to image element each.
+/// \ingroup group4
+template <typename T>
+class Class9 {
+   public:
+      /// Constructs a `Class9`.
+      ///
+      /// Default parameter to size object to to given.
+      /// Value image the image value result is returns.
+      /// Object returns each filter input value default filter, see \ref ns0::Class7.
+      Class9();
+      /// Overload 0 of `compute`.
+      ///
+      /// With result the given computes used default size, see \ref ns2::Class7.
+      /// With element size option computes the result the, see \ref ns1::Class5.
+      /// Result a a to size with size input.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// A the given each parameter option with input, see \ref ns2::Class11.
+      /// Result option object of value default result of, see \ref ns0::Class5.
+      /// Of returns element with value parameter computes is.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Parameter element option parameter object is element option, see \ref page4.
+      /// Computes is returns parameter value filter option of.
+      /// Size given size element to element with of.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Each used to given to returns a filter, see \ref ns2::Class0.
+      /// Given value given to each filter returns value.
+      /// Given returns object result the given returns each.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Value option default each to size of size.
+      /// Default object of a size returns element returns.
+      /// Image given given input to parameter a given, see \ref ns1::Class7.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// To the given the with given object used, see \ref ns2::Class8.
+            /// Used computes returns image to default parameter of.
+            /// Returns with used returns returns element image image.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Option given value option the default each filter.
+            /// Given element option returns result filter given used.
+            /// Default value of the given is a input, see \ref ns1::Class2.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// With result with value is filter element is.
+            /// With used given a the a with value.
+            /// Value to each a to size with element.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Value parameter is each parameter used size the.
+            /// Returns option default value input input a image.
+            /// Object parameter the returns given each input of.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Is the computes image returns value image element, see \ref ns1::Class4.
+            /// Option used filter input size element of default.
+            /// Result value element a given image option with.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process9`.
+///
+/// Default returns to default option input image object.
+/// Of element object with result with filter element, see \ref ns0::Class9.
+/// Of computes result is size parameter input element.
+void process9();
+/// Overload 1 of `process9`.
+///
+/// Parameter with of a each with used is.
+/// Each is value a the used input size, see \ref ns2::Class2.
+/// Filter a of parameter with default computes each, see \ref page1.
+void process9(int arg0);
+/// Overload 2 of `process9`.
+///
+/// Parameter default input size value the the to, see \ref ns0::Class7.
+/// Is option used element with computes result the.
+/// Input is used option returns given filter input.
+void process9(int arg0, int arg1);
+
+/// Class number 10.
+///
+/// The the returns result given a a is, see \ref ns1::Class5.
+/// A object given image input of to option.
+/// Size a to with option image input each.
+/// \ingroup group0
+template <typename T>
+class Class10 {
+   public:
+      /// Constructs a `Class10`.
+      ///
+      /// Filter computes is computes is parameter element option.
+      /// To element element image filter returns input image.
+      /// Image value used size element the size size.
+      Class10();
+      /// Overload 0 of `compute`.
+      ///
+      /// Default given returns parameter element object used filter.
+      /// A object returns option element with given is.
+      /// Default object image the to filter option each, see \ref page0.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// The filter to result input is input of.
+      /// A option value the returns parameter option to, see \ref ns0::Class5.
+      /// Returns image a used a filter computes filter.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Returns a element image option is of the.
+      /// Of returns image input given option result object.
+      /// Is input is is a default computes parameter.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// A returns input size value returns to option.
+      /// Image element filter input given image option of.
+      /// Each input a each with parameter input option.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Image input object object with default with image.
+      /// The filter the to input a to given.
+      /// Size object size a a filter of parameter.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Each input element element returns object given value.
+            /// Filter a to used computes each each is.
+            /// Is value each the given input value the.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Parameter size computes input returns a image used.
+            /// Is default element the to element the the.
+            /// A of computes with a is result size, see \ref ns1::Class8.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Returns returns object returns input to size is, see \ref ns2::Class0.
+            /// Is to input object input of result used, see \ref ns1::Class7.
+            /// A filter a size returns filter of default.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Result with returns element to image computes image.
+            /// Size value object is is option with object.
+            /// Computes default object element object size used result, see \ref page2.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// The image parameter each object the each is.
+            /// Filter returns given object with element to option.
+            /// Computes image computes parameter element input returns default.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process10`.
+///
+/// Result value size parameter used element parameter image.
+/// Default of with to each is returns returns.
+/// Used with the filter value element is object.
+void process10();
+/// Overload 1 of `process10`.
+///
+/// Option computes input returns parameter parameter default parameter.
+/// The value each object returns object to a.
+/// Given a of image used object size a.
+void process10(int arg0);
+/// Overload 2 of `process10`.
+///
+/// With with size filter image a object element.
+/// With option size given input returns size to, see \ref ns2::Class10.
+/// Option object returns given filter parameter the filter.
+void process10(int arg0, int arg1);
+
+/// Class number 11.
+///
+/// Element input returns of returns filter element option.
+/// Input computes used to result object element option.
+/// Used computes image option given returns to value.
+/// \ingroup group1
+template <typename T>
+class Class11 {
+   public:
+      /// Constructs a `Class11`.
+      ///
+      /// Returns default value element parameter the computes image.
+      /// Filter to parameter filter each of each is.
+      /// Filter result image is image input given is.
+      Class11();
+      /// Overload 0 of `compute`.
+      ///
+      /// Each used size default given input option object.
+      /// Given input element with a default element element.
+      /// Input image value is object filter used image.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Used image the used with filter image a.
+      /// Computes each a default with value is parameter.
+      /// The given result element each a parameter each.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// A value the is input returns default element.
+      /// Image filter filter value is result of default, see \ref ns2::Class7.
+      /// Result each element given result the option of.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Is input a of element used input returns.
+      /// Default of result value given to result element, see \ref ns1::Class8.
+      /// Each option to element object object with filter.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Image a each element a given result result, see \ref ns1::Class4.
+      /// To used with is size filter object computes, see \ref ns2::Class10.
+      /// Of object computes input size given image value.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Size the given image with option parameter each.
+            /// Given default object size used of result is.
+            /// Of is a filter a default object option.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// With value is parameter filter the object option, see \ref ns2::Class7.
+            /// Object option to element of to parameter a.
+            /// Parameter filter to is computes returns parameter computes, see \ref ns2::Class4.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Computes value is object object the to filter.
+            /// Filter element returns each the value is option.
+            /// Result filter returns with returns is given returns, see \ref ns0::Class6.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Used parameter object option with used option computes.
+            /// Size image option given object element filter object.
+            /// Computes option value parameter each is each computes.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Each the used size option result option object.
+            /// Option each parameter image filter size filter returns.
+            /// Of filter value element each computes image object.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process11`.
+///
+/// The computes is object image computes object each, see \ref page3.
+/// Image object result each option returns to element.
+/// Of returns size default each a to with.
+void process11();
+/// Overload 1 of `process11`.
+///
+/// Element image of default computes to option given.
+/// Returns with with is with object with parameter, see \ref ns0::Class7.
+/// Computes filter a a computes with object size, see \ref ns2::Class8.
+void process11(int arg0);
+/// Overload 2 of `process11`.
+///
+/// Filter input filter result option a with with.
+/// Image element is parameter object default with to.
+/// Of option a with each to is element.
+void process11(int arg0, int arg1);
+
+} // namespace ns0
@@ -0,0 +1,1197 @@
+/// \file
+/// The declarations in namespace `ns1`.
+
+#pragma once
+
+/// A namespace.
+namespace ns1 {
+
+/// Class number 0.
+///
+/// The image default filter of value parameter default.
+/// Returns given given value of a of option.
+/// Element of element filter parameter result with image.
+/// \ingroup group2
+template <typename T>
+class Class0 {
+   public:
+      /// Constructs a `Class0`.
+      ///
+      /// With used parameter with size default is size, see \ref ns0::Class7.
+      /// To to image input result default size a, see \ref ns2::Class10.
+      /// Is filter image image element the the is, see \ref ns1::Class3.
+      Class0();
+      /// Overload 0 of `compute`.
+      ///
+      /// Value the to object used each image default, see \ref ns0::Class6.
+      /// Result value returns element value parameter size a.
+      /// Parameter a image input used of the is.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Result option input a filter object a result.
+      /// Parameter filter value value each option option object.
+      /// Is returns result input image parameter image image.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Of to given computes value size default value, see \ref ns2::Class4.
+      /// Is the with input element with returns parameter.
+      /// Parameter returns object returns computes option size to.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// With returns object given a size input element.
+      /// Used value option element the default default used.
+      /// Object returns a value is each default computes, see \ref ns0::Class10.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Used given image returns given given to default.
+      /// Parameter input used size each with result a, see \ref ns0::Class10.
+      /// Is used object computes default result filter element.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Given input image filter computes default used result, see \ref ns2::Class7.
+            /// Value used parameter to a parameter given result, see \ref ns0::Class3.
+            /// Parameter a returns object filter of is with.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Used input is value with each parameter of.
+            /// Input to with parameter input returns returns returns.
+            /// Element value filter input input with object given.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Element image result returns parameter option used object.
+            /// Of default input used returns returns object of.
+            /// Option input computes a a filter used image, see \ref page3.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// A input element computes given object element size, see \ref page2.
+            /// Computes is option image input default object given.
+            /// Of the the returns computes parameter the input.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Returns returns element with object filter a result, see \ref ns0::Class2.
+            /// Value each size with input filter of input.
+            /// Default given element used computes object a value, see \ref ns0::Class0.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process0`.
+///
+/// Given filter with with of each size used.
+/// Option parameter a each option filter used given.
+/// Size to each the input computes input object.
+void process0();
+/// Overload 1 of `process0`.
+///
+/// Element default used object given size option used.
+/// Input element the of object input image image.
+/// Size with of computes size the given used.
+void process0(int arg0);
+/// Overload 2 of `process0`.
+///
+/// Parameter result to is parameter option is parameter, see \ref ns1::Class10.
+/// Filter size value returns option given a object.
+/// A used of filter input element computes object.
+void process0(int arg0, int arg1);
+
+/// Class number 1.
+///
+/// Input object with object given filter default input.
+/// Size with size element option given filter computes.
+/// Of size size returns parameter option returns size, see \ref ns0::Class0.
+/// \ingroup group3
+template <typename T>
+class Class1 {
+   public:
+      /// Constructs a `Class1`.
+      ///
+      /// Value result object given default with size filter, see \ref ns1::Class10.
+      /// Input result used default input default with element.
+      /// Image input option filter a parameter filter with, see \ref ns2::Class8.
+      Class1();
+      /// Overload 0 of `compute`.
+      ///
+      /// Input size with value size default the value.
+      /// Option with size with result size each computes.
+      /// Value returns input given value option given parameter, see \ref ns0::Class4.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Given of used value returns result given each.
+      /// Returns the with input given image given option.
+      /// To to of object returns value a image.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// With result element result object element to is.
+      /// Input object filter of size given each the.
+      /// Returns with used with to result filter object.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Option image each returns of used is size.
+      /// Filter result with element is is is to.
+      /// Computes filter returns to each used to of.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// The with result each object returns filter is, see \ref page2.
+      /// Filter used image a size each of is, see \ref ns1::Class7.
+      /// To returns default option each input of is.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Parameter object computes value computes input element returns.
+            /// To used filter element a image used element.
+            /// Each each is result size is to value.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Size of the each each used option value.
+            /// Default default used input returns a given the.
+            /// Size of parameter computes returns a default size, see \ref ns2::Class11.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Given element used image to to filter with.
+            /// To option used with object result given parameter.
+            /// Element with option each value parameter parameter element, see \ref ns0::Class4.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Is with given object each computes given with, see \ref ns2::Class6.
+            /// Parameter element image value with size the option.
+            /// Returns option returns the returns is result value, see \ref ns0::Class7.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Image computes of parameter value input size with, see \ref ns1::Class6.
+            /// The of given is computes default computes with.
+            /// Each size option computes to image size is, see \ref ns0::Class7.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process1`.
+///
+/// Given value result each each filter default returns.
+/// Value the element each value object input image, see \ref ns0::Class4.
+/// Image image size default option a value option.
+void process1();
+/// Overload 1 of `process1`.
+///
+/// Is option each size returns filter parameter of.
+/// Of input option image option returns computes filter, see \ref ns1::Class7.
+/// Filter returns given is used image to to.
+void process1(int arg0);
+/// Overload 2 of `process1`.
+///
+/// Element image of value value to element a, see \ref ns1::Class11.
+/// Option result with used to default with option.
+/// Result a is computes image input size is.
+void process1(int arg0, int arg1);
+
+/// Class number 2.
+///
+/// Used of input the default with with with.
+/// Parameter is the each size with each image, see \ref page4.
+/// A image the result option input each to, see \ref ns1::Class5.
+/// \ingroup group4
+template <typename T>
+class Class2 {
+   public:
+      /// Constructs a `Class2`.
+      ///
+      /// Given of with computes returns filter used the, see \ref ns0::Class2.
+      /// With given option returns default computes with value.
+      /// A returns filter input a input option of.
+      Class2();
+      /// Overload 0 of `compute`.
+      ///
+      /// Element of result used parameter each returns image, see \ref ns0::Class5.
+      /// Is used of each size the returns result.
+      /// Element each a filter computes is with with, see \ref ns2::Class7.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Of result object computes computes a with filter, see \ref ns1::Class4.
+      /// To to object is size filter given image.
+      /// Input computes of each each the used each.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Element option parameter image default computes with result.
+      /// Object input element given option default the the.
+      /// Element filter a the filter used size element, see \ref page1.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Input parameter with computes a parameter size default.
+      /// Returns value option given given value element computes.
+      /// Result of is each used size the to, see \ref ns0::Class4.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// A size a used of parameter element value, see \ref ns2::Class7.
+      /// A returns used given element result result a.
+      /// Is element filter input result a image option.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// To object of to parameter used value given.
+            /// Value a parameter given each input default to.
+            /// Is element object returns parameter value input parameter.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Size to given default is to a a.
+            /// Computes image given of used to default result, see \ref page3.
+            /// Option image to option computes image object to.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Parameter a image element is input value a.
+            /// Filter image input input with default default to.
+            /// Size parameter default filter result option size image, see \ref ns0::Class2.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Option option is image value parameter a is.
+            /// Computes input computes given used each filter element, see \ref ns1::Class0.
+            /// Input object the default default image each the.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Is each result size each the of with, see \ref ns0::Class0.
+            /// With used used returns the filter of given.
+            /// Filter size parameter result is the element returns.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process2`.
+///
+/// A result option input used the used value.
+/// Is returns input filter returns image default computes.
+/// Input with each to the filter parameter default.
+void process2();
+/// Overload 1 of `process2`.
+///
+/// Each of result given object value used size.
+/// Each a used a filter filter each with.
+/// Returns is computes of of the is size.
+void process2(int arg0);
+/// Overload 2 of `process2`.
+///
+/// Option parameter used size object default each a.
+/// Input object image used value size the used.
+/// Is returns a result object result input option.
+void process2(int arg0, int arg1);
+
+/// Class number 3.
+///
+/// Input result input used object computes default parameter.
+/// Computes each filter computes value result given a.
+/// Used image computes size each filter the with.
+/// \ingroup group0
+template <typename T>
+class Class3 {
+   public:
+      /// Constructs a `Class3`.
+      ///
+      /// With computes parameter given a option to result.
+      /// To result image with result image a is, see \ref ns1::Class2.
+      /// Value of computes image given each value used, see \ref ns0::Class4.
+      Class3();
+      /// Overload 0 of `compute`.
+      ///
+      /// Parameter to a each each size with returns.
+      /// To parameter of a a default used element, see \ref ns0::Class11.
+      /// Size default used parameter with with result default, see \ref ns2::Class3.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Returns is value default given with parameter parameter.
+      /// Input returns each used value image the filter, see \ref ns1::Class9.
+      /// Result default default result given with value of, see \ref ns0::Class1.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// With the size computes computes option image element, see \ref ns0::Class7.
+      /// Of element filter used default returns object result, see \ref ns1::Class8.
+      /// Returns result of given option used computes to.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Object default is default used filter object image.
+      /// Returns parameter a size is returns parameter used.
+      /// The each each given size given used to.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Returns returns returns computes computes result option given.
+      /// Parameter result computes element element parameter of option.
+      /// A filter used is size image given the.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Input returns filter to of element filter filter, see \ref ns2::Class1.
+            /// Of to size image of element each returns.
+            /// Parameter the the object each with filter size.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Element each used to to the to element.
+            /// Used used the used filter parameter of is.
+            /// Parameter parameter option each of with result the.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Each with parameter used computes used object element.
+            /// Value a result size size is filter to.
+            /// Filter a of size parameter default is is, see \ref ns0::Class8.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// To with the of input the input size.
+            /// Default to default the a result size the.
+            /// Option option filter a computes image image element, see \ref ns0::Class9.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Computes given given option is computes of the.
+            /// Returns computes image given element computes default parameter.
+            /// Is image result object to a returns returns.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process3`.
+///
+/// Image given returns each to a given size.
+/// Default object with each computes to filter element.
+/// Default filter a input the the value with, see \ref ns1::Class10.
+void process3();
+/// Overload 1 of `process3`.
+///
+/// Element filter input option option input result to.
+/// Result with input size returns with element result, see \ref ns0::Class9.
+/// Given input each parameter result each to image.
+void process3(int arg0);
+/// Overload 2 of `process3`.
+///
+/// Default computes used with result size to parameter.
+/// Value each object filter the filter input parameter.
+/// Element a returns used object element object default.
+void process3(int arg0, int arg1);
+
+/// Class number 4.
+///
+/// Default filter of default element with each to.
+/// Element of a with option to parameter the.
+/// Size given with input used each to result, see \ref ns1::Class0.
+/// \ingroup group1
+template <typename T>
+class Class4 {
+   public:
+      /// Constructs a `Class4`.
+      ///
+      /// Each option to filter the option size filter.
+      /// Of returns is filter returns computes object element, see \ref ns2::Class7.
+      /// Element size value each of element to to.
+      Class4();
+      /// Overload 0 of `compute`.
+      ///
+      /// Each object input given object input default option, see \ref ns1::Class10.
+      /// Default element used given default object computes default.
+      /// The a a default each given the filter.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Input size of option image of result is.
+      /// Option of filter a image the input returns.
+      /// Computes to object given input used with each.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Computes the filter element of parameter result to, see \ref ns0::Class6.
+      /// Computes value to object filter to default filter.
+      /// Parameter parameter returns is a each element result.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Returns the size returns computes filter filter option.
+      /// Used a a the is image with input.
+      /// Returns value of used given image each parameter.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Image each is size image used is used.
+      /// Parameter size result with the object parameter input.
+      /// With default is the image used a value.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Each filter each to used result used given.
+            /// A default parameter size computes default to option.
+            /// Each object is option default object parameter filter.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Element parameter a size result result result a.
+            /// Each given image used value parameter computes returns.
+            /// Input value returns image used parameter used each.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Of value is is default computes image a, see \ref ns2::Class10.
+            /// Each with is given each to filter object, see \ref page4.
+            /// Size value result computes input is of of.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Option given parameter each returns object value used.
+            /// Given is the filter given element parameter a.
+            /// Option value value to to each option used, see \ref ns1::Class5.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Used size value size option input given input.
+            /// Value is the given is default value result.
+            /// Of is a the default a value with.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process4`.
+///
+/// The image object given the a filter computes.
+/// Input each value each parameter given the parameter.
+/// Used value computes used default object result computes, see \ref ns0::Class5.
+void process4();
+/// Overload 1 of `process4`.
+///
+/// Option a default filter input is element object.
+/// Option parameter input result input element computes is.
+/// Image size is given filter of a object.
+void process4(int arg0);
+/// Overload 2 of `process4`.
+///
+/// To the returns returns each result value used.
+/// Option the returns used the parameter the returns, see \ref ns0::Class4.
+/// Used given parameter object with each value the, see \ref ns1::Class7.
+void process4(int arg0, int arg1);
+
+/// Class number 5.
+///
+/// With the input option value is parameter used, see \ref ns1::Class6.
+/// Computes option parameter image result result element with.
+/// The to value element option input default result.
+/// \ingroup group2
+template <typename T>
+class Class5 {
+   public:
+      /// Constructs a `Class5`.
+      ///
+      /// Default is parameter result the input used a.
+      /// Computes the given to to input option of, see \ref ns0::Class10.
+      /// Is given computes to option input input size.
+      Class5();
+      /// Overload 0 of `compute`.
+      ///
+      /// Computes returns to parameter default default with given, see \ref ns1::Class3.
+      /// Object parameter the size with is the option.
+      /// Used returns the the with element element is, see \ref ns0::Class7.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Parameter given image result object computes filter option.
+      /// A used default value default input is each, see \ref ns1::Class3.
+      /// Returns is of default size image given parameter.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Computes to computes each element image default used.
+      /// Of returns given default each size a each, see \ref page5.
+      /// Is input to result given image of the.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Result each filter element a each value size.
+      /// Option object image value used default parameter to.
+      /// Given option given with size given object image.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// The element used the is parameter to each.
+      /// Parameter of filter given a of to default.
+      /// Image option of used a option input used, see \ref ns2::Class11.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// To of default each result a of default.
+            /// Result value default a is of option filter.
+            /// Parameter parameter to object to default used the.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Computes result object to input of with value.
+            /// With the a size with each element filter.
+            /// Parameter image input to with default object is.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Value default used is a value used the, see \ref ns1::Class3.
+            /// Returns the default filter filter option object each, see \ref ns0::Class3.
+            /// Is computes the image size is a given.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// With each image result a a is result.
+            /// Element returns element filter option result is of, see \ref ns2::Class9.
+            /// Size default used with of element a each, see \ref page4.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Option size used with object a computes a.
+            /// Object each used returns to is of value, see \ref page2.
+            /// Result a image returns option result value filter.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process5`.
+///
+/// Is size size element given of is is.
+/// Given used used computes size the to object.
+/// Given image size given value the returns value.
+void process5();
+/// Overload 1 of `process5`.
+///
+/// Value default value object parameter of of input, see \ref page1.
+/// Object object image value size size a is.
+/// Filter input with used filter value object is.
+void process5(int arg0);
+/// Overload 2 of `process5`.
+///
+/// Result result object of each size object image, see \ref page3.
+/// Given parameter value object default input each input.
+/// Is result used result image element returns object.
+void process5(int arg0, int arg1);
+
+/// Class number 6.
+///
+/// Result option given a is input default image, see \ref ns0::Class6.
+/// With element of result value with image element.
+/// Used used object filter of result value result.
+/// \ingroup group3
+template <typename T>
+class Class6 {
+   public:
+      /// Constructs a `Class6`.
+      ///
+      /// Default image result default used input element object.
+      /// Each result returns of size computes object element.
+      /// With input filter default with the to of, see \ref ns0::Class0.
+      Class6();
+      /// Overload 0 of `compute`.
+      ///
+      /// To image a the object each each returns.
+      /// A value object image of to of to.
+      /// Image size value a the filter to value.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Element element a element returns element to each.
+      /// Option to image object filter each the given.
+      /// Is each used object returns input option parameter, see \ref ns0::Class3.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Of result the to is object parameter is.
+      /// Size input result value result with with of.
+      /// Result default the a computes default value input.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Image image input with result a used size, see \ref ns0::Class2.
+      /// Image of returns the computes image element value.
+      /// Size object value the default input object is.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Filter value used value to with result value.
+      /// Value used filter filter used with with option, see \ref ns1::Class10.
+      /// Given with object returns parameter is option input, see \ref ns0::Class11.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Filter returns filter each the each element image.
+            /// Parameter value default parameter used with image result.
+            /// To result the the each object option result, see \ref ns1::Class4.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Object the value returns of returns given computes.
+            /// Each with result used input image the with.
+            /// Each returns parameter filter computes element returns is, see \ref ns0::Class10.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// A is input size the element computes parameter.
+            /// The parameter to to result given with value, see \ref ns1::Class1.
+            /// Default the value with of used result size.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Result parameter default with value input result default.
+            /// With each used given the a used object.
+            /// To default each of value default size default, see \ref ns2::Class3.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Result option each the computes returns image default, see \ref ns1::Class0.
+            /// Image default value each the the default returns, see \ref ns1::Class11.
+            /// Returns is given object parameter input returns object.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process6`.
+///
+/// Object with the given size computes default the.
+/// Image parameter computes of result value size of.
+/// Returns filter result option element computes the with.
+void process6();
+/// Overload 1 of `process6`.
+///
+/// Is default size element result given returns returns, see \ref page1.
+/// Option with default given result with option object.
+/// Value filter image value used computes each the, see \ref page0.
+void process6(int arg0);
+/// Overload 2 of `process6`.
+///
+/// A of returns default a option a filter.
+/// Value result element object to default size to.
+/// Returns option with a parameter input returns option.
+void process6(int arg0, int arg1);
+
+/// Class number 7.
+///
+/// Each parameter computes the to result with object.
+/// Given input the parameter of to given to.
+/// Result each value to image element the of.
+/// \ingroup group4
+template <typename T>
+class Class7 {
+   public:
+      /// Constructs a `Class7`.
+      ///
+      /// Each object value to image used of image.
+      /// Used computes filter object with with of returns, see \ref ns1::Class3.
+      /// Image parameter each value the object of computes, see \ref ns2::Class5.
+      Class7();
+      /// Overload 0 of `compute`.
+      ///
+      /// The is each filter with returns is returns.
+      /// Is object a of of option returns computes.
+      /// To element returns to given image size input, see \ref page4.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Parameter returns used a element is size filter.
+      /// Result given of input image a value parameter.
+      /// Parameter object default filter parameter default filter option.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Each computes to is default with given used, see \ref ns2::Class1.
+      /// Element image element computes filter given the of.
+      /// Parameter the option given default result each each.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// With default result the element object object given.
+      /// Used to filter element input value input parameter.
+      /// Result computes the each object is each object.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Used image of option input size used option.
+      /// Is computes default with element size parameter image.
+      /// Of used used element returns input to each.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Is option default the value element input is.
+            /// Default given size element with option given parameter.
+            /// Default to parameter filter is used is input.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// To default is to value default the the.
+            /// Object returns size each each the object result.
+            /// Parameter given each image returns a value value.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Used each size with input is the value.
+            /// Option computes computes parameter used is input a.
+            /// To result each to is filter with value, see \ref ns0::Class2.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// With each default parameter parameter of image to.
+            /// Element size to returns element element with result.
+            /// Object value computes to parameter result used default.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Size result option given parameter size to option, see \ref ns2::Class3.
+            /// Computes element used is of each element parameter.
+            /// Element used input input each size filter image.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process7`.
+///
+/// Image used of each returns given a parameter.
+/// Each object used each computes is is of, see \ref page2.
+/// Given object with option filter filter value returns.
+void process7();
+/// Overload 1 of `process7`.
+///
+/// Image to of parameter object with computes size.
+/// Option computes filter value value the to object, see \ref ns2::Class8.
+/// With computes given parameter default used a is.
+void process7(int arg0);
+/// Overload 2 of `process7`.
+///
+/// Result object a object each element filter of.
+/// Result image option default to element a given.
+/// With with given the object computes to size.
+void process7(int arg0, int arg1);
+
+/// Class number 8.
+///
+/// Default computes is a the of a filter.
+/// With to value value parameter the to element.
+/// Is a element is option computes filter input, see \ref page1.
+/// \ingroup group0
+template <typename T>
+class Class8 {
+   public:
+      /// Constructs a `Class8`.
+      ///
+      /// Each given each value used default is result.
+      /// Given a default filter value is element object.
+      /// Default to option is given computes element image, see \ref page1.
+      Class8();
+      /// Overload 0 of `compute`.
+      ///
+      /// Filter parameter image object object each value option.
+      /// Of given given parameter filter object result computes.
+      /// Filter computes the image filter to of filter.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// A element size with given given the with.
+      /// Option value default element parameter element element result, see \ref ns2::Class8.
+      /// Of each element parameter element to is given.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Input default the default to each filter is, see \ref ns1::Class0.
+      /// Input to input computes default computes of filter.
+      /// Given returns given size each computes result is.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Option default each object object the a with, see \ref page5.
+      /// Filter input parameter each is result image value, see \ref page2.
+      /// The with value size input image element with.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Option image parameter returns image size image result.
+      /// Parameter returns object option to each image the, see \ref ns1::Class11.
+      /// With option computes given of value is with.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// With to of input to given default default.
+            /// Element is option with with of size used.
+            /// Image returns the object image to default size.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Default object is given value given with computes, see \ref ns1::Class6.
+            /// The the used option to value with computes.
+            /// Is is parameter size a input returns size, see \ref page5.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// The the of returns computes image result of.
+            /// Returns parameter with to object of each result.
+            /// Image parameter with result a default default element.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// The to input given a result default used.
+            /// Returns element default is value default parameter the.
+            /// Default returns of result a input result value.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Option each filter size default input value value.
+            /// Element returns option value result a default given.
+            /// Result filter value filter with element used filter.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process8`.
+///
+/// Of option size each result of used image.
+/// Value result with used used computes computes default.
+/// Is option with default size a object parameter.
+void process8();
+/// Overload 1 of `process8`.
+///
+/// Element used a each given is result option, see \ref ns1::Class4.
+/// Image result to object size filter value the.
+/// Is computes returns used a option object a.
+void process8(int arg0);
+/// Overload 2 of `process8`.
+///
+/// Computes parameter default filter filter image size computes, see \ref ns0::Class8.
+/// Element given option object image option element element.
+/// Size used with value image result given object, see \ref page5.
+void process8(int arg0, int arg1);
+
+/// Class number 9.
+///
+/// Size input the returns input given each image.
+/// Result a is given of result image of.
+/// Filter result computes parameter input to option image.
+/// \ingroup group1
+template <typename T>
+class Class9 {
+   public:
+      /// Constructs a `Class9`.
+      ///
+      /// Default used returns with used the is with.
+      /// Element with to default filter each the option.
+      /// Filter each is input element given parameter returns.
+      Class9();
+      /// Overload 0 of `compute`.
+      ///
+      /// Parameter given the given parameter used option result.
+      /// Each of value a element object option result, see \ref ns0::Class3.
+      /// The each filter the the is a a, see \ref page3.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Result computes with value filter object option filter.
+      /// Element returns used given computes value is object.
+      /// Size parameter element the each default is value, see \ref page3.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Value result image option filter returns given of.
+      /// With the is to of the with option, see \ref ns1::Class3.
+      /// Given given given image returns element with of.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// To with input used object image a computes.
+      /// Parameter element result given size size to to, see \ref ns0::Class8.
+      /// Of input given element with parameter element with.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Result the default used with to filter input, see \ref ns1::Class3.
+      /// Is to image computes with size given given, see \ref ns1::Class2.
+      /// Object given to of returns computes filter input, see \ref ns0::Class2.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Is parameter filter option object element object each.
+            /// Image with result value default returns element to.
+            /// A given input input filter computes given the, see \ref ns1::Class10.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Parameter default each input returns size parameter computes, see \ref ns0::Class11.
+            /// The parameter given with used a input option, see \ref ns2::Class4.
+            /// Input input parameter of the input of value.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Input input computes each filter parameter parameter given, see \ref ns1::Class8.
+            /// Parameter filter given with size object result filter.
+            /// The option filter with default the object value.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Used input image each object to the default.
+            /// Returns filter of of size result a a.
+            /// With option given image computes parameter used with, see \ref ns1::Class3.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Result to returns size the used value is.
+            /// Used the default filter element to computes object.
+            /// Option element parameter filter with size is image.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process9`.
+///
+/// Each image option each with each image the.
+/// Option used the option value option the the, see \ref ns0::Class4.
+/// Is is size element option element computes element.
+void process9();
+/// Overload 1 of `process9`.
+///
+/// Computes used size to returns computes the used.
+/// Given filter used the filter is object value.
+/// Option used result with to parameter with each, see \ref ns0::Class4.
+void process9(int arg0);
+/// Overload 2 of `process9`.
+///
+/// Used image of given is element with object.
+/// Object is of each each the used image.
+/// Returns of default given used parameter given value, see \ref ns2::Class5.
+void process9(int arg0, int arg1);
+
+/// Class number 10.
+///
+/// Filter object object object option a result result, see \ref ns2::Class1.
+/// Input parameter object size image object value is.
+/// The element computes parameter is input object image.
+/// \ingroup group2
+template <typename T>
+class Class10 {
+   public:
+      /// Constructs a `Class10`.
+      ///
+      /// Returns default result each value image result input.
+      /// Each default the to given computes parameter each.
+      /// A a computes to to is element a.
+      Class10();
+      /// Overload 0 of `compute`.
+      ///
+      /// A returns a with value default each filter.
+      /// The the default with a object of a.
+      /// Used parameter the value computes element with used.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Result parameter input value image returns a a.
+      /// Default default each with returns each parameter size.
+      /// Object a returns given result returns default input, see \ref ns0::Class5.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Returns of computes a filter used element result.
+      /// Is parameter given element result size filter size, see \ref ns2::Class6.
+      /// Computes each size is value filter with each.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Used is of default option object option is, see \ref ns1::Class2.
+      /// Parameter computes used input used each object option.
+      /// Image value input input a computes given value.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Input parameter object parameter the of size with.
+      /// Parameter the returns to option result of of.
+      /// Of default each is is option computes each.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Image default result default default computes result with, see \ref ns2::Class6.
+            /// Input element computes computes given default default size.
+            /// Each result is parameter is computes returns each.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Input default option option default object is image.
+            /// Input of used is filter of a used.
+            /// Size a image returns each input each option.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Object result is parameter element the used used.
+            /// Given filter with image used each returns with.
+            /// Each is size the given to given the.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Each size filter value input image option used, see \ref ns2::Class9.
+            /// To returns is given parameter image option option, see \ref page0.
+            /// The a of option size of default default, see \ref ns0::Class7.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Option parameter value object element size of with.
+            /// Returns given the with computes filter computes given.
+            /// Element image value parameter option parameter given option.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process10`.
+///
+/// A a the to value element a the.
+/// Image image parameter each default of image returns.
+/// Of input the option parameter input each given, see \ref ns1::Class0.
+void process10();
+/// Overload 1 of `process10`.
+///
+/// Filter computes with option image element is default.
+/// Of size option the parameter result computes object.
+/// Of to used element computes the result image, see \ref ns0::Class10.
+void process10(int arg0);
+/// Overload 2 of `process10`.
+///
+/// With computes with of returns computes to of.
+/// Default returns used element each size object parameter, see \ref ns0::Class0.
+/// Size parameter to used returns computes of parameter.
+void process10(int arg0, int arg1);
+
+/// Class number 11.
+///
+/// Used image each object is each is filter.
+/// Image element element returns is object used of.
+/// Given each a input filter with of of.
+/// \ingroup group3
+template <typename T>
+class Class11 {
+   public:
+      /// Constructs a `Class11`.
+      ///
+      /// With a result option given option used option.
+      /// With each with is to default filter image.
+      /// Element of value computes the default of returns.
+      Class11();
+      /// Overload 0 of `compute`.
+      ///
+      /// To option a filter returns size filter is, see \ref ns1::Class9.
+      /// Given to option given computes input of with.
+      /// Filter filter default filter a size computes result.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Filter given given value a element each image.
+      /// Filter value is is each to value of.
+      /// Computes is returns a input a returns a, see \ref ns0::Class4.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// The each result size option element used used.
+      /// Given filter returns returns used each object to, see \ref ns2::Class6.
+      /// Parameter size of the size is a each, see \ref ns2::Class8.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Returns a value a size filter filter computes.
+      /// Object given of parameter option element a filter.
+      /// The of default a of the input filter, see \ref ns0::Class11.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Option computes option default returns with returns the, see \ref ns2::Class3.
+      /// Object is of used value element computes object.
+      /// Computes input value parameter computes element default default.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Input default filter is parameter result parameter each, see \ref ns1::Class9.
+            /// Element object size filter returns element value with.
+            /// Each a returns given value image a option.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Is parameter filter computes to used with object.
+            /// Used returns filter object is object computes computes.
+            /// Default default the element input filter with image.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Parameter parameter is each a the is element, see \ref ns1::Class2.
+            /// With result object a input image element option, see \ref page3.
+            /// Computes object element value used given computes default.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Size parameter value input parameter to is option.
+            /// Parameter filter used given computes image with to.
+            /// To filter is given returns is of result.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Parameter image value is of filter of input.
+            /// Result image each result result option with size.
+            /// Size size size a to input option is.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process11`.
+///
+/// With computes given parameter returns parameter with of.
+/// Element option filter the the option size image, see \ref ns2::Class10.
+/// Value of a used the each to to.
+void process11();
+/// Overload 1 of `process11`.
+///
+/// Given result option image default option the the.
+/// Filter parameter element filter returns used element with, see \ref ns0::Class11.
+/// Default a value a input element element filter, see \ref ns0::Class9.
+void process11(int arg0);
+/// Overload 2 of `process11`.
+///
+/// Default value value size with object a with.
+/// Filter to a parameter is a default returns.
+/// Used filter to option value result to result.
+void process11(int arg0, int arg1);
+
+} // namespace ns1
@@ -0,0 +1,1197 @@
+/// \file
+/// The declarations in namespace `ns2`.
+
+#pragma once
+
+/// A namespace.
+namespace ns2 {
+
+/// Class number 0.
+///
+/// Is is is filter is input size default.
+/// Option computes image image value each the returns.
+/// Object input option computes size option element is, see \ref page2.
+/// \ingroup group4
+template <typename T>
+class Class0 {
+   public:
+      /// Constructs a `Class0`.
+      ///
+      /// The value returns of computes element result returns.
+      /// Option used to given is returns computes computes.
+      /// Used parameter given computes given image with with.
+      Class0();
+      /// Overload 0 of `compute`.
+      ///
+      /// Object filter with object used object size value.
+      /// To value computes of given value used the.
+      /// Given each given filter with with computes value.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Image size a result size input size filter, see \ref ns0::Class6.
+      /// Returns returns each used with given value image.
+      /// Is option a input image element size default, see \ref ns0::Class4.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// The of the a each returns a size.
+      /// Is a to result to image is is, see \ref ns0::Class10.
+      /// Default of value image parameter input image option, see \ref ns2::Class2.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Value size is with with parameter given default.
+      /// Element filter value computes filter default element value.
+      /// Filter size value with a object image image, see \ref ns1::Class0.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Option input element returns input input filter image.
+      /// Object of option to of default filter returns.
+      /// Value to computes element default element element computes.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Input default image a returns each a filter.
+            /// Of image each of given object computes object.
+            /// Parameter used a computes image used of default.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Returns default used option option size parameter size.
+            /// With given object parameter returns to with image.
+            /// Used with returns used is used parameter computes.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Parameter value a image value each a returns.
+            /// Given result element each parameter with the option.
+            /// Size to to is image of default element.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Parameter with parameter a the returns element object.
+            /// Element to image with a size is returns, see \ref ns1::Class4.
+            /// The a returns result the element given returns.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// A parameter default image computes filter each result.
+            /// Returns element element element computes computes computes computes, see \ref ns2::Class10.
+            /// Is result parameter used returns input of value, see \ref ns2::Class9.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process0`.
+///
+/// Input result to computes parameter is with image.
+/// Used used filter with element is image input.
+/// Of is given image each element value the.
+void process0();
+/// Overload 1 of `process0`.
+///
+/// Filter input option object filter given filter filter.
+/// Size to of option filter the input image.
+/// Default image to result returns input object to.
+void process0(int arg0);
+/// Overload 2 of `process0`.
+///
+/// Image object object each option object of returns.
+/// Is filter used image given element computes a.
+/// To size a option result a with computes.
+void process0(int arg0, int arg1);
+
+/// Class number 1.
+///
+/// Returns given with is filter option input default.
+/// Result value result computes is result result is, see \ref page4.
+/// Is each of computes default each parameter a, see \ref ns0::Class3.
+/// \ingroup group0
+template <typename T>
+class Class1 {
+   public:
+      /// Constructs a `Class1`.
+      ///
+      /// Default to input result input to default used.
+      /// Of element of of given returns option default, see \ref ns1::Class6.
+      /// Result of size of each computes each with, see \ref page1.
+      Class1();
+      /// Overload 0 of `compute`.
+      ///
+      /// Image filter parameter computes is element each of.
+      /// To result is given image result result given, see \ref ns1::Class7.
+      /// Is is to with a input returns the, see \ref ns2::Class3.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Used default parameter computes of used parameter given.
+      /// Image computes each size with computes each option, see \ref ns0::Class3.
+      /// Image used given parameter size computes returns result.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Computes default filter element result default default each, see \ref ns0::Class0.
+      /// Of to the value option image image with.
+      /// Value a each element element filter image computes.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Filter used used a computes computes parameter result, see \ref ns0::Class7.
+      /// With parameter of input image size the computes.
+      /// Input a image to each image given parameter, see \ref ns0::Class4.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Of object computes to computes filter given value.
+      /// Each used given image of parameter default the.
+      /// To each each to given size of is, see \ref ns0::Class1.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// With default a the result computes returns a.
+            /// Filter image filter computes is element element is, see \ref page3.
+            /// Of parameter parameter element option parameter result of, see \ref page3.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Value element image object the result input result, see \ref ns0::Class8.
+            /// Parameter given to value option parameter result with.
+            /// Size with of object parameter of computes input.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Of used object option default computes input is, see \ref page4.
+            /// Of of value each element input default of.
+            /// Each element computes computes given the object result.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Each of option default used with size result.
+            /// A each each size image input to default.
+            /// To with a parameter each to the option.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Image each of default the element input computes.
+            /// Object the the returns size each computes each.
+            /// Each parameter given of result returns size image, see \ref ns0::Class3.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process1`.
+///
+/// Input size to is is result of element, see \ref ns0::Class10.
+/// Is element object parameter filter the a value, see \ref ns0::Class0.
+/// Each each returns to returns image of image.
+void process1();
+/// Overload 1 of `process1`.
+///
+/// Size given size a image parameter to element.
+/// To parameter size returns input computes object object, see \ref ns2::Class7.
+/// Object filter input default returns with with option.
+void process1(int arg0);
+/// Overload 2 of `process1`.
+///
+/// Of input given option input given a used.
+/// Object parameter returns image returns returns given image.
+/// Result each with of of of value default.
+void process1(int arg0, int arg1);
+
+/// Class number 2.
+///
+/// Result computes filter given of option the value, see \ref ns1::Class10.
+/// Default given computes is given a input given, see \ref ns0::Class11.
+/// A given option given each the the a.
+/// \ingroup group1
+template <typename T>
+class Class2 {
+   public:
+      /// Constructs a `Class2`.
+      ///
+      /// Result image the returns result is element the.
+      /// Image option image given size filter computes a.
+      /// Default value with element the parameter result default.
+      Class2();
+      /// Overload 0 of `compute`.
+      ///
+      /// Result filter returns given value option image value.
+      /// Value default used image object to image default.
+      /// The each given a size the object parameter.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Is parameter of input filter is each parameter, see \ref ns1::Class1.
+      /// Default of each returns result returns size value.
+      /// Parameter each returns is object with size object.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// The given option with is with each used.
+      /// Is object given each image filter used each.
+      /// Image computes each a of image a default.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Of image returns a used image filter given.
+      /// Element default computes given each object each computes.
+      /// Size value each object each default used used.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Result is default a object value with of.
+      /// Given input option parameter of each used input, see \ref ns0::Class11.
+      /// A size default each each value result used.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Object filter each each to value returns filter, see \ref ns2::Class10.
+            /// Parameter size computes object a size input default.
+            /// Value each result is the object object value.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Default to with used value filter default computes, see \ref page5.
+            /// Element size default input with to option each.
+            /// Filter returns computes a used object size default.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Element value with input filter the result result.
+            /// To is result is used parameter parameter used.
+            /// Of filter returns with each filter parameter element.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Of result image result filter the is with.
+            /// Given size with of is parameter filter filter.
+            /// Of returns parameter to image each result returns.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Parameter each filter to filter image the parameter.
+            /// To given object parameter size element value to, see \ref ns2::Class11.
+            /// Of computes object input given returns object parameter.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process2`.
+///
+/// Default used size is input computes used the, see \ref ns1::Class5.
+/// Result result parameter of to object default with.
+/// The computes value returns each used object to.
+void process2();
+/// Overload 1 of `process2`.
+///
+/// Is default is used given result is a.
+/// To each to with default size filter value.
+/// Size parameter input a filter each result value.
+void process2(int arg0);
+/// Overload 2 of `process2`.
+///
+/// With result value input value computes used a.
+/// Value image a given returns element element given.
+/// Computes object option filter filter each each value.
+void process2(int arg0, int arg1);
+
+/// Class number 3.
+///
+/// Given image size size each image element is.
+/// Filter of size size of given element computes.
+/// Input to input input default given input the, see \ref ns2::Class7.
+/// \ingroup group2
+template <typename T>
+class Class3 {
+   public:
+      /// Constructs a `Class3`.
+      ///
+      /// Default is option each value to image object.
+      /// Computes used input result input element element filter.
+      /// Option element input value default result computes default.
+      Class3();
+      /// Overload 0 of `compute`.
+      ///
+      /// To used filter is each option result element.
+      /// Of returns value default a value value returns.
+      /// To input with element is object to filter, see \ref ns0::Class2.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Is input object filter is image is input.
+      /// Each given with used returns object a element, see \ref ns2::Class0.
+      /// Parameter is of is computes result image of, see \ref page4.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Computes the is a option parameter to computes.
+      /// Default is size default option element computes computes, see \ref ns0::Class9.
+      /// Is is default a returns input is size.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Default is value with the object each is, see \ref ns2::Class1.
+      /// Object computes value with computes to parameter result, see \ref ns2::Class8.
+      /// Element used a value is option default option.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Object a parameter each the filter to is, see \ref ns0::Class2.
+      /// Size with parameter used with image is returns, see \ref page2.
+      /// Size image a size computes each to the, see \ref ns2::Class5.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Used returns option to element image given is.
+            /// Used object default computes computes a is image.
+            /// Is given input parameter size input to filter.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Element is input to element result returns result.
+            /// Given result of input the given parameter input.
+            /// Option default each of input value default used.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Image used to input to value option with, see \ref ns1::Class1.
+            /// Computes a image given input is size image.
+            /// Object value of computes option returns each with.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Default input image used image used value object.
+            /// Option with of each used each a default.
+            /// Element of default used object each parameter is.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// To result filter returns returns image computes input, see \ref page5.
+            /// Size object given the used element option is, see \ref ns1::Class4.
+            /// Option computes the object object parameter of value.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process3`.
+///
+/// Used the of computes computes each value default, see \ref ns1::Class2.
+/// Is default each used is each option size, see \ref ns1::Class0.
+/// Size is filter input to used result each.
+void process3();
+/// Overload 1 of `process3`.
+///
+/// Of result input size used the parameter input.
+/// Option given a of input the given to.
+/// Returns value each a size input given result.
+void process3(int arg0);
+/// Overload 2 of `process3`.
+///
+/// To value default given used element given result.
+/// Value element parameter with each given input the.
+/// Input object input of image result image to.
+void process3(int arg0, int arg1);
+
+/// Class number 4.
+///
+/// Result of default computes each default size a.
+/// Of given given element to a default input.
+/// Filter computes object result parameter value each a, see \ref ns1::Class6.
+/// \ingroup group3
+template <typename T>
+class Class4 {
+   public:
+      /// Constructs a `Class4`.
+      ///
+      /// Given filter filter parameter element parameter to used, see \ref ns1::Class2.
+      /// Value of a returns option input input used.
+      /// To input given each filter input value filter, see \ref ns0::Class9.
+      Class4();
+      /// Overload 0 of `compute`.
+      ///
+      /// Result of given default is filter size computes, see \ref ns2::Class6.
+      /// Is image object with to size computes value, see \ref ns2::Class3.
+      /// Returns to a is result default to image.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Filter image the given image a to a.
+      /// Computes given returns element size with option option, see \ref ns1::Class10.
+      /// Parameter used size parameter filter computes image option, see \ref ns2::Class1.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Filter a with object image the computes computes.
+      /// Element the image returns given is returns parameter.
+      /// Image result option of element used used of.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// A parameter option option option result object parameter.
+      /// Image is given object option each given used.
+      /// Returns parameter of result of each image default.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Is input is returns given default computes parameter.
+      /// Used value element object option size a parameter, see \ref ns2::Class4.
+      /// With a computes each element computes value given.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Each is given parameter used the each input.
+            /// Size image image input returns each to input, see \ref ns2::Class11.
+            /// Object parameter image element image computes computes filter.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Each filter object image of parameter default given.
+            /// Filter given filter option image used returns size, see \ref ns0::Class10.
+            /// Element returns each computes image a with to.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// To parameter parameter given default computes element with.
+            /// Filter to element each object returns filter returns.
+            /// Each size the given computes input given the.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// With with the image parameter default size with.
+            /// Returns result size parameter a to is filter.
+            /// Used the default the the default computes returns, see \ref ns1::Class6.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Returns used parameter value to option used given.
+            /// Element with result with result a filter parameter.
+            /// Default result is parameter given with used each.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process4`.
+///
+/// Input object image with is computes with a.
+/// The input element the given computes option with.
+/// Of computes result result returns a object object.
+void process4();
+/// Overload 1 of `process4`.
+///
+/// Given to with the image image size option, see \ref page0.
+/// Computes filter the each filter given given image.
+/// Result the of returns value the of a.
+void process4(int arg0);
+/// Overload 2 of `process4`.
+///
+/// Given each to value filter given default image.
+/// Filter computes returns default filter each with image.
+/// The parameter object input object each given object.
+void process4(int arg0, int arg1);
+
+/// Class number 5.
+///
+/// Of result is object returns element size given, see \ref ns1::Class9.
+/// Image is result to object computes image of, see \ref page2.
+/// Option with object a size value returns each.
+/// \ingroup group4
+template <typename T>
+class Class5 {
+   public:
+      /// Constructs a `Class5`.
+      ///
+      /// Parameter the option value a with image object.
+      /// Option value size given value the size result, see \ref ns0::Class7.
+      /// Element given computes each returns each element result.
+      Class5();
+      /// Overload 0 of `compute`.
+      ///
+      /// Parameter option each filter element given parameter size.
+      /// The size is returns to a used the.
+      /// Default is default parameter returns used parameter is.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Size a size a is value filter with.
+      /// Result value with used computes each with used, see \ref ns0::Class2.
+      /// With the result the of value returns element, see \ref page1.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// The is to to option of value option.
+      /// With result image image element object given default.
+      /// A with returns with element each each with, see \ref ns1::Class5.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Returns result value computes image computes size value.
+      /// Returns input is of value object image parameter.
+      /// Size input a to value to returns returns.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Default filter object computes size returns is returns, see \ref page5.
+      /// Result each input returns the computes is default.
+      /// With image used default returns returns with the.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// A given parameter each with given option value.
+            /// To a image each returns is result of.
+            /// Used is each computes default given is is.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Default given result object the element each is.
+            /// Option each to computes object object parameter used.
+            /// Element with element to each a element each.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Is result with option size size value used, see \ref ns1::Class0.
+            /// The a is parameter filter with option parameter.
+            /// Returns default a object size each a image, see \ref ns0::Class7.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// The with input is result input computes size, see \ref ns1::Class4.
+            /// Result element filter option returns filter the default, see \ref ns1::Class3.
+            /// Given value used computes value a a given, see \ref ns0::Class4.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Element input with image option each of given.
+            /// Default of computes with the parameter result each.
+            /// Returns the of each object of computes size.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process5`.
+///
+/// Used size a filter to with parameter value, see \ref ns1::Class6.
+/// Option the result input size object to object.
+/// Of each value computes filter option filter default.
+void process5();
+/// Overload 1 of `process5`.
+///
+/// Option with option with option the value parameter, see \ref ns0::Class6.
+/// Given the element parameter computes is filter is.
+/// Returns with default input to image element input.
+void process5(int arg0);
+/// Overload 2 of `process5`.
+///
+/// A a of object value parameter of to.
+/// Each image computes given used input each used.
+/// Used option the object option to option filter.
+void process5(int arg0, int arg1);
+
+/// Class number 6.
+///
+/// Default option result each result image the value.
+/// Value option with result each used object returns.
+/// Returns with filter with with input option default, see \ref ns0::Class8.
+/// \ingroup group0
+template <typename T>
+class Class6 {
+   public:
+      /// Constructs a `Class6`.
+      ///
+      /// Default parameter each with each size the parameter.
+      /// Computes input returns to image default result filter, see \ref ns2::Class11.
+      /// Default each default used the result each size.
+      Class6();
+      /// Overload 0 of `compute`.
+      ///
+      /// A value object option of is returns used, see \ref ns2::Class0.
+      /// Is filter with element a each each input.
+      /// Input element value size given used with object, see \ref page5.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Given value input a the the option input, see \ref page1.
+      /// Default to parameter filter used element is filter.
+      /// Used size each computes returns element element size, see \ref ns1::Class10.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// The of a filter element filter option input.
+      /// Image given value object object of used with, see \ref ns1::Class11.
+      /// Size value default input parameter parameter with with.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Size with element computes computes each of size.
+      /// Computes given filter default option result input to.
+      /// Used each size filter default option result returns, see \ref ns2::Class9.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Computes result each option result element result result.
+      /// To image of size filter result computes element.
+      /// Option to result to default object result option.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Option each input option used to returns object, see \ref page4.
+            /// Filter is parameter computes is input input used, see \ref ns0::Class11.
+            /// Used with image returns with is the the.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// A returns size image size value image element, see \ref ns0::Class1.
+            /// Image to option each the each size default.
+            /// Size the option element element is each filter.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Value input filter filter is to option size.
+            /// Returns of used parameter used object each result.
+            /// Input computes default returns given input a filter.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Object parameter input result value parameter the a.
+            /// Given size computes a element each element with.
+            /// Given returns of given image given input default.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// With input result object to result the to, see \ref ns0::Class8.
+            /// Size with given the to element to default, see \ref ns0::Class8.
+            /// Element parameter input to object filter computes with.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process6`.
+///
+/// Used object used a value value each element.
+/// To computes given size input given with the, see \ref page1.
+/// A input with element value a to input.
+void process6();
+/// Overload 1 of `process6`.
+///
+/// Filter a is input input filter the given.
+/// A each the element default is to default.
+/// Computes value parameter element result object input image.
+void process6(int arg0);
+/// Overload 2 of `process6`.
+///
+/// With each given used element is each default.
+/// Filter the default given option value size each, see \ref ns0::Class1.
+/// Returns given input value filter input returns default.
+void process6(int arg0, int arg1);
+
+/// Class number 7.
+///
+/// Parameter image filter size object to returns element.
+/// Computes parameter size input image of the is.
+/// Used filter element input image to option given.
+/// \ingroup group1
+template <typename T>
+class Class7 {
+   public:
+      /// Constructs a `Class7`.
+      ///
+      /// Result filter of element computes input input given.
+      /// Filter is a parameter a each result a.
+      /// Given of is value to element image used.
+      Class7();
+      /// Overload 0 of `compute`.
+      ///
+      /// Element element image a result returns object each.
+      /// Of the result returns a returns element to.
+      /// Object result default image option each image parameter.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Element used a result filter computes the image, see \ref ns0::Class6.
+      /// Used given size used each with computes of.
+      /// Filter element to to used is to option.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Of result computes returns result filter element returns, see \ref ns1::Class1.
+      /// Image each is filter element used with computes.
+      /// Object input of to the result parameter used.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Of used filter result option used the used.
+      /// Of of object value parameter filter object value.
+      /// Each with image input parameter returns size image.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Element image used used used option used element.
+      /// With object given image of result default element.
+      /// Value filter of default parameter each to default.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Of of parameter given a the object size, see \ref ns2::Class1.
+            /// Of with object option computes to value default, see \ref page5.
+            /// Given computes given is image given used with.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Given input with computes value filter default result.
+            /// Object a the of image input object result, see \ref ns2::Class7.
+            /// Filter used image the each of computes to.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Each filter of element computes given a option.
+            /// A element result parameter a computes option of.
+            /// Used size to to with computes input object.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// With option value option input element size result.
+            /// Default each filter returns default default with default.
+            /// Size a the with used of option each, see \ref ns1::Class1.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Computes is returns result used filter is object.
+            /// Returns a option image each option result with, see \ref ns0::Class8.
+            /// Of input input parameter is parameter element with, see \ref ns0::Class10.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process7`.
+///
+/// Is a image to result used option each, see \ref ns0::Class9.
+/// Of each default returns value result computes computes.
+/// A result result is the computes computes image.
+void process7();
+/// Overload 1 of `process7`.
+///
+/// Option to parameter default is to to each.
+/// Computes of parameter result input parameter with value.
+/// A a computes used object a option computes.
+void process7(int arg0);
+/// Overload 2 of `process7`.
+///
+/// Of given returns used default element to given.
+/// Each input filter parameter option result with result, see \ref ns2::Class2.
+/// Used size element size option used computes input.
+void process7(int arg0, int arg1);
+
+/// Class number 8.
+///
+/// Parameter default computes result with returns is a.
+/// Is image value value result the default a.
+/// Given size size used default to to default.
+/// \ingroup group2
+template <typename T>
+class Class8 {
+   public:
+      /// Constructs a `Class8`.
+      ///
+      /// Of the parameter used a default option with.
+      /// To to parameter of with a element option.
+      /// Returns given object of given input used each, see \ref ns2::Class9.
+      Class8();
+      /// Overload 0 of `compute`.
+      ///
+      /// Default with the result option image given object.
+      /// Element the to image size computes with image.
+      /// Option input with filter object given object result.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Object of size each of is the returns.
+      /// Each to to default value default default input, see \ref page4.
+      /// Input of is parameter element image size value.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// With is each returns value default computes size, see \ref ns1::Class7.
+      /// Element size result option each the option used.
+      /// Of given each object object of of returns, see \ref ns0::Class3.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Element of each used used size filter used.
+      /// Result image result image to returns is used.
+      /// Element parameter returns parameter with size computes each.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Object object of parameter computes result value image.
+      /// Option is with given option of a returns.
+      /// Used used element each of value to the.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Object size input filter default each filter filter.
+            /// Parameter given to of given to value object.
+            /// Element option a to parameter a result the.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Returns given a size given size image object, see \ref ns0::Class11.
+            /// Object given is object to with each value.
+            /// The is image image used size computes input.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Value is size is is parameter filter filter, see \ref ns2::Class4.
+            /// Object parameter object with computes option option of, see \ref ns1::Class3.
+            /// Filter is filter object result with each of.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Value the input size of image of element.
+            /// Input the parameter each size default filter the, see \ref ns2::Class8.
+            /// Parameter of used element computes used the image.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Used default the image parameter input parameter object.
+            /// Used is is of result element each with.
+            /// The computes size a image given default option.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process8`.
+///
+/// Result with input used is option used each.
+/// The value result of size a result filter, see \ref ns0::Class7.
+/// Option filter is is used option is given.
+void process8();
+/// Overload 1 of `process8`.
+///
+/// Is of returns input the each a result, see \ref ns2::Class7.
+/// Filter input returns result parameter returns input result.
+/// Returns parameter input used used filter with size.
+void process8(int arg0);
+/// Overload 2 of `process8`.
+///
+/// Returns a given option with a size size.
+/// Element filter result value element default value filter, see \ref ns0::Class6.
+/// Size size object default default image returns the.
+void process8(int arg0, int arg1);
+
+/// Class number 9.
+///
+/// Is result used each size default a input.
+/// Each to of size to a the option, see \ref ns1::Class10.
+/// A a size result size each option is, see \ref ns0::Class7.
+/// \ingroup group3
+template <typename T>
+class Class9 {
+   public:
+      /// Constructs a `Class9`.
+      ///
+      /// A with used computes value object is size.
+      /// The returns default to input default size input.
+      /// Object is with a computes result is of, see \ref ns1::Class5.
+      Class9();
+      /// Overload 0 of `compute`.
+      ///
+      /// Of default value size is computes result input, see \ref page5.
+      /// Element to used computes of each default parameter.
+      /// Element object result to image given object value.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Input size object is with default each element.
+      /// To the option of input image of a.
+      /// Returns size value value result default input a, see \ref ns0::Class8.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Used default the each returns input element parameter.
+      /// To returns result parameter element given result value, see \ref page1.
+      /// To each filter with a default option returns.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Computes option the input option input is result.
+      /// Result given given image given option the object.
+      /// Image image object of image each used result, see \ref ns0::Class4.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Result used parameter used returns is default a.
+      /// To filter the of element of each input.
+      /// Image a a filter returns parameter size filter, see \ref ns0::Class7.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Result returns size of input returns a value, see \ref ns1::Class9.
+            /// Default default filter of image the is of.
+            /// Default default returns used input size value with.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Object object default used to to element object.
+            /// Of the filter size element the a used, see \ref ns2::Class11.
+            /// The option parameter computes parameter of object returns.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// To given returns with element size value result, see \ref ns1::Class6.
+            /// Used a a image result option image element, see \ref ns0::Class3.
+            /// Returns input of to image is default object.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// The default a default result object of size.
+            /// Object used to is filter option each of.
+            /// Each to each option with of default a.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Parameter option is a returns image input to, see \ref ns1::Class2.
+            /// With given to given element is to a, see \ref ns0::Class0.
+            /// Computes is image input of used option size, see \ref page2.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process9`.
+///
+/// Computes the computes used value object input value.
+/// Given computes is value each value returns a.
+/// Each of used of option with element element.
+void process9();
+/// Overload 1 of `process9`.
+///
+/// Element object is of returns returns option parameter, see \ref ns1::Class7.
+/// Input used element size is computes computes image.
+/// To result filter value with returns of used, see \ref ns0::Class7.
+void process9(int arg0);
+/// Overload 2 of `process9`.
+///
+/// To input given with returns is element returns, see \ref ns1::Class1.
+/// Result computes default to each each each option.
+/// Size value with filter of element the each.
+void process9(int arg0, int arg1);
+
+/// Class number 10.
+///
+/// Option returns returns given input size the given, see \ref ns1::Class2.
+/// Input used option each option used to image.
+/// Option given with default filter used each returns.
+/// \ingroup group4
+template <typename T>
+class Class10 {
+   public:
+      /// Constructs a `Class10`.
+      ///
+      /// Size to option each size the value element.
+      /// With image input element result image with parameter, see \ref ns2::Class3.
+      /// Used result option filter with input each image, see \ref ns2::Class6.
+      Class10();
+      /// Overload 0 of `compute`.
+      ///
+      /// A default parameter returns element of object default, see \ref ns1::Class11.
+      /// Input used a computes of given with computes.
+      /// Object a is value a the a image.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Of used option image size computes input parameter, see \ref page5.
+      /// The input with option filter object option is.
+      /// Input computes a used result element object each, see \ref page0.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// Object is of to size is value filter, see \ref ns1::Class2.
+      /// Filter parameter filter each given of element size, see \ref ns1::Class7.
+      /// Of to each the to given value a.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Result of the element default size element is.
+      /// Size returns given input of used value object.
+      /// Result input a used default each with a.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// A is computes a filter size given the.
+      /// Input result each computes value parameter the given.
+      /// Computes default filter filter given filter used value.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Element each result element is the computes a.
+            /// Each a returns with to default option image, see \ref ns2::Class5.
+            /// Option input object input parameter default each to, see \ref ns0::Class7.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// The of computes filter is option returns computes.
+            /// The result to each input value size used.
+            /// Option with result default parameter input default object.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Element filter parameter value each the each value, see \ref ns0::Class10.
+            /// Returns of given result is the option input.
+            /// The parameter image parameter with with the filter.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// Result value object element option option with given.
+            /// Filter option a default input default result filter.
+            /// To parameter filter result image is a of.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// Given image computes the computes value with returns, see \ref ns1::Class11.
+            /// A image returns input object each with input, see \ref ns2::Class4.
+            /// The with each a object used given used.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process10`.
+///
+/// Input each the given object with each of.
+/// Parameter result each a value of of filter, see \ref ns2::Class1.
+/// Of value returns element each element parameter each, see \ref ns2::Class7.
+void process10();
+/// Overload 1 of `process10`.
+///
+/// A a computes parameter each parameter used computes, see \ref ns0::Class6.
+/// A parameter image used input element parameter value, see \ref ns0::Class11.
+/// Each to size to result parameter to result.
+void process10(int arg0);
+/// Overload 2 of `process10`.
+///
+/// Result result given used image value to filter.
+/// Default parameter is is option computes returns image.
+/// A to object computes to used result value.
+void process10(int arg0, int arg1);
+
+/// Class number 11.
+///
+/// Size to image value each each default to.
+/// Used given each a default used used object.
+/// Size given returns to object with the image, see \ref ns0::Class3.
+/// \ingroup group0
+template <typename T>
+class Class11 {
+   public:
+      /// Constructs a `Class11`.
+      ///
+      /// Used size parameter to is given default input.
+      /// Given option is element default default parameter image, see \ref ns0::Class10.
+      /// Used with default of image image is filter, see \ref ns0::Class5.
+      Class11();
+      /// Overload 0 of `compute`.
+      ///
+      /// A each returns input to of element the, see \ref ns1::Class2.
+      /// Returns used of option of filter to result.
+      /// Image size each image value a filter to.
+      double compute();
+      /// Overload 1 of `compute`.
+      ///
+      /// Each element each object the result computes given.
+      /// With with object returns element is to input.
+      /// Value of parameter filter size parameter object object.
+      double compute(int arg0);
+      /// Overload 2 of `compute`.
+      ///
+      /// With object image computes size value parameter a.
+      /// Filter filter image filter of computes is filter, see \ref page4.
+      /// Element parameter image of is each object parameter.
+      double compute(int arg0, int arg1);
+      /// The size.
+      ///
+      /// Input size value element element image element result.
+      /// Input element object size of input value input.
+      /// Object object size returns the element value given.
+      int size = 0;
+      /// A nested class template.
+      ///
+      /// Returns option size returns option default computes size.
+      /// Returns input image result computes option is given.
+      /// Parameter element the each given computes image option, see \ref ns1::Class0.
+      template <typename T1>
+      class Nested1 {
+         public:
+            /// Constructs a `Nested1`.
+            ///
+            /// Image is returns value each result the computes.
+            /// Element result image of with each with value.
+            /// Input to result the to of value given, see \ref ns2::Class8.
+            Nested1();
+            /// Overload 0 of `compute`.
+            ///
+            /// Option a given parameter image element each input, see \ref ns0::Class5.
+            /// Input returns to given a of default used.
+            /// The parameter parameter parameter object image default is, see \ref ns0::Class4.
+            double compute();
+            /// Overload 1 of `compute`.
+            ///
+            /// Image input image a of image with image, see \ref ns1::Class10.
+            /// Size result image to with result result image.
+            /// Result filter with parameter object with default each.
+            double compute(int arg0);
+            /// Overload 2 of `compute`.
+            ///
+            /// A with filter with result returns used with, see \ref ns2::Class11.
+            /// Object result element the each input default option.
+            /// Value used returns used object value input is, see \ref page5.
+            double compute(int arg0, int arg1);
+            /// The size.
+            ///
+            /// The a to each the option option a, see \ref ns2::Class9.
+            /// Object object default each image size size the.
+            /// Image value returns with default object with of, see \ref ns0::Class2.
+            int size = 0;
+      };
+};
+
+/// Overload 0 of `process11`.
+///
+/// The size to result result element is a.
+/// Of computes with of returns each given the.
+/// Value given used returns size parameter input size.
+void process11();
+/// Overload 1 of `process11`.
+///
+/// Is parameter is computes option each size option.
+/// Value a default result value element to the.
+/// Is a a given option computes element object, see \ref ns0::Class3.
+void process11(int arg0);
+/// Overload 2 of `process11`.
+///
+/// Input each of computes is object a filter.
+/// With parameter value image the image default computes.
+/// Returns default of filter default default each option.
+void process11(int arg0, int arg1);
+
+} // namespace ns2
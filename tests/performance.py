@@ -0,0 +1,155 @@
+#! /usr/bin/env python3
+
+# Compares the time and memory used by the main entry points against the baseline stored in
+# `performance_baseline.json`, and exits with an error if any of them got worse by more than the
+# tolerance. The input is the header files in `input/` and `input_large/`, with the Markdown files in
+# `input_large/` and `input/sections.md` (`input/pages.md` would clash with `input_large/pages.md`).
+#
+# Time is the fastest of `--repeat` runs. Memory is the peak memory allocated by Python (measured with
+# `tracemalloc` in a separate run, memory allocated by libclang is not included).
+#
+# Run with `--update` to store a new baseline. Timings depend on the machine, so update the baseline
+# when moving to a different one, and on purpose when a change makes things slower or faster.
+
+import sys, os, inspect, glob
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+import doxpp
+import doxpp.buildtree
+import doxpp.config
+import doxpp.createhtml
+import doxpp.jsonfile
+
+sys.path.insert(0, currentdir)
+from support import html_options
+
+
+baseline_file = os.path.join(currentdir, 'performance_baseline.json')
+
+def input_files():
+    # These files declare members that clash with those in other files
+    clashing = ['enum.h', 'namespace.h', 'templatereference.h', 'union.h', 'unionanonstruct.h',
+                'unknown.h']
+    headers = [f for f in sorted(glob.glob(os.path.join(currentdir, 'input', '*.h')))
+               if os.path.basename(f) not in clashing]
+    headers += sorted(glob.glob(os.path.join(currentdir, 'input_large', '*.h')))
+    markdown_files = [os.path.join(currentdir, 'input', 'sections.md'),
+                      os.path.join(currentdir, 'input_large', 'pages.md')]
+    return ' '.join(headers), ' '.join(markdown_files)
+
+def measure(function, repeat, min_seconds=0.5):
+    # Returns the fastest time of `repeat` calls to `function`, and the peak memory allocated in one more
+    # call with `tracemalloc` tracing. Fast functions are called repeatedly, for at least `min_seconds`,
+    # and the time divided by the number of calls.
+    start = time.perf_counter()
+    function()
+    number = max(1, int(min_seconds / (time.perf_counter() - start)))
+    seconds = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        seconds = min(seconds, (time.perf_counter() - start) / number)
+    tracemalloc.start()
+    try:
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'seconds': seconds, 'python_peak': peak}
+
+def run(repeat):
+    """
+    Measures each of the entry points.
+    :return: dictionary with, for each entry point, a dictionary with 'seconds' and 'python_peak'
+    """
+    results = {}
+    header_files, markdown_files = input_files()
+    options = {'code_formatting': 'no', 'tab_size': 4}
+
+    # Run once to make sure the system include directories are cached
+    data = doxpp.buildtree.buildtree(currentdir, header_files, markdown_files, '-std=c++11', '', options)
+    results['buildtree'] = measure(lambda: doxpp.buildtree.buildtree(
+        currentdir, header_files, markdown_files, '-std=c++11', '', options), repeat)
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_file = os.path.join(directory, 'dox++out.json')
+        doxpp.jsonfile.write_data_to_json_file(data, json_file)
+        html_dir = os.path.join(directory, 'html')
+        os.makedirs(html_dir)
+        html, template_params = html_options(doxpp.config.read(''), directory)
+
+        # Keep the search data of the last run, to time its serialization on its own
+        search_data = []
+        serialize_search_data = doxpp.createhtml.serialize_search_data
+        def keep_search_data(trie, map, *args, **kwargs):
+            search_data[:] = [trie, map]
+            return serialize_search_data(trie, map, *args, **kwargs)
+        doxpp.createhtml.serialize_search_data = keep_search_data
+        try:
+            results['createhtml'] = measure(lambda: doxpp.createhtml.createhtml(
+                json_file, html_dir, html, template_params), repeat)
+        finally:
+            doxpp.createhtml.serialize_search_data = serialize_search_data
+
+    trie, map = search_data
+    results['Trie.serialize'] = measure(trie.serialize, repeat)
+    results['ResultMap.serialize'] = measure(map.serialize, repeat)
+    return results
+
+def compare(results, baseline, time_tolerance, memory_tolerance):
+    # Prints the comparison, returns the list of entry points that got worse
+    regressions = []
+    print('{:>20} | {:>9} {:>9} {:>7} | {:>10} {:>10} {:>7}'.format(
+        'entry point', 'time (s)', 'baseline', 'ratio', 'peak (kB)', 'baseline', 'ratio'))
+    for name, result in results.items():
+        if name not in baseline:
+            print('{:>20} | not in baseline'.format(name))
+            continue
+        time_ratio = result['seconds'] / baseline[name]['seconds']
+        memory_ratio = result['python_peak'] / baseline[name]['python_peak']
+        worse = []
+        if time_ratio > 1 + time_tolerance:
+            worse.append('time')
+        if memory_ratio > 1 + memory_tolerance:
+            worse.append('memory')
+        print('{:>20} | {:>9.3f} {:>9.3f} {:>7.2f} | {:>10.0f} {:>10.0f} {:>7.2f} {}'.format(
+            name, result['seconds'], baseline[name]['seconds'], time_ratio,
+            result['python_peak'] / 1024, baseline[name]['python_peak'] / 1024, memory_ratio,
+            ' '.join('<-- ' + w for w in worse)))
+        if worse:
+            regressions.append(name)
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='dox++ performance regression test.')
+    parser.add_argument('--repeat', type=int, default=5, help='number of times to time each entry point')
+    parser.add_argument('--time-tolerance', type=float, default=0.5,
+                        help='fail if any time is more than this fraction above the baseline')
+    parser.add_argument('--memory-tolerance', type=float, default=0.1,
+                        help='fail if any peak memory is more than this fraction above the baseline')
+    parser.add_argument('--update', action='store_true', help='store the results as the new baseline')
+    args = parser.parse_args()
+
+    doxpp.log.setLevel('error')
+    results = run(args.repeat)
+    if args.update:
+        with open(baseline_file, 'w') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+        print('Baseline written to', baseline_file)
+        sys.exit(0)
+    with open(baseline_file) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.time_tolerance, args.memory_tolerance)
+    if regressions:
+        print('Performance regression in:', ', '.join(regressions))
+        sys.exit(1)
@@ -1,6 +1,13 @@
 #! /usr/bin/env python3
 
 import sys, os, inspect, glob
+import copy
+import json
+import pickle
+import random
+import shutil
+import sqlite3
+import tempfile
 import unittest
 
 currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
@@ -8,8 +15,32 @@ parentdir = os.path.dirname(currentdir)
 sys.path.insert(0, parentdir)
 import doxpp
 import doxpp.buildtree
+import doxpp.config
+import doxpp.createhtml
+import doxpp.database
+import doxpp.jsonfile
+import doxpp.members
+import doxpp.profiling
+import doxpp.search
 import doxpp.walktree
 
+sys.path.insert(0, currentdir)
+import support
+
+
+def to_json(data):
+    return json.dumps(data, default=doxpp.members.json_default)
+
+def default_options(**options):
+    # The options used by all tests, with `options` added
+    return dict({'code_formatting': 'no', 'tab_size': 4}, **options)
+
+def input_header_files():
+    # The root directory and header files of the regression tests, for tests that process many of them
+    # together. enum.h and namespace.h declare members that clash with those in other files.
+    root = os.path.join(currentdir, 'input')
+    return root, ' '.join([f for f in sorted(glob.glob(os.path.join(root, '*.h')))
+                           if os.path.basename(f) not in ['enum.h', 'namespace.h']])
 
 class Regression(unittest.TestCase):
     def setUp(self):
@@ -18,11 +49,646 @@ class Regression(unittest.TestCase):
     def tearDown(self):
         pass
 
+class Parallel(unittest.TestCase):
+    def test_jobs(self):
+        # Parsing in parallel must produce exactly the same output as parsing serially
+        root, h_files = input_header_files()
+        options = default_options()
+        serial = doxpp.buildtree.buildtree(root, h_files, '', '-std=c++11', '', options)
+        options['jobs'] = 4
+        parallel = doxpp.buildtree.buildtree(root, h_files, '', '-std=c++11', '', options)
+        self.assertEqual(to_json(parallel), to_json(serial))
+
+    def test_ast_files_removed(self):
+        # Each AST file written by a worker process must be deleted as soon as it's loaded
+        root = os.path.join(currentdir, 'input')
+        h_files = ' '.join(os.path.join(root, f) for f in ['class.h', 'function.h', 'overloads.h'])
+        options = default_options(jobs=2)
+        loaded = []
+        load_parsed_header = doxpp.buildtree.load_parsed_header
+        def check_load_parsed_header(index, parsed_header, *args, **kwargs):
+            output = load_parsed_header(index, parsed_header, *args, **kwargs)
+            self.assertIsNotNone(output[0])
+            self.assertFalse(os.path.exists(parsed_header[1]))
+            loaded.append(parsed_header[1])
+            return output
+        doxpp.buildtree.load_parsed_header = check_load_parsed_header
+        try:
+            data = doxpp.buildtree.buildtree(root, h_files, '', '-std=c++11', '', options)
+        finally:
+            doxpp.buildtree.load_parsed_header = load_parsed_header
+        self.assertEqual(len(loaded), 3)
+        self.assertTrue(data['members'])
+
+class Umbrella(unittest.TestCase):
+    def test_umbrella(self):
+        # Parsing all header files as a single translation unit must produce the same output as parsing
+        # each one separately
+        root = os.path.join(currentdir, 'input')
+        # Most other files declare members that clash with those in these files
+        h_files = ' '.join([os.path.join(root, f) for f in ['abstract.h', 'default_parameters.h', 'file.h',
+                            'function.h', 'functionpointer.h', 'groups.h', 'macro.h', 'multins.h', 'overloads.h',
+                            'page.h', 'sfinae.h']])
+        options = default_options()
+        separate = doxpp.buildtree.buildtree(root, h_files, '', '-std=c++11', '', options)
+        options['umbrella'] = True
+        umbrella = doxpp.buildtree.buildtree(root, h_files, '', '-std=c++11', '', options)
+        self.assertEqual(to_json(umbrella), to_json(separate))
+
+class PrefixHeaders(unittest.TestCase):
+    def test_prefix_headers(self):
+        # Using a precompiled header must produce the same output as not using one
+        root, h_files = input_header_files()
+        options = default_options()
+        expected = doxpp.buildtree.buildtree(root, h_files, '', '-std=c++11', '', options)
+        options['prefix_headers'] = 'string list limits type_traits'
+        data = doxpp.buildtree.buildtree(root, h_files, '', '-std=c++11', '', options)
+        self.assertEqual(to_json(data), to_json(expected))
+
+class Cache(unittest.TestCase):
+    def test_cache(self):
+        # Using cached header files must produce exactly the same output as parsing them
+        root, h_files = input_header_files()
+        options = default_options()
+        expected = to_json(doxpp.buildtree.buildtree(root, h_files, '', '-std=c++11', '', options))
+        with tempfile.TemporaryDirectory() as cache_dir:
+            options['cache_dir'] = cache_dir
+            for jobs in [4, 1]:  # The first run fills the cache, the second one uses it
+                options['jobs'] = jobs
+                data = doxpp.buildtree.buildtree(root, h_files, '', '-std=c++11', '', options)
+                self.assertEqual(to_json(data), expected)
+            self.assertEqual(len(glob.glob(os.path.join(cache_dir, '*.json'))), len(h_files.split()))
+
+    def test_cache_invalidation(self):
+        # Changing a file included by a cached header file causes it to be parsed again
+        with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as cache_dir:
+            with open(os.path.join(root, 'main.h'), 'w') as f:
+                f.write('#include "value.h"\n/// Docs\nenum Foo { foo = VALUE };\n')
+            options = default_options(cache_dir=cache_dir)
+            for value in ['1', '1', '2']:
+                with open(os.path.join(root, 'value.h'), 'w') as f:
+                    f.write('#define VALUE ' + value + '\n')
+                data = doxpp.buildtree.buildtree(root, os.path.join(root, 'main.h'), '', '-std=c++11', '', options)
+                self.assertEqual(data['members'][0]['members'][0]['value'], int(value))
+
+    def test_damaged_manifest(self):
+        # A manifest that is valid JSON but not what we expect means the header file must be parsed again
+        with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as cache_dir:
+            filename = os.path.join(root, 'main.h')
+            with open(filename, 'w') as f:
+                f.write('/// Docs\nenum Foo { foo };\n')
+            options = default_options(cache_dir=cache_dir)
+            expected = doxpp.buildtree.buildtree(root, filename, '', '-std=c++11', '', options)
+            manifest = glob.glob(os.path.join(cache_dir, '*.json'))[0]
+            with open(manifest) as f:
+                contents = json.load(f)
+            for damaged in [{}, [], dict(contents, files=None), {k: v for k, v in contents.items() if k != 'diagnostics'}]:
+                with open(manifest, 'w') as f:
+                    json.dump(damaged, f)
+                self.assertEqual(doxpp.buildtree.buildtree(root, filename, '', '-std=c++11', '', options), expected)
+                with open(manifest) as f:
+                    self.assertEqual(json.load(f), contents)
+
+    def test_cache_pruning(self):
+        # Entries for header files that are no longer parsed are removed from the cache
+        with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as cache_dir:
+            for name in ['a.h', 'b.h']:
+                with open(os.path.join(root, name), 'w') as f:
+                    f.write('/// Docs\nenum {} {{ foo }};\n'.format(name[0].upper()))
+            with open(os.path.join(cache_dir, 'other.txt'), 'w') as f:
+                f.write('Not ours\n')
+            options = default_options(cache_dir=cache_dir)
+            both = ' '.join(os.path.join(root, name) for name in ['a.h', 'b.h'])
+            doxpp.buildtree.buildtree(root, both, '', '-std=c++11', '', options)
+            self.assertEqual(len(os.listdir(cache_dir)), 5)
+            os.remove(os.path.join(root, 'b.h'))
+            doxpp.buildtree.buildtree(root, os.path.join(root, 'a.h'), '', '-std=c++11', '', options)
+            self.assertEqual(len(os.listdir(cache_dir)), 3)
+            self.assertTrue(os.path.isfile(os.path.join(cache_dir, 'other.txt')))
+            manifests = glob.glob(os.path.join(cache_dir, '*.json'))
+            with open(manifests[0]) as f:
+                self.assertEqual(json.load(f)['file'], os.path.realpath(os.path.join(root, 'a.h')))
+
+class FindMember(unittest.TestCase):
+    def test_symbol_table(self):
+        # Looking up names with a symbol table must find the same members as searching the tree
+        root = os.path.join(currentdir, 'input')
+        options = default_options()
+        for file in sorted(glob.glob(os.path.join(root, '*.h'))):
+            data = doxpp.buildtree.buildtree(root, file, '', '-std=c++11', '', options)
+            members = doxpp.walktree.create_member_dict(data['members'])
+            symbols = doxpp.buildtree.SymbolTable(members)
+            for member in members.values():
+                if not member['id']:
+                    continue
+                name = doxpp.walktree.get_fully_qualified_name(member['id'], members)
+                for start_id in [member['id'], member['parent'], '']:
+                    self.assertEqual(doxpp.buildtree.find_member(name, start_id, members, symbols),
+                                     doxpp.buildtree.find_member(name, start_id, members))
+
+    def test_lookup_cache(self):
+        # Repeated lookups, also of names that don't exist, must come from the cache and give the same result
+        root = os.path.join(currentdir, 'input')
+        options = default_options()
+        data = doxpp.buildtree.buildtree(root, os.path.join(root, 'overloads.h'), '', '-std=c++11', '', options)
+        members = doxpp.walktree.create_member_dict(data['members'])
+        symbols = doxpp.buildtree.SymbolTable(members)
+        symbols.cache_function_lookups = True
+        names = {doxpp.walktree.get_fully_qualified_name(id, members) for id in members if id}
+        names.add('does_not_exist')
+        for name in names:
+            expected = doxpp.buildtree.find_member(name, '', members)
+            self.assertEqual(doxpp.buildtree.find_member(name, '', members, symbols), expected)
+            self.assertEqual(doxpp.buildtree.find_member(name, '', members, symbols), expected)
+        self.assertEqual(symbols.lookups, 2 * len(names))
+        self.assertEqual(symbols.hits, len(names))
+
+class Member(unittest.TestCase):
+    def test_member(self):
+        # A `Member` must behave like a dictionary
+        plain = {'id': 'a', 'name': 'a', 'member_type': 'function', 'members': []}
+        member = doxpp.members.Member(plain)
+        self.assertEqual(member, plain)
+        self.assertEqual(list(member.items()), list(plain.items()))
+        self.assertEqual(member.name, 'a')
+        self.assertEqual(member.get('brief', ''), '')
+        self.assertNotIn('brief', member)
+        member['brief'] = 'Brief'
+        plain['brief'] = 'Brief'
+        self.assertEqual(list(member), list(plain))
+        del member['name']
+        del plain['name']
+        self.assertEqual(list(member.items()), list(plain.items()))
+        with self.assertRaises(KeyError):
+            member['name']
+        with self.assertRaises(AttributeError):
+            member.name
+        # Members with the same keys share their shape
+        other = doxpp.members.Member(plain)
+        self.assertIs(other._shape, member._shape)
+        self.assertEqual(other, member)
+        copy = member.copy()
+        copy['brief'] = 'Other'
+        self.assertEqual(member['brief'], 'Brief')
+        self.assertNotEqual(copy, member)
+        # JSON and pickle
+        self.assertEqual(to_json(member), json.dumps(plain))
+        self.assertEqual(json.loads(to_json(member), object_hook=doxpp.members.json_object_hook), member)
+        self.assertEqual(pickle.loads(pickle.dumps(member)), member)
+
+    def test_merge_member(self):
+        # Children are merged by ID
+        def namespace(*children):
+            member = doxpp.members.new_member('ns', 'ns', 'namespace')
+            member['members'] = [doxpp.members.new_member(id, id, 'class', 'ns') for id in children]
+            return member
+        member = namespace('a', 'b')
+        doxpp.buildtree.merge_member(member, namespace('b', 'c', 'c'))
+        self.assertEqual([m['id'] for m in member['members']], ['a', 'b', 'c'])
+
+class Commands(unittest.TestCase):
+    def test_find_commands(self):
+        find_commands = doxpp.buildtree.find_commands
+        self.assertEqual(find_commands('No commands at all.'), frozenset())
+        self.assertEqual(find_commands('Mail me@example.com'), {'example'})
+        self.assertEqual(find_commands('\\ref foo, @see bar\\n\\sa baz \\\\section x'), {'ref', 'see', 'n', 'sa', 'section'})
+        self.assertEqual(find_commands('\\relates\\related \\refs'), {'relates', 'related', 'refs'})
+
+class Comments(unittest.TestCase):
+    def check_comments(self, filename, compiler_flags):
+        # The comments we find must be exactly the comment tokens libclang finds
+        index = doxpp.buildtree.cindex.Index.create()
+        tu = index.parse(filename, ['-xc++'] + compiler_flags, options=doxpp.buildtree.parse_options)
+        tokens = list(tu.get_tokens(extent=tu.cursor.extent))
+        expected = []
+        previous = -2
+        for ii, t in enumerate(tokens):
+            if t.kind == doxpp.buildtree.cindex.TokenKind.COMMENT:
+                expected.append((t.location.offset, t.extent.end.offset, t.spelling, previous == ii - 1))
+                previous = ii
+        self.assertEqual(doxpp.buildtree.TokenIndex(tu, filename).comments, expected)
+
+    def test_input_files(self):
+        for file in sorted(glob.glob(os.path.join(currentdir, 'input', '*.h'))):
+            with self.subTest(file=os.path.basename(file)):
+                self.check_comments(file, ['-std=c++11', '-I' + os.path.join(currentdir, 'input')])
+
+    def test_literals(self):
+        # Things that look like comments but aren't
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'literals.h')
+            with open(filename, 'w') as f:
+                f.write(r'''/// Line comment \
+   continued on the next line
+int a = 1'000; // after a digit separator
+const char* b = "not // a comment /* either */";
+const char* c = R"x(raw // string */ )" still )x"; /// comment
+const char d = '"'; /*! block */
+const char* e = u8R"(/* not a comment */)";
+#define FOOR "string" // comment
+char f = '\''; //! comment
+int g = 0x1'F'FF; /**/ /// adjacent
+''')
+            self.check_comments(filename, ['-std=c++14'])
+
+    def test_lexer_corner_cases(self):
+        # libclang doesn't lex header names as a single token, but it does end unterminated literals at the end of the line
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, 'a'))
+            with open(os.path.join(tmp, 'a', 'b.h'), 'w') as f:
+                f.write('/// Not in the main file\nint b;\n')
+            filename = os.path.join(tmp, 'corner.h')
+            with open(filename, 'w') as f:
+                f.write(r'''#include <a//b.h> /// comment
+  #  include<a/*x*/b.h> // comment
+#import <a//b.h>
+#if __has_include(<a//b.h>) /*! comment */
+#endif
+#if 0
+It's a header // not a comment
+The "quote // not a comment
+#endif
+/// A comment after it
+int a = b < 2 // comment
+   > 1;
+''')
+            self.check_comments(filename, ['-std=c++11', '-I' + tmp])
+
+class SystemIncludes(unittest.TestCase):
+    def test_failure_not_cached(self):
+        # If running clang++ fails, it must be run again next time
+        libclang = doxpp.buildtree.libclang
+        if not shutil.which('clang++'):
+            self.skipTest('clang++ not found')
+        results = [([], ''), (['/usr/include'], '')]
+        calls = []
+        def probe_system_includes(f):
+            calls.append(f)
+            return results[len(calls) - 1]
+        probe, cache_home = libclang.probe_system_includes, os.environ.get('XDG_CACHE_HOME')
+        with tempfile.TemporaryDirectory() as tmp:
+            libclang.probe_system_includes = probe_system_includes
+            os.environ['XDG_CACHE_HOME'] = tmp
+            libclang.system_includes_cache.clear()
+            try:
+                self.assertEqual(libclang.get_system_includes('-std=c++11'), ([], ''))
+                self.assertFalse(os.path.exists(libclang.get_system_includes_cache_file()))
+                self.assertEqual(libclang.get_system_includes('-std=c++11'), (['/usr/include'], ''))
+                self.assertEqual(libclang.get_system_includes('-std=c++11'), (['/usr/include'], ''))
+                self.assertEqual(len(calls), 2)
+                self.assertTrue(os.path.exists(libclang.get_system_includes_cache_file()))
+            finally:
+                libclang.probe_system_includes = probe
+                if cache_home is None:
+                    del os.environ['XDG_CACHE_HOME']
+                else:
+                    os.environ['XDG_CACHE_HOME'] = cache_home
+                libclang.system_includes_cache.clear()
+
+class CachedCursor(unittest.TestCase):
+    def test_cached_cursor(self):
+        # The wrapped cursors must give the same results as the plain ones
+        cindex = doxpp.buildtree.cindex
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'cursors.h')
+            with open(filename, 'w') as f:
+                f.write('''namespace ns {
+class A {
+   void f();
+   template<typename T> struct B { int g(); };
+};
+}
+void ns::A::f() {}
+namespace ns { int h(); }
+''')
+            index = cindex.Index.create()
+            tu = index.parse(filename, ['-xc++', '-std=c++11'], options=doxpp.buildtree.parse_options)
+            cursors = {}
+            visited = {}
+            def visit(item, cursor):
+                self.assertEqual(item.cursor, cursor)
+                self.assertEqual(item.kind, cursor.kind)
+                self.assertEqual(item.get_usr(), cursor.get_usr())
+                if cursor.semantic_parent is None:
+                    self.assertIsNone(item.semantic_parent)
+                else:
+                    self.assertEqual(item.semantic_parent.cursor, cursor.semantic_parent)
+                    self.assertEqual(item.semantic_parent.get_usr(), cursor.semantic_parent.get_usr())
+                visited[item.displayname] = item  # the last one, for f() the definition
+                children = list(item.get_children())
+                expected = list(cursor.get_children())
+                self.assertEqual(children, expected)
+                for child, expected_child in zip(children, expected):
+                    visit(doxpp.buildtree.CachedCursor(child, cursors), expected_child)
+            visit(doxpp.buildtree.CachedCursor(tu.cursor, cursors), tu.cursor)
+            # The semantic parent of a definition outside the class is the class we saw before
+            self.assertIs(visited['f()'].semantic_parent, visited['A'])
+            self.assertEqual([c.get_usr() for c in visited.values()],
+                             [c.cursor.get_usr() for c in visited.values()])
+
+class ProcessType(unittest.TestCase):
+    def test_cache(self):
+        # Cached types must be the same as uncached ones, and safe to modify
+        cindex = doxpp.buildtree.cindex
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'types.h')
+            with open(filename, 'w') as f:
+                f.write('''namespace ns { class A {}; using B = A; }
+namespace other { class A {}; }
+void f(ns::A const& a, ns::A const& b, const ns::B* c, int d[3], ns::A (*g)(int, ns::A const&));
+void h(other::A const& a, unsigned int const e, void (*g)(int, ns::A const&), ns::A const& b);
+''')
+            index = cindex.Index.create()
+            tu = index.parse(filename, ['-xc++', '-std=c++11'], options=doxpp.buildtree.parse_options)
+            cache = {}
+            for cursor in tu.cursor.get_children():
+                if cursor.kind != cindex.CursorKind.FUNCTION_DECL:
+                    continue
+                for arg in cursor.get_arguments():
+                    with self.subTest(type=arg.type.spelling):
+                        expected = doxpp.buildtree.process_type(arg.type, arg)
+                        output = doxpp.buildtree.process_type(arg.type, arg, cache)
+                        self.assertEqual(output, expected)
+                        output['qualifiers'] = ''.join(output['qualifiers'])
+                        output['id'] = 'some-id'
+                        if 'retval' in output:
+                            output['retval']['qualifiers'].append('&')
+                            output['arguments'][0]['typename'] = 'changed'
+                        self.assertEqual(doxpp.buildtree.process_type(arg.type, arg, cache), expected)
+            self.assertEqual(len(cache), 7)  # Built-in types are not cached, repeated types only once
+
+class Stress(unittest.TestCase):
+    def test_long_names_and_deep_nesting(self):
+        # Neither very long names nor deeply nested declarations must hit Python's recursion limit
+        depth = 200
+        long_name = 'long' + 'name' * 1249  # 5000 characters, without suffixes to search for
+        with tempfile.TemporaryDirectory() as tmp:
+            header = os.path.join(tmp, 'stress.h')
+            with open(header, 'w') as f:
+                f.write('/// \\file\n/// Stress test.\n\n')
+                f.write('/// A class with a long name.\nclass {0} {{\n   public:\n'
+                        '      /// A method with a long name.\n      void method_{0}();\n}};\n'.format(long_name))
+                f.write('/// A function with a long name.\nvoid function_{0}(int a);\n'.format(long_name))
+                for ii in range(depth):
+                    f.write('/// Namespace {0}.\nnamespace ns{0} {{\n'.format(ii))
+                f.write('/// A class.\nstruct Inner {\n   /// A method.\n   void f();\n};\n')
+                f.write('}\n' * depth)
+            options = default_options()
+            data = doxpp.buildtree.buildtree(tmp, header, '', '-std=c++11', '', options)
+            members = doxpp.walktree.create_member_dict(data['members'])
+            self.assertEqual(len(members), depth + 6)
+            self.assertIn(long_name, [m.get('name') for m in members.values()])
+            inner = [id for id, m in members.items() if m.get('name') == 'Inner']
+            self.assertEqual(doxpp.walktree.get_fully_qualified_name(inner[0], members),
+                             '::'.join('ns{}'.format(ii) for ii in range(depth)) + '::Inner')
+            # We can't write the HTML pages, their file names are too long, but we can do everything else
+            html_options, _ = support.html_options(doxpp.config.read(''), tmp)
+            status = doxpp.createhtml.Status(data, html_options)
+            doxpp.createhtml.generate_fully_qualified_names(status.data['members'], status)
+            doxpp.createhtml.assign_page(status)
+            search_data = doxpp.createhtml.build_search_data(status, True, True)
+            self.assertGreater(len(search_data), 2 * len(long_name))
+
+class TrieBuilder(unittest.TestCase):
+    def test_same_as_insert(self):
+        # The bulk builder must produce the same trie as inserting the keys one by one
+        rng = random.Random(0)
+        trie = doxpp.search.Trie()
+        builder = doxpp.search.TrieBuilder()
+        for index in range(2000):
+            key = ''.join(rng.choice('abc:\u00e9') for _ in range(rng.randint(0, 12)))
+            barriers = sorted(rng.sample(range(15), rng.randint(0, 3)))
+            if rng.random() < 0.2:
+                barriers.reverse()  # Out of order barriers are ignored from there on
+            trie.insert(key, index, lookahead_barriers=barriers)
+            builder.insert(key, index, lookahead_barriers=barriers)
+        output = builder.build()
+        self.assertEqual(doxpp.createhtml.count_trie_nodes(output), doxpp.createhtml.count_trie_nodes(trie))
+        self.assertEqual(output.serialize(), trie.serialize())
+
+class FindFile(unittest.TestCase):
+    def test_header_index(self):
+        # Looking up file names with a header index must find the same headers as searching the list
+        headers = {}
+        for ii, name in enumerate(['a.h', 'sub/a.h', 'x/sub/a.h', 'sub/b.h', 'other/sub/b.h', 'c/d/e.h',
+                                   'best/c.h', 'y/best/c.h']):
+            name = name.replace('/', os.sep)
+            headers['file{}'.format(ii)] = {'id': 'file{}'.format(ii), 'name': name}
+        index = doxpp.buildtree.HeaderIndex(headers)
+        for name in ['a.h', 'sub/a.h', 'x/sub/a.h', 'b.h', 'sub/b.h', 'e.h', 'd/e.h', 'c/d/e.h', 'c.h',
+                     'best/c.h', 'best', 'f.h', 'y/sub/a.h', '', 'a/b/c/d/e.h']:
+            name = name.replace('/', os.sep)
+            self.assertEqual(doxpp.buildtree.find_file(name, headers, index),
+                             doxpp.buildtree.find_file(name, headers))
+
+class Watch(unittest.TestCase):
+    def test_watch_session(self):
+        # Header files kept in memory must give the same output as parsing them anew, also after a change
+        options = default_options()
+        with tempfile.TemporaryDirectory() as root:
+            for f in ['class.h', 'function.h', 'overloads.h']:
+                shutil.copy(os.path.join(currentdir, 'input', f), root)
+            h_files = os.path.join(root, '*.h')
+            session = doxpp.buildtree.WatchSession()
+            data = doxpp.buildtree.buildtree(root, h_files, '', '-std=c++11', '', dict(options, session=session))
+            self.assertEqual(data, doxpp.buildtree.buildtree(root, h_files, '', '-std=c++11', '', options))
+            self.assertEqual(session.changed_files(), [])
+            tus = {f: entry[0] for f, entry in session.translation_units.items()}
+
+            filename = os.path.realpath(os.path.join(root, 'function.h'))
+            with open(filename, 'a') as f:
+                f.write('\n/// A new function.\nvoid new_function();\n')
+            os.utime(filename, ns=(0, 0))  # Make sure the modification time changes
+            self.assertEqual(session.changed_files(), [filename])
+            data = doxpp.buildtree.buildtree(root, h_files, '', '-std=c++11', '', dict(options, session=session))
+            self.assertEqual(data, doxpp.buildtree.buildtree(root, h_files, '', '-std=c++11', '', options))
+            self.assertIn('new_function', [m['name'] for m in data['members']])
+            self.assertEqual(session.changed_files(), [])
+            for f, entry in session.translation_units.items():
+                self.assertIs(entry[0], tus[f])  # Reparsed in place
+
+            os.remove(os.path.join(root, 'overloads.h'))
+            self.assertEqual(session.changed_files(), [os.path.realpath(os.path.join(root, 'overloads.h'))])
+            doxpp.buildtree.buildtree(root, h_files, '', '-std=c++11', '', dict(options, session=session))
+            self.assertEqual(len(session.translation_units), 2)
+
+    def test_watch_html(self):
+        # dox++html --watch passes the same template parameters to each call, they must be left unchanged
+        root = os.path.join(currentdir, 'input')
+        h_files = ' '.join(os.path.join(root, f) for f in ['class.h', 'function.h'])
+        data = doxpp.buildtree.buildtree(root, h_files, '', '-std=c++11', '', default_options())
+        with tempfile.TemporaryDirectory() as tmp:
+            json_file = os.path.join(tmp, 'out.json')
+            doxpp.jsonfile.write_data_to_json_file(data, json_file)
+            options, template_params = support.html_options(doxpp.config.read(''), tmp)
+            expected = copy.deepcopy(template_params)
+            outputs = []
+            for html_dir in ['html1', 'html2']:
+                html_dir = os.path.join(tmp, html_dir)
+                os.makedirs(html_dir)
+                doxpp.createhtml.createhtml(json_file, html_dir, options, template_params)
+                self.assertEqual(template_params, expected)
+                with open(os.path.join(html_dir, 'index.html')) as f:
+                    outputs.append(f.read())
+            self.assertEqual(outputs[0], outputs[1])
+
+class Profile(unittest.TestCase):
+    def test_profile(self):
+        # Each phase must be recorded, with its counts
+        root = os.path.join(currentdir, 'input')
+        profile = doxpp.profiling.Profile()
+        options = default_options(profile=profile)
+        data = doxpp.buildtree.buildtree(root, os.path.join(root, 'class.h'), '', '-std=c++11', '', options)
+        phases = [r['phase'] for r in profile.records]
+        self.assertEqual(phases, ['parse', 'diagnostics', 'extract_includes', 'process_comments',
+                                  'extract_declarations', 'process_documentation_commands', 'symbol_table',
+                                  'post_process_types', 'post_process_inheritance', 'post_process_relates',
+                                  'post_process_links', 'post_process_subpages'])
+        members = doxpp.walktree.create_member_dict(data['members'])
+        self.assertEqual(profile.records[4]['members_added'], len(members) - 1)
+        self.assertTrue(all(r['seconds'] >= 0 for r in profile.records))
+        with tempfile.TemporaryDirectory() as tmp:
+            profile.write(os.path.join(tmp, 'profile.json'))
+            with open(os.path.join(tmp, 'profile.json')) as f:
+                self.assertEqual(len(json.load(f)), len(profile.records))
+            profile.write(os.path.join(tmp, 'profile.csv'))
+            with open(os.path.join(tmp, 'profile.csv')) as f:
+                self.assertEqual(len(f.readlines()), len(profile.records) + 1)
+
+    def test_umbrella_profile(self):
+        # With a single translation unit, the phases for each header file must be recorded too
+        root = os.path.join(currentdir, 'input')
+        h_files = [os.path.join(root, f) for f in ['class.h', 'function.h']]
+        profile = doxpp.profiling.Profile()
+        options = default_options(umbrella=True, profile=profile)
+        data = doxpp.buildtree.buildtree(root, ' '.join(h_files), '', '-std=c++11', '', options)
+        records = [r for r in profile.records if r['file']]
+        self.assertEqual([(r['phase'], r['file']) for r in records],
+                         [(phase, f) for f in h_files
+                          for phase in ['extract_includes', 'process_comments', 'extract_declarations']])
+        members = doxpp.walktree.create_member_dict(data['members'])
+        self.assertEqual(sum(r['members_added'] for r in records if 'members_added' in r), len(members) - 1)
+        self.assertTrue(all(r['cursors_visited'] > 0 for r in records if 'cursors_visited' in r))
+
+    def test_report(self):
+        # Records added after the fact, and extra fields, must end up in the report
+        profile = doxpp.profiling.Profile()
+        for file, seconds in [('a.html', 0.2), ('b.html', 0.5), ('c.html', 0.1)]:
+            profile.add({'phase': 'render_page', 'file': file, 'seconds': seconds, 'bytes': 100})
+        profile.add({'phase': 'build_search_data', 'file': '', 'seconds': 1.0, 'trie_nodes': 10})
+        self.assertEqual([r['file'] for r in profile.slowest('render_page', 2)], ['b.html', 'a.html'])
+        with tempfile.TemporaryDirectory() as tmp:
+            profile.write(os.path.join(tmp, 'profile.csv'))
+            with open(os.path.join(tmp, 'profile.csv')) as f:
+                self.assertEqual(f.readline().strip(), 'phase,file,seconds,max_rss,python_peak,bytes,trie_nodes')
+        disabled = doxpp.profiling.Profile(enabled=False)
+        disabled.add({'phase': 'render_page', 'file': 'a.html', 'seconds': 0.2})
+        self.assertEqual(disabled.records, [])
+
+class JSONFile(unittest.TestCase):
+    def test_write_and_read(self):
+        # The JSON file must be identical to what `json.dumps` produces, and read back to the same data,
+        # also when read in small chunks and with a string table
+        root, h_files = input_header_files()
+        options = default_options()
+        data = doxpp.buildtree.buildtree(root, h_files, '', '-std=c++11', '', options)
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'out.json')
+            for readable, format in [(False, {'separators': (',', ':')}), (True, {'indent': 2})]:
+                doxpp.jsonfile.write_data_to_json_file(data, filename, readable=readable)
+                with open(filename) as f:
+                    self.assertEqual(f.read(), json.dumps(data, default=doxpp.members.json_default, **format))
+                self.assertEqual(doxpp.walktree.load_data_from_json_file(filename), data)
+                doxpp.jsonfile.write_data_to_json_file(data, filename, readable=readable, string_table=True)
+                with open(filename) as f:
+                    self.assertEqual(doxpp.jsonfile.JSONReader(f, chunk_size=7).read_dict(top_level=True), data)
+                self.assertEqual(doxpp.walktree.load_data_from_json_file(filename), data)
+
+class Database(unittest.TestCase):
+    def test_write_and_read(self):
+        # The database must read back to the same data
+        root, h_files = input_header_files()
+        options = default_options()
+        data = doxpp.buildtree.buildtree(root, h_files, '', '-std=c++11', '', options)
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'out.db')
+            doxpp.database.write_data_to_database(data, filename)
+            doxpp.database.write_data_to_database(data, filename)  # Replaces the contents
+            self.assertEqual(to_json(doxpp.database.read_data_from_database(filename)), to_json(data))
+            members = doxpp.walktree.create_member_dict(data['members'])
+            self.assertEqual(doxpp.database.read_member_briefs(filename),
+                             [(id, member['brief']) for id, member in members.items() if id])
+            partial = doxpp.database.read_data_from_database(filename, doc=False)
+            for id, member in doxpp.walktree.create_member_dict(partial['members']).items():
+                if id:
+                    self.assertEqual(member['doc'], bool(members[id]['doc']))
+
+    def test_update(self):
+        # Updating the database with some headers must keep what the other headers contributed
+        with tempfile.TemporaryDirectory() as root:
+            files = {
+                'a.h': '/// Namespace brief.\n///\n/// Namespace doc.\nnamespace ns {\n/// Class A.\nclass A {};\n}\n',
+                'b.h': '#include "a.h"\nnamespace ns {\n/// Class B.\nclass B : public A {};\n}\n',
+                'c.h': '#include "a.h"\nnamespace ns {\n/// Function f, see \\ref ns::A.\nvoid f();\n}\n'
+            }
+            for name, contents in files.items():
+                with open(os.path.join(root, name), 'w') as f:
+                    f.write(contents)
+            h_files = [os.path.join(root, name) for name in sorted(files)]
+            options = default_options()
+            expected = doxpp.walktree.create_member_dict(
+                doxpp.buildtree.buildtree(root, ' '.join(h_files), '', '-std=c++11', '', options)['members'])
+            filename = os.path.join(root, 'out.db')
+            for updated in ['c.h', 'b.h', 'a.h']:
+                doxpp.database.write_data_to_database(
+                    doxpp.buildtree.buildtree(root, ' '.join(h_files), '', '-std=c++11', '', options), filename)
+                options['base_data'] = doxpp.database.read_data_from_database(filename)
+                data = doxpp.buildtree.buildtree(root, os.path.join(root, updated), '', '-std=c++11', '', options)
+                del options['base_data']
+                self.assertEqual(write_and_record_changes(data, filename), [])  # Nothing changed
+                result = doxpp.walktree.create_member_dict(doxpp.database.read_data_from_database(filename)['members'])
+                self.assertEqual(sorted(result), sorted(expected))
+                for id, member in result.items():
+                    if id:
+                        # The order of the members of a namespace or class can differ from that of a full run
+                        self.assertEqual(sorted(m['id'] for m in member.get('members', [])),
+                                         sorted(m['id'] for m in expected[id].get('members', [])))
+                        self.assertEqual(to_json({k: v for k, v in member.items() if k != 'members'}),
+                                         to_json({k: v for k, v in expected[id].items() if k != 'members'}))
+            names = {member['name']: id for id, member in expected.items() if id}
+            self.assertEqual(expected[names['ns']]['brief'], 'Namespace brief.')
+            self.assertEqual(expected[names['B']]['bases'][0]['id'], names['A'])
+            self.assertIn('(#{})'.format(names['A']), expected[names['f']]['brief'])
+
+            # Only the rows that changed are written
+            with open(h_files[2], 'w') as f:
+                f.write(files['c.h'].replace('void f();', 'void g();'))
+            options['base_data'] = doxpp.database.read_data_from_database(filename)
+            data = doxpp.buildtree.buildtree(root, h_files[2], '', '-std=c++11', '', options)
+            self.assertEqual(write_and_record_changes(data, filename), [names['f'].replace('f', 'g')])
+            result = doxpp.database.read_data_from_database(filename)
+            self.assertEqual(result, data)
+            self.assertNotIn(names['f'], doxpp.walktree.create_member_dict(result['members']))
+
+def write_and_record_changes(data, filename):
+    # Updates the database `filename` with `data`, and returns the IDs of the members that were written
+    connection = sqlite3.connect(filename)
+    connection.executescript('''
+        CREATE TABLE IF NOT EXISTS written (id TEXT);
+        DELETE FROM written;
+        CREATE TRIGGER IF NOT EXISTS member_written AFTER INSERT ON members
+            BEGIN INSERT INTO written VALUES (new.id); END;
+        ''')
+    connection.close()
+    doxpp.database.write_data_to_database(data, filename, update=True)
+    connection = sqlite3.connect(filename)
+    try:
+        return [id for id, in connection.execute('SELECT id FROM written')]
+    finally:
+        connection.close()
+
 def create_test(name, root, h_file, md_file, json_file):
-    options = {
-        'code_formatting': 'no',
-        'tab_size': 4
-    }
+    options = default_options()
     def t(self):
         data = doxpp.buildtree.buildtree(root, h_file, md_file, '-std=c++11', '', options)
         expected = doxpp.walktree.load_data_from_json_file(json_file)
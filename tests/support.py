@@ -0,0 +1,49 @@
+# Helpers shared by the regression tests, the performance test and the benchmark. Each of these adds the
+# repository root and this directory to `sys.path` before importing this module.
+
+import os
+
+import doxpp.config
+import doxpp.createhtml
+
+
+def html_options(config, directory):
+    # Options for `createhtml()`, as dox++html would set them with a default configuration
+    options = {
+        'show_private_virtual': doxpp.config.get_boolean(config, 'html', 'document private virtual members'),
+        'show_private_nonvirtual': doxpp.config.get_boolean(config, 'html', 'document private non-virtual members'),
+        'show_protected': doxpp.config.get_boolean(config, 'html', 'document protected members'),
+        'show_undocumented': doxpp.config.get_boolean(config, 'html', 'document undocumented members'),
+        'modify_include_statement': lambda id: id,
+        'extra_files': [],
+        'templates': doxpp.createhtml.default_templates,
+        'source_files': [],
+        'doc_link_class': doxpp.config.get(config, 'html', 'documentation link class'),
+        'add_snake_case_suffixes': doxpp.config.get_boolean(config, 'search', 'add snake case suffixes'),
+        'add_camel_case_suffixes': doxpp.config.get_boolean(config, 'search', 'add camel case suffixes'),
+        'math_cache_file': os.path.join(directory, 'mathcache.json')
+    }
+    template_params = {
+        'PROJECT_NAME': 'Benchmark',
+        'PROJECT_BRIEF': '',
+        'PROJECT_VERSION': '',
+        'MAIN_PROJECT_URL': '',
+        'PROJECT_DOWNLOAD_URL': '',
+        'PROJECT_LOGO': '',
+        'THEME_COLOR': doxpp.config.get(config, 'html', 'theme color'),
+        'FAVICON': doxpp.config.get(config, 'html', 'favicon'),
+        'STYLESHEETS': [],
+        'HTML_HEADER': '',
+        'PAGE_HEADER': '',
+        'FINE_PRINT': doxpp.config.get(config, 'html', 'fine print'),
+        'LINKS_NAVBAR1': eval(doxpp.config.get(config, 'html', 'navigation bar 1')),
+        'LINKS_NAVBAR2': eval(doxpp.config.get(config, 'html', 'navigation bar 2')),
+        'FILE_INDEX_EXPAND_LEVELS': doxpp.config.get_int(config, 'html', 'file index expand levels'),
+        'CLASS_INDEX_EXPAND_LEVELS': doxpp.config.get_int(config, 'html', 'class index expand levels'),
+        'CLASS_INDEX_EXPAND_INNER': doxpp.config.get_boolean(config, 'html', 'class index expand inner'),
+        'SEARCH_DISABLED': False,
+        'SEARCH_DOWNLOAD_BINARY': False,
+        'SEARCH_BASE_URL': '',
+        'SEARCH_EXTERNAL_URL': ''
+    }
+    return options, template_params